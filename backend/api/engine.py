@@ -0,0 +1,82 @@
+"""Lazy loading of the compute engine (torch, Pillow, experiments).
+
+The HTTP layer imports nothing heavy, so /api/health and /api/templates
+answer as soon as the process starts. The engine is imported either by a
+background warm-up thread launched at startup or, if that has not finished
+yet, by the first WebSocket `start` action (which waits for it off the
+event loop).
+
+With several server workers, set NEUROFLOW_TOPOLOGY_DIR (e.g. a directory
+under /dev/shm) so they map one copy of each compiled topology instead of
+compiling and holding their own. NEUROFLOW_GLYPH_CACHE_DIR keeps the
+pre-rendered input glyphs on disk, so restarted workers skip rendering them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from experiments.experiment import Experiment
+
+logger = logging.getLogger(__name__)
+
+_load_lock = threading.Lock()
+_warm = threading.Event()
+_warm_thread: threading.Thread | None = None
+
+
+def engine_state() -> str:
+    """'warm' once the engine is imported, 'loading' while warming, else 'cold'."""
+    if _warm.is_set():
+        return "warm"
+    if _warm_thread is not None and _warm_thread.is_alive():
+        return "loading"
+    return "cold"
+
+
+def load_engine() -> type[Experiment]:
+    """Import the experiment stack (once) and return the Experiment class."""
+    with _load_lock:
+        start = time.perf_counter()
+        from experiments.experiment import Experiment
+
+        if not _warm.is_set():
+            _configure_storage()
+            _warm.set()
+            logger.info("Engine loaded in %.0f ms", (time.perf_counter() - start) * 1000)
+        return Experiment
+
+
+def _configure_storage() -> None:
+    """Point the engine's shared on-disk caches at the configured directories."""
+    directorio = os.environ.get("NEUROFLOW_TOPOLOGY_DIR")
+    if directorio:
+        from core.topology_registry import configurar_directorio
+
+        configurar_directorio(directorio)
+    glyph_dir = os.environ.get("NEUROFLOW_GLYPH_CACHE_DIR")
+    if glyph_dir:
+        from core.ascii_renderer import configure_glyph_cache
+
+        configure_glyph_cache(glyph_dir)
+
+
+def _warm_up() -> None:
+    load_engine()
+    from core.ascii_renderer import warm_glyph_cache
+
+    warm_glyph_cache()
+
+
+def warm_engine_in_background() -> None:
+    """Start loading the engine (and pre-rendering glyphs) on a daemon thread."""
+    global _warm_thread
+    if _warm.is_set() or (_warm_thread is not None and _warm_thread.is_alive()):
+        return
+    _warm_thread = threading.Thread(target=_warm_up, name="engine-warmup", daemon=True)
+    _warm_thread.start()
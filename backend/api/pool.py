@@ -0,0 +1,246 @@
+"""Pool of pre-built experiments for the config templates.
+
+A `start` pays the full setup (wiring, compile, glyph renders) before the
+first frame. With NEUROFLOW_POOL_SIZE > 0 the server keeps up to that many
+set-up, never-stepped Experiments per template of api.routes.TEMPLATES,
+built by a background thread at startup and refilled after each checkout.
+A `start` whose config is a template's, apart from the seed the client
+adds, takes one from the pool instead of building it, and the requested
+seed is applied with reset(seed). Templates whose seed also shapes the
+topology (sampled input density) cannot be reseeded that way and are not
+pooled. NEUROFLOW_POOL_MAX_MB caps the memory held by idle
+instances, engines included (topology tensors shared through the registry
+are not counted).
+
+Nothing heavy is imported here: the pool thread loads the engine itself.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from api.engine import load_engine
+
+if TYPE_CHECKING:
+    from experiments.experiment import Experiment
+
+logger = logging.getLogger(__name__)
+
+
+def _config_key(config: dict) -> str:
+    """Canonical hash of a config without its seed (key order and whitespace do not matter)."""
+    unseeded = {k: v for k, v in config.items() if k != "seed"}
+    canonical = json.dumps(unseeded, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+# Experiment attributes holding engine objects with tensors of their own
+_ENGINES = ("_fused_step", "_fft_engine", "_tiled_engine", "_wolfram_engine", "_input_schedule", "_dataset")
+
+
+def _experiment_bytes(experiment: Experiment) -> int:
+    """Bytes of tensors owned by an experiment and its engines (registry tensors excluded).
+
+    Walks the experiment, its BrainTensor and the engine objects, following
+    attributes, lists, tuples and dicts into other core/experiments objects
+    (a TiledEngine's tiles, a FusedStep's learning coefficients, ...).
+    Storages are counted once, so views of the network are free.
+    """
+    import torch
+
+    from core.topology_registry import compartidos
+
+    bt = experiment.brain_tensor
+    # Storage pointers already counted, or shared through the registry
+    seen = {t.untyped_storage().data_ptr() for t in compartidos(bt)} if bt is not None else set()
+    visited: set[int] = set()
+    total = 0
+    stack: list[Any] = [experiment, bt, *(getattr(experiment, name, None) for name in _ENGINES)]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        if isinstance(obj, torch.Tensor):
+            storage = obj.untyped_storage()
+            if storage.data_ptr() not in seen:
+                seen.add(storage.data_ptr())
+                total += storage.nbytes()
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif type(obj).__module__.startswith(("core.", "experiments.")) and hasattr(obj, "__dict__"):
+            stack.extend(vars(obj).values())
+    return total
+
+
+class ExperimentPool:
+    """Idle, set-up Experiments per template, refilled on a background thread."""
+
+    def __init__(self, size: int, max_bytes: int | None = None) -> None:
+        """
+        Args:
+            size: Instances kept per template.
+            max_bytes: Memory budget for all idle instances (None = no limit).
+        """
+        self.size = size
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._idle: dict[str, deque[tuple[Experiment, int]]] = {}
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        # Templates whose setup depends on the seed beyond reset()
+        self._unpoolable: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def start(self) -> None:
+        """Fill the pool on a daemon thread (and refill it after each take)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="experiment-pool", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def take(self, config: dict) -> Experiment | None:
+        """An idle experiment in the state setup(config) would leave, or None.
+
+        The pooled instance is reset to the config's seed when it has one.
+        """
+        with self._lock:
+            idle = self._idle.get(_config_key(config))
+            experiment = idle.popleft()[0] if idle else None
+            if experiment is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if experiment is not None:
+            self._wake.set()
+            seed = config.get("seed")
+            if seed is not None and seed != experiment.seed:
+                experiment.reset(seed=seed)
+        return experiment
+
+    def fill(self) -> None:
+        """Build missing instances, one per template per round, within the budget.
+
+        Instances of templates that are gone (or changed) are discarded.
+        """
+        from api import routes
+
+        templates = {_config_key(t["config"]): t for t in routes.TEMPLATES}
+        with self._lock:
+            stale = [key for key in self._idle if key not in templates]
+            discarded = [exp for key in stale for exp, _ in self._idle.pop(key)]
+        for experiment in discarded:
+            experiment.close()
+
+        skipped: set[str] = set()
+        experiment_cls = load_engine()
+        while not self._closed:
+            with self._lock:
+                used = sum(nbytes for idle in self._idle.values() for _, nbytes in idle)
+                missing = [
+                    key for key in templates
+                    if key not in skipped and key not in self._unpoolable
+                    and len(self._idle.get(key, ())) < self.size
+                ]
+            if not missing:
+                return
+            for key in missing:
+                if self._closed:
+                    return
+                experiment = experiment_cls()
+                try:
+                    experiment.setup(copy.deepcopy(templates[key]["config"]))
+                except Exception:
+                    logger.exception("Could not pre-build template '%s'", templates[key]["id"])
+                    skipped.add(key)
+                    continue
+                if not experiment.reset_replays_setup():
+                    logger.info("Template '%s' depends on the seed beyond reset(), not pooled", templates[key]["id"])
+                    experiment.close()
+                    self._unpoolable.add(key)
+                    continue
+                nbytes = _experiment_bytes(experiment)
+                if self.max_bytes is not None and used + nbytes > self.max_bytes:
+                    experiment.close()
+                    skipped.add(key)
+                    continue
+                used += nbytes
+                with self._lock:
+                    if not self._closed:
+                        self._idle.setdefault(key, deque()).append((experiment, nbytes))
+                if self._closed:
+                    experiment.close()
+
+    def stats(self) -> dict[str, int]:
+        """Idle instances, their bytes, and start hits/misses."""
+        with self._lock:
+            return {
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "bytes": sum(nbytes for idle in self._idle.values() for _, nbytes in idle),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def close(self) -> None:
+        """Stop refilling and close every idle instance."""
+        self._closed = True
+        self._wake.set()
+        with self._lock:
+            idle = [exp for queue in self._idle.values() for exp, _ in queue]
+            self._idle.clear()
+        for experiment in idle:
+            experiment.close()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.fill()
+            except Exception:
+                logger.exception("Experiment pool refill failed")
+
+
+_pool: ExperimentPool | None = None
+
+
+def start_experiment_pool() -> ExperimentPool | None:
+    """Start the pool if NEUROFLOW_POOL_SIZE > 0 (NEUROFLOW_POOL_MAX_MB caps it)."""
+    global _pool
+    size = int(os.environ.get("NEUROFLOW_POOL_SIZE", "0") or 0)
+    if _pool is None and size > 0:
+        max_mb = os.environ.get("NEUROFLOW_POOL_MAX_MB")
+        _pool = ExperimentPool(size, int(float(max_mb) * (1 << 20)) if max_mb else None)
+        _pool.start()
+    return _pool
+
+
+def refill_experiment_pool() -> None:
+    """Rebuild the pool against the current templates (e.g. after a refresh)."""
+    if _pool is not None:
+        _pool.start()
+
+
+def take_experiment(config: dict[str, Any]) -> Experiment | None:
+    """A pre-built experiment for this config (any seed), if the pool has one."""
+    return _pool.take(config) if _pool is not None else None
+
+
+def stop_experiment_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
-from core.masks import get_mask_info, preview_deamon_wiring
-from core.ascii_renderer import get_available_fonts
-from db import save_config, get_latest, get_history
+from api.engine import engine_state
+from api.pool import refill_experiment_pool
+from db import HISTORY_PAGE_SIZE, save_config, get_latest, get_history
 
 router = APIRouter(prefix="/api")
 
@@ -40,12 +45,68 @@ def _load_templates() -> list[dict]:
 TEMPLATES: list[dict] = _load_templates()
 
 
+# ── Cached responses ──
+
+_PREVIEW_CACHE_SIZE = 256
+_preview_cache: OrderedDict[str, bytes] = OrderedDict()
+
+
+def _dump_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=1)
+def _metadata_payload() -> tuple[bytes, str]:
+    """Serialized /api/metadata body and its ETag (computed once per process)."""
+    # Imported here so the HTTP layer starts without numpy/Pillow
+    from core.ascii_renderer import get_available_fonts
+    from core.masks import get_mask_info
+
+    body = _dump_json({
+        "masks": get_mask_info(),
+        "fonts": get_available_fonts(),
+        "process_modes": [
+            {"id": "min_vs_max", "name": "Min vs Max", "description": "Best excitatory vs best inhibitory"},
+            {"id": "avg_vs_avg", "name": "Avg vs Avg", "description": "Average excitatory vs average inhibitory"},
+            {"id": "avg_vs_avg_normalized", "name": "Avg vs Avg (Norm)", "description": "Ratio exc/inh — only balance matters, not absolute scale"},
+            {"id": "sum", "name": "Sum", "description": "All dendrites summed and clamped"},
+        ],
+        "input_sources": [
+            {"id": "ascii", "name": "ASCII Images"},
+            {"id": "dataset", "name": "Image Dataset (.npy / raw uint8)"},
+        ],
+    })
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _wiring_key(wiring: dict) -> str:
+    """Canonical hash of a wiring dict (key order and whitespace do not matter)."""
+    canonical = json.dumps(wiring, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+def _preview_payload(wiring: dict) -> bytes:
+    """Serialized preview for an inline wiring, from an LRU keyed by _wiring_key."""
+    key = _wiring_key(wiring)
+    body = _preview_cache.get(key)
+    if body is not None:
+        _preview_cache.move_to_end(key)
+        return body
+    from core.masks import preview_deamon_wiring
+
+    body = _dump_json(preview_deamon_wiring(wiring))
+    _preview_cache[key] = body
+    if len(_preview_cache) > _PREVIEW_CACHE_SIZE:
+        _preview_cache.popitem(last=False)
+    return body
+
+
 # ── Endpoints ──
 
 @router.get("/health")
 async def health() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "ok", "version": "0.2.0"}
+    """Health check endpoint. `engine` is 'warm' once the compute stack is loaded."""
+    return {"status": "ok", "version": "0.2.0", "engine": engine_state()}
 
 
 @router.get("/templates")
@@ -59,6 +120,7 @@ async def refresh_templates() -> list[dict]:
     """Re-read all JSON files from configs/ and update the in-memory TEMPLATES list."""
     global TEMPLATES
     TEMPLATES = _load_templates()
+    refill_experiment_pool()
     return TEMPLATES
 
 
@@ -72,21 +134,13 @@ async def get_template(template_id: str) -> dict:
 
 
 @router.get("/metadata")
-async def get_metadata() -> dict:
+async def get_metadata(request: Request) -> Response:
     """Return available masks, fonts, process modes, and input sources."""
-    return {
-        "masks": get_mask_info(),
-        "fonts": get_available_fonts(),
-        "process_modes": [
-            {"id": "min_vs_max", "name": "Min vs Max", "description": "Best excitatory vs best inhibitory"},
-            {"id": "avg_vs_avg", "name": "Avg vs Avg", "description": "Average excitatory vs average inhibitory"},
-            {"id": "avg_vs_avg_normalized", "name": "Avg vs Avg (Norm)", "description": "Ratio exc/inh — only balance matters, not absolute scale"},
-            {"id": "sum", "name": "Sum", "description": "All dendrites summed and clamped"},
-        ],
-        "input_sources": [
-            {"id": "ascii", "name": "ASCII Images"},
-        ],
-    }
+    body, etag = _metadata_payload()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @router.post("/templates/{template_id}/config")
@@ -95,15 +149,15 @@ async def save_template_config(
 ) -> dict:
     """Persist a config snapshot for a template+preset."""
     config = await request.json()
-    sid = save_config(template_id, preset, config)
+    sid = await asyncio.to_thread(save_config, template_id, preset, config)
     return {"id": sid}
 
 
 @router.post("/preview-wiring")
-async def preview_wiring(request: Request) -> dict:
+async def preview_wiring(request: Request) -> Response:
     """Compute preview_grid and mask_stats for an inline deamon wiring definition."""
     wiring = await request.json()
-    return preview_deamon_wiring(wiring)
+    return Response(_preview_payload(wiring), media_type="application/json")
 
 
 @router.get("/templates/{template_id}/config/latest")
@@ -114,6 +168,15 @@ def get_latest_config(template_id: str, preset: str = "_default") -> dict:
 
 
 @router.get("/templates/{template_id}/config/history")
-def get_config_history(template_id: str, preset: str = "_default") -> dict:
-    """All executed configs for a template+preset, oldest first."""
-    return {"history": get_history(template_id, preset)}
+def get_config_history(
+    template_id: str,
+    preset: str = "_default",
+    before: int | None = None,
+    limit: int = HISTORY_PAGE_SIZE,
+) -> dict:
+    """Executed configs for a template+preset, oldest first, newest page by default.
+
+    Pass `next_before` from the response as `before` to fetch older runs.
+    """
+    history, next_before = get_history(template_id, preset, before=before, limit=limit)
+    return {"history": history, "next_before": next_before}
@@ -0,0 +1,105 @@
+"""Cross-session batching of play-loop ticks.
+
+Every playing session ticks on its own: step_n(steps_per_tick), then a
+frame. When many sessions run the same template, BatchScheduler collects
+the ticks requested within one scheduling quantum and, at the end of it,
+advances each group of sessions with the same Experiment.batch_key() and
+steps per tick in one batched step (Experiment.run_batched). Ticks that
+cannot be batched run alone in the same flush.
+
+Fairness: a flush serves every tick queued before it, in arrival order
+of each group's first tick, so no tick waits more than one quantum before
+it runs. Enabled with NEUROFLOW_BATCH_QUANTUM_MS > 0; otherwise sessions
+step directly, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from experiments.experiment import Experiment
+
+
+class BatchScheduler:
+    """Groups ticks of concurrent sessions into batched steps, once per quantum."""
+
+    def __init__(self, quantum: float) -> None:
+        """
+        Args:
+            quantum: Seconds ticks are collected before they run.
+        """
+        self.quantum = quantum
+        self._pending: list[tuple[Experiment, int, asyncio.Future]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self.flushes = 0
+        self.batched_ticks = 0
+
+    async def step_n(self, experiment: Experiment, count: int) -> tuple[dict[str, Any], float]:
+        """Run count steps in the next flush; returns (step_n result, seconds spent stepping)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A new event loop (tests, server restart): nothing pending survives
+            self._loop, self._pending, self._handle = loop, [], None
+        future = loop.create_future()
+        self._pending.append((experiment, count, future))
+        if self._handle is None:
+            self._handle = loop.call_later(self.quantum, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        pending, self._pending, self._handle = self._pending, [], None
+        self.flushes += 1
+        groups: dict[Any, list[tuple[Experiment, int, asyncio.Future]]] = {}
+        for tick in pending:
+            experiment, count, future = tick
+            if future.done():  # cancelled: the session paused or closed
+                continue
+            key = experiment.batch_key()
+            group = groups.setdefault((key, count) if key is not None else id(tick), [])
+            if any(e is experiment for e, _, _ in group):
+                group = groups.setdefault(id(tick), [])
+            group.append(tick)
+
+        for group in groups.values():
+            t0 = time.perf_counter()
+            try:
+                if len(group) > 1:
+                    from experiments.experiment import Experiment
+
+                    experiments = [e for e, _, _ in group]
+                    Experiment.run_batched(experiments, group[0][1])
+                    self.batched_ticks += len(group)
+                    results = [
+                        {"type": "status", "state": "complete"} if e.is_complete() else {}
+                        for e in experiments
+                    ]
+                else:
+                    experiment, count, _ = group[0]
+                    results = [experiment.step_n(count)]
+            except Exception as e:
+                for _, _, future in group:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - t0
+            for (_, _, future), result in zip(group, results):
+                future.set_result((result, elapsed))
+
+
+_scheduler: BatchScheduler | None = None
+_configured = False
+
+
+def get_scheduler() -> BatchScheduler | None:
+    """The process scheduler if NEUROFLOW_BATCH_QUANTUM_MS > 0, else None."""
+    global _scheduler, _configured
+    if not _configured:
+        _configured = True
+        quantum_ms = float(os.environ.get("NEUROFLOW_BATCH_QUANTUM_MS", "0") or 0)
+        if quantum_ms > 0:
+            _scheduler = BatchScheduler(quantum_ms / 1000)
+    return _scheduler
@@ -6,11 +6,16 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from experiments.experiment import Experiment
+from api.engine import load_engine
+from api.pool import take_experiment
+from api.scheduler import get_scheduler
+
+if TYPE_CHECKING:
+    from experiments.experiment import Experiment
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +35,22 @@ class ExperimentSession:
         self._inspect_x: int | None = None
         self._inspect_y: int | None = None
 
+        # Frame delivery: latest-frame-wins slot drained by a sender task,
+        # so a slow client never throttles stepping.
+        self._send_lock = asyncio.Lock()
+        self._frame_pending: tuple[int | None, float | None] | None = None
+        self._frame_ready = asyncio.Event()
+        self._sender_task: asyncio.Task | None = None
+        self.frames_sent: int = 0
+        self.frames_skipped: int = 0
+
     async def send(self, data: dict[str, Any]) -> None:
-        """Send JSON data to the client."""
-        await self.ws.send_json(data)
+        """Send JSON data to the client.
+
+        Serialized with the frame sender so messages never interleave.
+        """
+        async with self._send_lock:
+            await self.ws.send_json(data)
 
     async def handle_message(self, message: dict[str, Any]) -> None:
         """Route incoming messages to the appropriate handler."""
@@ -74,8 +92,15 @@ class ExperimentSession:
         await self.send({"type": "status", "state": "initializing"})
         await asyncio.sleep(0)
 
-        self.experiment = Experiment()
-        self.experiment.setup(config)
+        if self.experiment is not None:
+            self.experiment.close()
+        # An unmodified template comes ready from the pool
+        self.experiment = take_experiment(config)
+        if self.experiment is None:
+            # First start may still be importing torch: wait off the event loop
+            experiment_cls = await asyncio.to_thread(load_engine)
+            self.experiment = experiment_cls()
+            self.experiment.setup(config)
 
         await self.send({"type": "status", "state": "ready"})
         await self._send_frame()
@@ -99,15 +124,8 @@ class ExperimentSession:
         cells: list[dict[str, int]] = message.get("cells", [])
         value: float = message.get("value", 1.0)
 
-        brain_tensor = self.experiment.brain_tensor
-        if brain_tensor:
-            w = self.experiment.width
-            for cell in cells:
-                x = cell.get("x", 0)
-                y = cell.get("y", 0)
-                idx = y * w + x
-                if 0 <= x < w and 0 <= y < self.experiment.height and 0 <= idx < brain_tensor.n_real:
-                    brain_tensor.set_valor(idx, value)
+        for cell in cells:
+            self.experiment.set_cell(cell.get("x", 0), cell.get("y", 0), value)
         await self._send_frame()
 
     async def _stop_play_loop(self) -> None:
@@ -222,8 +240,8 @@ class ExperimentSession:
             await self.send({"type": "status", "state": "running"})
             self._play_task = asyncio.create_task(self._play_loop())
 
-    async def _handle_reset(self, _message: dict[str, Any]) -> None:
-        """Reset the experiment."""
+    async def _handle_reset(self, message: dict[str, Any]) -> None:
+        """Reset the experiment (optional "seed" makes the new state reproducible)."""
         if not self.experiment:
             await self.send({"type": "error", "message": "No experiment started"})
             return
@@ -235,17 +253,22 @@ class ExperimentSession:
         await self.send({"type": "status", "state": "initializing"})
         await asyncio.sleep(0)
 
-        self.experiment.reset()
+        self.experiment.reset(seed=message.get("seed"))
         await self.send({"type": "status", "state": "ready"})
         await self._send_frame()
 
     async def _play_loop(self) -> None:
         """Continuously process and send frames."""
         try:
+            scheduler = get_scheduler()
             while self._playing and self.experiment:
-                t0 = time.perf_counter()
-                result = self.experiment.step_n(self.steps_per_tick)
-                elapsed = time.perf_counter() - t0
+                if scheduler is not None:
+                    # Batched with other sessions' ticks (elapsed: time spent stepping)
+                    result, elapsed = await scheduler.step_n(self.experiment, self.steps_per_tick)
+                else:
+                    t0 = time.perf_counter()
+                    result = self.experiment.step_n(self.steps_per_tick)
+                    elapsed = time.perf_counter() - t0
 
                 if result.get("type") == "status" and result.get("state") == "complete":
                     await self.send(result)
@@ -264,10 +287,56 @@ class ExperimentSession:
         steps: int | None = None,
         elapsed_s: float | None = None,
     ) -> None:
-        """Send the current frame to the client."""
+        """Publish the current frame to the client without waiting for delivery.
+
+        Only the newest frame is kept: if the previous one has not been sent
+        yet it is replaced and counted in frames_skipped. The message itself
+        is built by the sender task right before it goes out.
+        """
         if not self.experiment:
             return
 
+        if self._frame_pending is not None:
+            self.frames_skipped += 1
+        self._frame_pending = (steps, elapsed_s)
+        self._frame_ready.set()
+
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
+    async def _sender_loop(self) -> None:
+        """Drain the frame slot, sending the latest frame whenever the socket is free."""
+        try:
+            while True:
+                await self._frame_ready.wait()
+                self._frame_ready.clear()
+                pending = self._frame_pending
+                self._frame_pending = None
+                if pending is None or not self.experiment:
+                    continue
+
+                try:
+                    msg = self._build_frame(*pending)
+                except Exception as e:
+                    logger.exception("Error building frame")
+                    await self.send({"type": "error", "message": f"{type(e).__name__}: {e}"})
+                    continue
+
+                await self.send(msg)
+                self.frames_sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Error in frame sender")
+
+    def _build_frame(
+        self,
+        steps: int | None = None,
+        elapsed_s: float | None = None,
+    ) -> dict[str, Any]:
+        """Build the frame message from the current experiment state."""
+        assert self.experiment is not None
+
         frame = self.experiment.get_frame()
         stats = self.experiment.get_stats()
         tension_frame = self.experiment.get_tension_frame()
@@ -279,6 +348,10 @@ class ExperimentSession:
             "generation": self.experiment.generation,
             "grid": grid,
             "stats": stats,
+            "delivery": {
+                "frames_sent": self.frames_sent + 1,
+                "frames_skipped": self.frames_skipped,
+            },
         }
 
         if tension_frame is not None:
@@ -305,13 +378,22 @@ class ExperimentSession:
             )
             msg["inspect"] = inspect_data
 
-        await self.send(msg)
+        return msg
 
     def cleanup(self) -> None:
         """Cleanup on disconnect."""
         self._playing = False
         if self._play_task and not self._play_task.done():
             self._play_task.cancel()
+        if self._sender_task and not self._sender_task.done():
+            self._sender_task.cancel()
+        if self.experiment is not None:
+            self.experiment.close()
+        if self.frames_skipped:
+            logger.info(
+                "Session closed: %d frames sent, %d skipped",
+                self.frames_sent, self.frames_skipped,
+            )
 
 
 @ws_router.websocket("/ws/experiment")
@@ -0,0 +1,115 @@
+"""Accuracy and memory of compact storage against the float32 path.
+
+Compact storage (config section "compact") keeps weights in float16 or
+bfloat16 and indices/counters in narrow integer dtypes, while procesar()
+and learn() accumulate in float32. This check runs the same seeded
+experiment both ways and reports:
+
+  - storage: bytes held by the network tensors in each mode;
+  - step agreement: fraction of tissue cells whose next value matches the
+    float32 path when both start each step from the same state (the error
+    a single step introduces);
+  - max tension error over those steps;
+  - free-run agreement: cells matching after running both independently
+    (errors compound, and the dynamics may diverge chaotically).
+
+It fails when the step agreement drops below its threshold.
+
+Usage (from backend/):
+    python benchmarks/compact_accuracy.py [--size 60] [--steps 50] [--weights float16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import torch  # noqa: E402
+
+from experiments.experiment import Experiment  # noqa: E402
+
+# Minimum fraction of cells a single compact step must get right.
+_STEP_AGREEMENT = {"float16": 0.999, "bfloat16": 0.99}
+
+
+def _config(size: int, seed: int, compact: dict[str, Any] | None) -> dict[str, Any]:
+    config: dict[str, Any] = {
+        "seed": seed,
+        "grid": {"width": size, "height": size},
+        "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"},
+        "input": {"resolution": 10, "text": "AB", "density": 0.5},
+        "learning": {"rate": 0.05},
+    }
+    if compact is not None:
+        config["compact"] = compact
+    return config
+
+
+def measure(size: int = 60, steps: int = 50, weights: str = "float16", seed: int = 0) -> dict[str, float]:
+    """Run both paths on the same seed → storage and accuracy figures."""
+    reference = Experiment()
+    reference.setup(_config(size, seed, None))
+    compact = Experiment()
+    compact.setup(_config(size, seed, {"weights": weights}))
+    n_tissue = size * size
+
+    agree = 0.0
+    max_tension_err = 0.0
+    for _ in range(steps):
+        ref_bt, cmp_bt = reference.brain_tensor, compact.brain_tensor
+        cmp_bt.valores.copy_(ref_bt.valores)
+        cmp_bt.pesos_sinapsis = ref_bt.pesos_sinapsis.to(cmp_bt.weight_dtype)
+        reference.step()
+        compact.step()
+        agree += (ref_bt.valores[:n_tissue] == cmp_bt.valores[:n_tissue]).float().mean().item()
+        err = (ref_bt.tensiones[:n_tissue] - cmp_bt.tensiones[:n_tissue]).abs().max().item()
+        max_tension_err = max(max_tension_err, err)
+
+    free_ref = Experiment()
+    free_ref.setup(_config(size, seed, None))
+    free_cmp = Experiment()
+    free_cmp.setup(_config(size, seed, {"weights": weights}))
+    free_ref.step_n(steps)
+    free_cmp.step_n(steps)
+    free_agree = (
+        free_ref.brain_tensor.valores[:n_tissue] == free_cmp.brain_tensor.valores[:n_tissue]
+    ).float().mean().item()
+
+    return {
+        "float32_bytes": reference.brain_tensor.storage_bytes(),
+        "compact_bytes": compact.brain_tensor.storage_bytes(),
+        "step_agreement": agree / steps,
+        "max_tension_error": max_tension_err,
+        "free_run_agreement": free_agree,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=60, help="grid width and height")
+    parser.add_argument("--steps", type=int, default=50, help="steps to compare")
+    parser.add_argument("--weights", choices=sorted(_STEP_AGREEMENT), default="float16")
+    args = parser.parse_args()
+
+    torch.set_grad_enabled(False)
+    r = measure(args.size, args.steps, args.weights)
+    mib = 1024 * 1024
+    print(f"storage: float32 {r['float32_bytes'] / mib:.1f} MiB, "
+          f"compact/{args.weights} {r['compact_bytes'] / mib:.1f} MiB "
+          f"({r['compact_bytes'] / r['float32_bytes']:.0%})")
+    print(f"step agreement: {r['step_agreement']:.4%}  max tension error: {r['max_tension_error']:.2e}")
+    print(f"free-run agreement after {args.steps} steps: {r['free_run_agreement']:.2%}")
+
+    threshold = _STEP_AGREEMENT[args.weights]
+    if r["step_agreement"] < threshold:
+        print(f"BELOW THRESHOLD: step agreement {r['step_agreement']:.4%} < {threshold:.1%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
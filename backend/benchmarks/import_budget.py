@@ -0,0 +1,95 @@
+"""Import-time budget for the backend cold start.
+
+Render's free tier spins instances down when idle, so every visit after a
+pause pays for `uvicorn main:app` importing the whole backend. This check
+imports `main` in fresh interpreters with `python -X importtime`, reports
+the slowest modules, and fails when the total cold start or the self time
+of any backend module exceeds its budget, or when the compute stack
+(torch, Pillow, numpy) is imported before the first experiment starts.
+
+Usage (from backend/):
+    python benchmarks/import_budget.py [--runs 3] [--total-ms 1500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Whole `import main`, third-party packages included (fastapi dominates).
+_TOTAL_BUDGET_MS = 1500.0
+
+# Loaded by api.engine after startup, never by `import main`.
+_DEFERRED_MODULES = ("torch", "PIL", "numpy")
+
+# Self time of modules that belong to this repo.
+_MODULE_BUDGET_MS = 50.0
+_MODULE_BUDGETS_MS: dict[str, float] = {
+    "core.masks": 20.0,
+}
+_BACKEND_PACKAGES = ("api", "core", "experiments", "db", "main")
+
+
+def measure(module: str = "main") -> dict[str, tuple[float, float]]:
+    """Import `module` in a fresh interpreter → {name: (self_ms, cumulative_ms)}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[float, float]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us) / 1000.0, int(cumulative_us) / 1000.0)
+    return times
+
+
+def _is_backend(name: str) -> bool:
+    return name.split(".")[0] in _BACKEND_PACKAGES
+
+
+def check(runs: int, total_budget_ms: float) -> list[str]:
+    """Measure `runs` cold starts (keeping the fastest) → list of budget violations."""
+    samples = [measure() for _ in range(runs)]
+    best = min(samples, key=lambda t: t["main"][1])
+
+    total_ms = best["main"][1]
+    print(f"import main: {total_ms:.1f} ms (budget {total_budget_ms:.0f} ms, best of {runs})")
+    print("slowest modules (cumulative ms):")
+    for name, (_, cumulative) in sorted(best.items(), key=lambda kv: -kv[1][1])[:10]:
+        print(f"  {cumulative:9.1f}  {name}")
+
+    failures = [f"{name} imported at startup" for name in _DEFERRED_MODULES if name in best]
+    if total_ms > total_budget_ms:
+        failures.append(f"import main took {total_ms:.1f} ms > {total_budget_ms:.0f} ms")
+    for name, (self_ms, _) in sorted(best.items()):
+        if not _is_backend(name):
+            continue
+        budget = _MODULE_BUDGETS_MS.get(name, _MODULE_BUDGET_MS)
+        if self_ms > budget:
+            failures.append(f"{name} self time {self_ms:.1f} ms > {budget:.0f} ms")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="cold starts to measure")
+    parser.add_argument("--total-ms", type=float, default=_TOTAL_BUDGET_MS, help="budget for import main")
+    args = parser.parse_args()
+
+    failures = check(args.runs, args.total_ms)
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
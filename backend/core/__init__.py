@@ -1,22 +1,40 @@
-"""NeuroFlow core neural model."""
-
-from .sinapsis import Sinapsis
-from .dendrita import Dendrita
-from .neurona import Neurona, NeuronaEntrada
-from .brain import Brain
-from .region import Region
-from .constructor import Constructor
-from .brain_tensor import BrainTensor
-from .constructor_tensor import ConstructorTensor
-
-__all__ = [
-    "Sinapsis",
-    "Dendrita",
-    "Neurona",
-    "NeuronaEntrada",
-    "Brain",
-    "Region",
-    "Constructor",
-    "BrainTensor",
-    "ConstructorTensor",
-]
+"""NeuroFlow core neural model.
+
+Classes are imported on first attribute access, so importing a light
+submodule (e.g. ``core.masks``) does not pull in torch.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sinapsis import Sinapsis
+    from .dendrita import Dendrita
+    from .neurona import Neurona, NeuronaEntrada
+    from .brain import Brain
+    from .region import Region
+    from .constructor import Constructor
+    from .brain_tensor import BrainTensor
+    from .constructor_tensor import ConstructorTensor
+
+_EXPORTS: dict[str, str] = {
+    "Sinapsis": ".sinapsis",
+    "Dendrita": ".dendrita",
+    "Neurona": ".neurona",
+    "NeuronaEntrada": ".neurona",
+    "Brain": ".brain",
+    "Region": ".region",
+    "Constructor": ".constructor",
+    "BrainTensor": ".brain_tensor",
+    "ConstructorTensor": ".constructor_tensor",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
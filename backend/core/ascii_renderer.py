@@ -7,11 +7,18 @@ with configurable size. Designed for low-resolution grids (10x10 and up).
 Bundled fonts (OFL licensed):
   - Press Start 2P: pixel font from 1980s arcade games, best at 8pt
   - Silkscreen: pixel font designed for small screen rendering
+
+Rendered glyphs are cached process-wide (shared by all sessions, least
+recently used evicted beyond _GLYPH_CACHE_SIZE) and, once
+configure_glyph_cache() sets a directory, the warm-up set on disk as well.
 """
 
 from __future__ import annotations
 
 import os
+import string
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
 
@@ -29,6 +36,9 @@ _RENDER_SCALE = 20
 _THRESHOLD = 0.35
 _DEFAULT_NOISE_PROB = 0.15
 
+_WARM_CHARS = string.printable[:95]  # digits, letters, punctuation, space
+_WARM_RESOLUTIONS = (10, 20)
+
 # ── Font registry ──────────────────────────────────────────────────────
 # Each entry: (display_name, path_or_None, recommended_sizes, description)
 # path=None means system font or PIL default.
@@ -133,6 +143,67 @@ def _load_font(font_id: str, size: int) -> ImageFont.FreeTypeFont | ImageFont.Im
         return ImageFont.load_default()
 
 
+# ── Glyph cache ────────────────────────────────────────────────────────
+# (char, resolution, font_id, padding) → read-only (resolution, resolution) array
+# Keys come from client configs, so the cache is an LRU: room for the warm-up
+# set in a few fonts plus whatever sessions currently display.
+
+_GLYPH_CACHE_SIZE = 2048
+_glyph_cache: OrderedDict[tuple[str, int, str, int], np.ndarray] = OrderedDict()
+_glyph_cache_lock = threading.Lock()
+_glyph_cache_dir: Path | None = None
+
+
+def configure_glyph_cache(cache_dir: str | Path | None) -> None:
+    """Persist rendered glyphs under cache_dir (None = memory only)."""
+    global _glyph_cache_dir
+    _glyph_cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+
+def clear_glyph_cache() -> None:
+    """Drop all in-memory glyphs (the on-disk cache is left untouched)."""
+    with _glyph_cache_lock:
+        _glyph_cache.clear()
+
+
+def _glyph_disk_path(cache_dir: Path, key: tuple[str, int, str, int]) -> Path:
+    char, resolution, font_id, padding = key
+    # Render parameters are part of the path so a change never serves stale glyphs
+    group = f"{font_id}_r{resolution}_p{padding}_s{_RENDER_SCALE}_t{_THRESHOLD}"
+    return cache_dir / group / f"{ord(char):05x}.npy"
+
+
+def _load_glyph(key: tuple[str, int, str, int]) -> np.ndarray:
+    """Read a glyph from the disk cache, or render it (and store it there).
+
+    Only the warm-up set (printable ASCII at _WARM_RESOLUTIONS) goes to
+    disk; other characters and resolutions are rendered on demand.
+    """
+    cache_dir = _glyph_cache_dir
+    path = None
+    if cache_dir is not None and key[0] in _WARM_CHARS and key[1] in _WARM_RESOLUTIONS:
+        path = _glyph_disk_path(cache_dir, key)
+    if path is not None and path.is_file():
+        try:
+            return np.load(path)
+        except (OSError, ValueError):
+            pass  # Corrupt or partial file: render again
+
+    char, resolution, font_id, padding = key
+    glyph = _render_glyph(char, resolution, font_id, padding)
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, glyph)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Disk cache is best-effort
+    return glyph
+
+
 def render_char(
     char: str,
     resolution: int = 10,
@@ -140,13 +211,10 @@ def render_char(
     font_size: int = 8,
     padding: int = 0,
 ) -> np.ndarray:
-    """Render a single character as a binary pixel grid.
-
-    Auto-fits the glyph to fill the resolution grid: renders at high
-    resolution, crops to the tight glyph bounding box, then scales to fit
-    within (resolution - 2*padding) pixels and centers the result.
+    """Render a single character as a binary pixel grid (cached).
 
-    With padding=0 (default) uppercase letters reach the edge of the grid.
+    Glyphs are shared across sessions: the returned array is read-only,
+    copy it before modifying. See _render_glyph for the rendering itself.
 
     Args:
         char: Single character to render.
@@ -156,7 +224,54 @@ def render_char(
         padding: Margin in output pixels on each side (0 = fill to edge).
 
     Returns:
-        Binary numpy array of shape (resolution, resolution) with 0.0/1.0.
+        Read-only binary numpy array of shape (resolution, resolution) with 0.0/1.0.
+    """
+    key = (char, resolution, font_id, padding)
+    with _glyph_cache_lock:
+        glyph = _glyph_cache.get(key)
+        if glyph is not None:
+            _glyph_cache.move_to_end(key)
+            return glyph
+
+    glyph = _load_glyph(key)
+    glyph.setflags(write=False)
+    with _glyph_cache_lock:
+        # Another thread may have rendered it meanwhile: keep the first one
+        glyph = _glyph_cache.setdefault(key, glyph)
+        _glyph_cache.move_to_end(key)
+        while len(_glyph_cache) > _GLYPH_CACHE_SIZE:
+            _glyph_cache.popitem(last=False)
+        return glyph
+
+
+def warm_glyph_cache(
+    resolutions: tuple[int, ...] = _WARM_RESOLUTIONS,
+    font_ids: tuple[str, ...] = ("press_start_2p",),
+    padding: int = 0,
+) -> int:
+    """Pre-render the printable ASCII set. Returns the number of glyphs cached."""
+    count = 0
+    for font_id in font_ids:
+        for resolution in resolutions:
+            for char in _WARM_CHARS:
+                render_char(char, resolution, font_id=font_id, padding=padding)
+                count += 1
+    return count
+
+
+def _render_glyph(
+    char: str,
+    resolution: int,
+    font_id: str,
+    padding: int,
+) -> np.ndarray:
+    """Render a single character as a binary pixel grid.
+
+    Auto-fits the glyph to fill the resolution grid: renders at high
+    resolution, crops to the tight glyph bounding box, then scales to fit
+    within (resolution - 2*padding) pixels and centers the result.
+
+    With padding=0 uppercase letters reach the edge of the grid.
     """
     render_px = resolution * _RENDER_SCALE
     # Use a large font to fill the high-res canvas, then crop tight
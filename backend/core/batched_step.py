@@ -0,0 +1,110 @@
+"""BatchedStep — one FusedStep for several networks that share a topology.
+
+Sessions started from the same template share their connectivity through
+the topology registry and differ only in state: values, synapse weights,
+tensions and adaptation counters. When their FusedSteps are specialized
+identically, BatchedStep stacks that state along a leading batch dimension
+
+    valores [B, N+1]   pesos [B, NR, max_syn]   counters [B, NR]
+
+and runs the specialized step function once per step for all of them (it
+broadcasts over leading dimensions), so B small kernels per operation
+become one large one. Results are written back into each BrainTensor and
+match B separate FusedStep runs exactly.
+
+Stacking copies the weights once per run(), so the gain comes from
+chaining several steps (or from launch-bound devices), not from a single
+step on a large CPU network. Compiled steps are not batched.
+"""
+
+from __future__ import annotations
+
+import torch
+
+from .fused_step import METRICA_ACTIVAS, METRICA_TENSION, FusedStep
+from .topology_registry import CAMPOS_TOPOLOGIA, es_compartido
+
+
+def clave_lote(paso: FusedStep) -> tuple | None:
+    """Steps with equal keys can run in one BatchedStep; None if this one cannot.
+
+    The network must use a registered topology (every field still shared)
+    and an eager step.
+    """
+    bt = paso.brain_tensor
+    if paso.compilado or bt.topologia is None:
+        return None
+    if not all(es_compartido(bt, nombre) for nombre in CAMPOS_TOPOLOGIA):
+        return None
+    return (bt.topologia, paso.clave, bt.pesos_sinapsis.dtype, tuple(bt.pesos_sinapsis.shape))
+
+
+class BatchedStep:
+    """run(n) for B FusedSteps with the same clave_lote, as one batched step."""
+
+    def __init__(self, pasos: list[FusedStep]) -> None:
+        claves = {clave_lote(p) for p in pasos}
+        if not pasos or len(claves) != 1 or None in claves:
+            raise ValueError("BatchedStep needs eager steps with the same topology and configuration")
+        if len({id(p.brain_tensor) for p in pasos}) != len(pasos):
+            raise ValueError("BatchedStep needs distinct networks")
+        self.pasos = pasos
+
+    def run(
+        self,
+        n: int,
+        entradas: list[torch.Tensor] | None = None,
+        inicio_entrada: int = 0,
+        metricas: list[torch.Tensor] | None = None,
+        n_tejido: int | None = None,
+    ) -> None:
+        """n steps for every network (FusedStep.run arguments, one per network).
+
+        Args:
+            n: Number of steps.
+            entradas: Per network, [n, size] input frames (or None without input).
+            inicio_entrada: First neuron of the input region.
+            metricas: Per network, a preallocated [n, 2] buffer (or None).
+            n_tejido: Neurons the metrics cover (default: all real neurons).
+        """
+        ref = self.pasos[0]
+        bts = [p.brain_tensor for p in self.pasos]
+        bt = ref.brain_tensor
+        NR = bt.n_real
+        limite = n_tejido if n_tejido is not None else NR
+
+        valores = torch.stack([b.valores for b in bts])
+        pesos = torch.stack([b.pesos_sinapsis for b in bts])
+        ac = torch.stack([b.active_counts[:NR] for b in bts])
+        refr = torch.stack([b.refractory_remaining[:NR] for b in bts])
+        tension = torch.stack([b.tensiones[:NR] for b in bts])
+        frames = torch.stack(entradas) if entradas is not None else None
+        buffer = torch.zeros(len(bts), n, 2, device=bt.device) if metricas is not None else None
+        region = slice(inicio_entrada, inicio_entrada + frames.shape[2]) if frames is not None else None
+
+        constantes = (
+            bt.indices_fuente, bt.mascara_valida, bt._safe_dend_ids, bt._dend_pesos,
+            bt.umbrales[:NR], bt.mascara_entrada[:NR],
+        )
+        for k in range(n):
+            if frames is not None:
+                valores[:, region] = frames[:, k]
+            valores, tension, ac, refr, nuevos = ref._eager(
+                valores, pesos, *constantes, ac, refr, ref._conteos, ref._procesables, ref._coef_lr,
+            )
+            if nuevos is not None:
+                pesos = nuevos
+            if buffer is not None:
+                buffer[:, k, METRICA_ACTIVAS] = (valores[:, :limite] > 0.5).sum(dim=1)
+                buffer[:, k, METRICA_TENSION] = tension[:, :limite].mean(dim=1)
+
+        for i, b in enumerate(bts):
+            b.valores.copy_(valores[i])
+            b.tensiones[:NR] = tension[i]
+            b.active_counts[:NR] = ac[i]
+            b.refractory_remaining[:NR] = refr[i]
+            if ref.aprende:
+                # A copy, so a session never keeps the whole batch alive
+                b.pesos_sinapsis = pesos[i].clone()
+            if metricas is not None:
+                metricas[i].copy_(buffer[i])
@@ -12,6 +12,15 @@ Main tensors:
   Di [N, max_syn] — dendrite ID per synapse (for segment_mean)
   U  [N]          — activation thresholds
   Em [N]          — NeuronaEntrada mask (do not process)
+
+Compact storage (compact=True) keeps the same tensors in narrower dtypes:
+int32 indices, int16 dendrite IDs, uint8 adaptation counters and
+`weight_dtype` (float16/bfloat16) weights. procesar() and learn() still
+accumulate in float32, so only the stored weights lose precision.
+
+Connectivity tensors (C, Dp, M, Di, U, Em and the synapse-type masks) may
+be shared with other networks (core.topology_registry): they are never
+written in place, only replaced.
 """
 
 from __future__ import annotations
@@ -45,8 +54,16 @@ class BrainTensor:
         es_exc_syn: torch.BoolTensor | None = None,
         es_inh_syn: torch.BoolTensor | None = None,
         es_input_syn: torch.BoolTensor | None = None,
+        compact: bool = False,
+        weight_dtype: torch.dtype = torch.float32,
     ) -> None:
         self.device = device
+        self.compact = compact
+        self.weight_dtype = weight_dtype
+        index_dtype = torch.int32 if compact else torch.long
+        self._counter_dtype = torch.uint8 if compact else torch.long
+        if compact and max(max_active_steps, refractory_steps) > torch.iinfo(torch.uint8).max:
+            raise ValueError("compact storage supports up/down ticks up to 255")
         self.process_mode = process_mode
         # Support both legacy single fn and composable list
         if tension_fns is not None:
@@ -61,11 +78,11 @@ class BrainTensor:
         self.N = valores.shape[0]
 
         self.valores = valores.to(device)
-        self.pesos_sinapsis = pesos_sinapsis.to(device)
-        self.indices_fuente = indices_fuente.to(device)
-        self.pesos_dendrita = pesos_dendrita.to(device)
+        self.pesos_sinapsis = pesos_sinapsis.to(device, weight_dtype)
+        self.indices_fuente = indices_fuente.to(device, index_dtype)
+        self.pesos_dendrita = pesos_dendrita.to(device, weight_dtype)
         self.mascara_valida = mascara_valida.to(device)
-        self.dendrita_ids = dendrita_ids.to(device)
+        self.dendrita_ids = dendrita_ids.to(device, torch.int16 if compact else torch.long)
         self.max_dendritas = max_dendritas
         self.umbrales = umbrales.to(device)
         self.mascara_entrada = mascara_entrada.to(device)
@@ -76,12 +93,12 @@ class BrainTensor:
         self.adaptation_enabled = adaptation_enabled
         self.max_active_steps = max_active_steps
         self.refractory_steps = refractory_steps
-        self.active_counts = torch.zeros(self.N, dtype=torch.long, device=device)
-        self.refractory_remaining = torch.zeros(self.N, dtype=torch.long, device=device)
+        self.active_counts = torch.zeros(self.N, dtype=self._counter_dtype, device=device)
+        self.refractory_remaining = torch.zeros(self.N, dtype=self._counter_dtype, device=device)
 
         # Safe dendrite IDs: invalid synapses point to a trash column (max_dendritas)
         # so they don't corrupt valid dendrite data during scatter operations.
-        self._safe_dend_ids = self.dendrita_ids.clone()
+        self._safe_dend_ids = self.dendrita_ids.to(index_dtype)
         self._safe_dend_ids[~self.mascara_valida] = self.max_dendritas
 
         # Pre-compute per-dendrite weights [N, max_dend] and dendrite mask
@@ -106,6 +123,9 @@ class BrainTensor:
         # Tension values (updated each procesar() call)
         self.tensiones = torch.zeros(self.N, device=device)
 
+        # Key of the shared topology these tensors come from (see core.topology_registry)
+        self.topologia: str | None = None
+
     def _precompute_dendrite_info(self) -> tuple[torch.Tensor, torch.BoolTensor]:
         """Pre-compute dendrite weights and validity mask.
 
@@ -117,7 +137,7 @@ class BrainTensor:
 
         # Dendrite weights: scatter weights from valid synapses
         dend_pesos = torch.zeros(N, expanded, device=self.device)
-        dend_pesos.scatter_(1, self._safe_dend_ids, self.pesos_dendrita)
+        dend_pesos.scatter_(1, self._safe_dend_ids, self.pesos_dendrita.float())
         dend_pesos = dend_pesos[:, :self.max_dendritas]
 
         # Dendrite mask: a dendrite is valid if it has at least one valid synapse
@@ -127,6 +147,24 @@ class BrainTensor:
 
         return dend_pesos, dendrita_mascara
 
+    def set_dendrite_weights(self, pesos_dendrita: torch.Tensor) -> None:
+        """Replace the per-synapse dendrite weights in place of a recompile.
+
+        Refreshes everything derived from them: per-dendrite weights and the
+        excitatory/inhibitory synapse masks (input synapses stay input).
+        """
+        self.pesos_dendrita = pesos_dendrita.to(self.device, self.weight_dtype)
+        self._dend_pesos, self._dendrita_mascara = self._precompute_dendrite_info()
+        lateral = self.mascara_valida & ~self.es_input_syn
+        self.es_exc_syn = lateral & (self.pesos_dendrita >= 0)
+        self.es_inh_syn = lateral & (self.pesos_dendrita < 0)
+
+    def reset_state(self) -> None:
+        """Zero adaptation counters and tensions (topology and weights untouched)."""
+        self.active_counts.zero_()
+        self.refractory_remaining.zero_()
+        self.tensiones.zero_()
+
     def procesar(self) -> None:
         """A full vectorized step.
 
@@ -164,46 +202,21 @@ class BrainTensor:
         # 4. Multiply by dendrite weight
         dendrita_valores = promedios * self._dend_pesos  # [NR, max_dend]
 
+        self.activar(dendrita_valores)
+
+    def activar(self, dendrita_valores: torch.Tensor) -> None:
+        """Steps 5-8 of procesar() from dendrite values [NR, max_dend] (× dendrite weight).
+
+        Shared by engines that compute the dendrite values another way
+        (see core.fft_engine).
+        """
+        NR = self.n_real
+
         # 5. Combine dendrites (mode-dependent).
         # Invalid dendrites → 0 (neutral for both modes).
         dendrita_para_calc = dendrita_valores.where(self._dendrita_mascara, torch.zeros(1, device=self.device))
 
-        if self.process_mode == "sum":
-            tension = dendrita_para_calc.sum(dim=1).clamp(-1.0, 1.0)  # [NR]
-        elif self.process_mode in ("avg_vs_avg", "avg_vs_avg_normalized"):
-            pos_mask = dendrita_para_calc > 0
-            neg_mask = dendrita_para_calc < 0
-            pos_sum = (dendrita_para_calc * pos_mask).sum(dim=1)
-            pos_cnt = pos_mask.sum(dim=1).clamp(min=1.0)
-            neg_sum = (dendrita_para_calc * neg_mask).sum(dim=1)
-            neg_cnt = neg_mask.sum(dim=1).clamp(min=1.0)
-            pos_avg = pos_sum / pos_cnt
-            neg_avg = neg_sum / neg_cnt
-            raw = pos_avg + neg_avg
-            if self.process_mode == "avg_vs_avg_normalized":
-                # Divide by total scale so only the ratio exc/inh matters,
-                # not the absolute magnitudes. pos_avg >= 0, neg_avg <= 0,
-                # so normalizer = pos_avg - neg_avg = |pos_avg| + |neg_avg|.
-                normalizer = (pos_avg - neg_avg).clamp(min=1e-8)
-                tension = (raw / normalizer).clamp(-1.0, 1.0)
-            else:
-                tension = raw.clamp(-1.0, 1.0)
-        else:
-            # min_vs_max: max(0, positives) + min(0, negatives)
-            max_vals = dendrita_para_calc.max(dim=1).values.clamp(min=0.0)  # [NR]
-            min_vals = dendrita_para_calc.min(dim=1).values.clamp(max=0.0)  # [NR]
-            tension = (max_vals + min_vals).clamp(-1.0, 1.0)  # [NR]
-
-        if self.tension_fns:
-            result = torch.zeros_like(tension)
-            for fn_name, coeff in self.tension_fns:
-                if fn_name == "x":
-                    result = result + coeff * tension
-                elif fn_name.startswith("x_pow_"):
-                    exp = int(fn_name.split("_pow_")[1])
-                    result = result + coeff * tension.pow(exp)
-            tension = result.clamp(-1.0, 1.0)
-
+        tension = combinar_dendritas(dendrita_para_calc, self.process_mode, self.tension_fns)
         self.tensiones[:NR] = tension
 
         # 6. Activate: tension > threshold (only real neurons)
@@ -221,7 +234,7 @@ class BrainTensor:
             procesables = ~mascara_real
             refr = self.refractory_remaining[:NR]
             ac = self.active_counts[:NR]
-            zero_l = torch.zeros(1, dtype=torch.long, device=self.device)
+            zero_l = torch.zeros(1, dtype=self._counter_dtype, device=self.device)
             zero_f = torch.zeros(1, device=self.device)
 
             # Neurons in refractory period: force off, decrement counter
@@ -242,7 +255,7 @@ class BrainTensor:
             self.active_counts[:NR] = torch.where(hit_limit, zero_l, self.active_counts[:NR])
             self.refractory_remaining[:NR] = torch.where(
                 hit_limit,
-                torch.full((1,), self.refractory_steps, dtype=torch.long, device=self.device),
+                torch.full((1,), self.refractory_steps, dtype=self._counter_dtype, device=self.device),
                 self.refractory_remaining[:NR],
             )
         
@@ -273,7 +286,19 @@ class BrainTensor:
         )  # [NR, max_syn]
 
         delta = lr * lr_map * tension * (source_vals - self.pesos_sinapsis)
-        self.pesos_sinapsis = (self.pesos_sinapsis + delta * self.mascara_valida).clamp(0.0, 1.0)
+        pesos = (self.pesos_sinapsis + delta * self.mascara_valida).clamp(0.0, 1.0)
+        self.pesos_sinapsis = pesos.to(self.weight_dtype)
+
+    def storage_bytes(self) -> int:
+        """Bytes held by the network tensors (the [N, max_syn] ones dominate)."""
+        tensors = [
+            self.valores, self.pesos_sinapsis, self.indices_fuente, self.pesos_dendrita,
+            self.mascara_valida, self.dendrita_ids, self._safe_dend_ids,
+            self.umbrales, self.mascara_entrada, self.active_counts,
+            self.refractory_remaining, self.tensiones, self._dend_pesos,
+            self._dendrita_mascara, self.es_exc_syn, self.es_inh_syn, self.es_input_syn,
+        ]
+        return sum(t.numel() * t.element_size() for t in tensors)
 
     def procesar_n(self, n: int) -> None:
         """N steps seguidos sin salir al Python loop."""
@@ -295,3 +320,51 @@ class BrainTensor:
     def set_valor(self, idx: int, valor: float) -> None:
         """Modifica el valor de una neurona (para click/paint)."""
         self.valores[idx] = valor
+
+
+def combinar_dendritas(
+    dendrita_valores: torch.Tensor,
+    process_mode: str,
+    tension_fns: list[tuple[str, float]],
+) -> torch.Tensor:
+    """Step 5 of procesar(): dendrite values [R, max_dend] (invalid ones at 0) → tension [R].
+
+    Also used by engines that know every possible dendrite state in advance
+    (see core.wolfram_engine).
+    """
+    if process_mode == "sum":
+        tension = dendrita_valores.sum(dim=1).clamp(-1.0, 1.0)  # [R]
+    elif process_mode in ("avg_vs_avg", "avg_vs_avg_normalized"):
+        pos_mask = dendrita_valores > 0
+        neg_mask = dendrita_valores < 0
+        pos_sum = (dendrita_valores * pos_mask).sum(dim=1)
+        pos_cnt = pos_mask.sum(dim=1).clamp(min=1.0)
+        neg_sum = (dendrita_valores * neg_mask).sum(dim=1)
+        neg_cnt = neg_mask.sum(dim=1).clamp(min=1.0)
+        pos_avg = pos_sum / pos_cnt
+        neg_avg = neg_sum / neg_cnt
+        raw = pos_avg + neg_avg
+        if process_mode == "avg_vs_avg_normalized":
+            # Divide by total scale so only the ratio exc/inh matters,
+            # not the absolute magnitudes. pos_avg >= 0, neg_avg <= 0,
+            # so normalizer = pos_avg - neg_avg = |pos_avg| + |neg_avg|.
+            normalizer = (pos_avg - neg_avg).clamp(min=1e-8)
+            tension = (raw / normalizer).clamp(-1.0, 1.0)
+        else:
+            tension = raw.clamp(-1.0, 1.0)
+    else:
+        # min_vs_max: max(0, positives) + min(0, negatives)
+        max_vals = dendrita_valores.max(dim=1).values.clamp(min=0.0)  # [R]
+        min_vals = dendrita_valores.min(dim=1).values.clamp(max=0.0)  # [R]
+        tension = (max_vals + min_vals).clamp(-1.0, 1.0)  # [R]
+
+    if tension_fns:
+        result = torch.zeros_like(tension)
+        for fn_name, coeff in tension_fns:
+            if fn_name == "x":
+                result = result + coeff * tension
+            elif fn_name.startswith("x_pow_"):
+                exp = int(fn_name.split("_pow_")[1])
+                result = result + coeff * tension.pow(exp)
+        tension = result.clamp(-1.0, 1.0)
+    return tension
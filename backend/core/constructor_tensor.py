@@ -21,7 +21,7 @@ class ConstructorTensor:
     """Compiles a sequential Brain into a parallel BrainTensor."""
 
     @staticmethod
-    def compilar(brain: Brain, device: str = "cpu", max_active_steps: int = 5, refractory_steps: int = 5, adaptation_enabled: bool = False, process_mode: str = "min_vs_max", tension_fn: str = "", tension_fn_param: float = 1.0, tension_fns: list[tuple[str, float]] | None = None) -> BrainTensor:
+    def compilar(brain: Brain, device: str = "cpu", max_active_steps: int = 5, refractory_steps: int = 5, adaptation_enabled: bool = False, process_mode: str = "min_vs_max", tension_fn: str = "", tension_fn_param: float = 1.0, tension_fns: list[tuple[str, float]] | None = None, compact: bool = False, weight_dtype: torch.dtype = torch.float32) -> BrainTensor:
         """Convert a sequential Brain into a parallel BrainTensor.
 
         Traverses the Brain ONCE and builds the tensors:
@@ -37,6 +37,8 @@ class ConstructorTensor:
         Args:
             brain: The sequential Brain with all neurons/dendrites/synapses configured.
             device: PyTorch device ("cpu" or "cuda").
+            compact: Store indices/counters in narrow dtypes (see BrainTensor).
+            weight_dtype: Storage dtype of synapse and dendrite weights.
 
         Returns:
             A BrainTensor ready for vectorized processing.
@@ -103,14 +105,51 @@ class ConstructorTensor:
                 dend_ids_np[i, :k] = di
 
         # Convert to tensors in one shot (zero-copy from numpy)
-        valores = torch.from_numpy(valores_np)
-        umbrales = torch.from_numpy(umbrales_np)
-        mascara_entrada = torch.from_numpy(entrada_np)
-        pesos_sinapsis = torch.from_numpy(pesos_s_np)
-        indices_fuente = torch.from_numpy(indices_f_np)
-        pesos_dendrita = torch.from_numpy(pesos_d_np)
-        mascara_valida = torch.from_numpy(mascara_v_np)
-        dendrita_ids = torch.from_numpy(dend_ids_np)
+        return ConstructorTensor.ensamblar(
+            valores=torch.from_numpy(valores_np),
+            umbrales=torch.from_numpy(umbrales_np),
+            mascara_entrada=torch.from_numpy(entrada_np),
+            pesos_sinapsis=torch.from_numpy(pesos_s_np),
+            indices_fuente=torch.from_numpy(indices_f_np),
+            pesos_dendrita=torch.from_numpy(pesos_d_np),
+            mascara_valida=torch.from_numpy(mascara_v_np),
+            dendrita_ids=torch.from_numpy(dend_ids_np),
+            max_dendritas=max_dend,
+            device=device,
+            max_active_steps=max_active_steps,
+            refractory_steps=refractory_steps,
+            adaptation_enabled=adaptation_enabled,
+            process_mode=process_mode,
+            tension_fn=tension_fn,
+            tension_fn_param=tension_fn_param,
+            tension_fns=tension_fns,
+            compact=compact,
+            weight_dtype=weight_dtype,
+        )
+
+    @staticmethod
+    def ensamblar(
+        valores: torch.Tensor,
+        umbrales: torch.Tensor,
+        mascara_entrada: torch.Tensor,
+        pesos_sinapsis: torch.Tensor,
+        indices_fuente: torch.Tensor,
+        pesos_dendrita: torch.Tensor,
+        mascara_valida: torch.Tensor,
+        dendrita_ids: torch.Tensor,
+        max_dendritas: int,
+        device: str = "cpu",
+        **kwargs,
+    ) -> BrainTensor:
+        """Build a BrainTensor from per-neuron [N] and per-synapse [N, max_syn] tensors.
+
+        Padding synapses must point to index N (= number of real neurons);
+        a frozen zero neuron is appended to hold them. Also derives the
+        per-synapse type masks used by learn(). Extra keyword arguments are
+        passed through to BrainTensor.
+        """
+        N = pesos_sinapsis.shape[0]
+        max_dend = max_dendritas
 
         # Check if we need a zero neuron for border synapses
         has_border = (indices_fuente == N).any().item()
@@ -147,14 +186,88 @@ class ConstructorTensor:
             mascara_entrada=mascara_entrada,
             n_real=N,
             device=device,
-            max_active_steps=max_active_steps,
-            refractory_steps=refractory_steps,
-            adaptation_enabled=adaptation_enabled,
-            process_mode=process_mode,
-            tension_fn=tension_fn,
-            tension_fn_param=tension_fn_param,
-            tension_fns=tension_fns,
             es_exc_syn=es_exc_syn,
             es_inh_syn=es_inh_syn,
             es_input_syn=es_input_syn,
+            **kwargs,
         )
+
+    @staticmethod
+    def compilar_mascara_2d(
+        width: int,
+        height: int,
+        mascara: list[dict[str, object]],
+        random_weights: bool = True,
+        generator: torch.Generator | None = None,
+    ) -> dict[str, torch.Tensor]:
+        """Vectorized Constructor.aplicar_mascara_2d for a toroidal tissue grid.
+
+        Builds the lateral synapse block of the width*height tissue neurons
+        directly as tensors, in the same per-row layout compilar() produces
+        (dendrites in mask order, synapses in offset order). Random weights
+        follow the same distributions, sampled from `generator`.
+
+        Returns:
+            Dict of [width*height, L] tensors: pesos_sinapsis, indices_fuente,
+            pesos_dendrita, dendrita_ids. L = total offsets in the mask.
+        """
+        cols = _columnas_mascara(mascara, random_weights)
+        n_tissue = width * height
+        n_syn = len(cols["dx"])
+        x = torch.arange(width).repeat(height)                  # [NT]
+        y = torch.arange(height).repeat_interleave(width)       # [NT]
+        nx = (x.unsqueeze(1) + torch.tensor(cols["dx"], dtype=torch.long)) % width
+        ny = (y.unsqueeze(1) + torch.tensor(cols["dy"], dtype=torch.long)) % height
+
+        return {
+            "pesos_sinapsis": _muestrear_pesos(n_tissue, cols, generator),
+            "indices_fuente": ny * width + nx,
+            "pesos_dendrita": torch.tensor(cols["peso_d"], dtype=torch.float32).expand(n_tissue, n_syn).clone(),
+            "dendrita_ids": torch.tensor(cols["dend"], dtype=torch.long).expand(n_tissue, n_syn).clone(),
+        }
+
+    @staticmethod
+    def pesos_mascara_2d(
+        n_neuronas: int,
+        mascara: list[dict[str, object]],
+        random_weights: bool = True,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """Only the [n_neuronas, L] synapse weights of compilar_mascara_2d (same draws)."""
+        return _muestrear_pesos(n_neuronas, _columnas_mascara(mascara, random_weights), generator)
+
+
+def _columnas_mascara(mascara: list[dict[str, object]], random_weights: bool) -> dict[str, list]:
+    """Per-synapse columns of a mask: offsets, dendrite id/weight, base weight, scale low bound."""
+    dendritas = [d for d in mascara if d["offsets"]]  # empty dendrites are not created
+    dx, dy, dend, peso_d, base, lo = [], [], [], [], [], []
+    for d_idx, d in enumerate(dendritas):
+        offsets = d["offsets"]
+        n = len(offsets)  # type: ignore[arg-type]
+        explicit = d.get("pesos_sinapsis")
+        noise_amp = d.get("random_noise")  # None for presets
+        dx.extend(o[0] for o in offsets)  # type: ignore[union-attr]
+        dy.extend(o[1] for o in offsets)  # type: ignore[union-attr]
+        dend.extend([d_idx] * n)
+        peso_d.extend([float(d["peso_dendrita"])] * n)  # type: ignore[arg-type]
+        base.extend(explicit if explicit is not None else [1.0] * n)  # type: ignore[arg-type]
+        if not random_weights:
+            low = 1.0
+        elif noise_amp is not None:
+            low = 1.0 - noise_amp if noise_amp > 0 else 1.0  # type: ignore[operator]
+        else:
+            low = 0.2
+        lo.extend([low] * n)
+    return {"dx": dx, "dy": dy, "dend": dend, "peso_d": peso_d, "base": base, "lo": lo}
+
+
+def _muestrear_pesos(
+    n_neuronas: int, cols: dict[str, list], generator: torch.Generator | None,
+) -> torch.Tensor:
+    """base × uniform(lo, 1.0) per synapse → [n_neuronas, L]; lo == 1.0 means a fixed weight."""
+    base = torch.tensor(cols["base"], dtype=torch.float32)
+    lo = torch.tensor(cols["lo"], dtype=torch.float32)
+    if bool((lo == 1.0).all()):
+        return base.expand(n_neuronas, base.shape[0]).clone()
+    pesos = torch.rand(n_neuronas, base.shape[0], generator=generator)
+    return pesos.mul_(1.0 - lo).add_(lo).mul_(base)
@@ -0,0 +1,377 @@
+"""DomainEngine — the tissue split into row bands across worker processes.
+
+A single BrainTensor steps the whole grid in one process. DomainEngine
+partitions the tissue rows into contiguous bands of grid rows, one per
+worker process (torch.multiprocessing, spawn). Each worker holds only its
+band of the [N, max_syn] tensors, with source indices remapped to a local
+value vector:
+
+    [ own rows (NR) | external sources (halo rows, input neurons, zero neuron) ]
+
+The external sources are exactly the cells the band's synapses read, so on
+the toroidal grid the halo is as many rows above and below as the mask
+radius. Every step, a worker gathers its halo from a shared-memory value
+buffer, runs a FusedStep on its band (adaptation counters stay in the
+worker) and writes its own rows into the other half of the double buffer;
+a barrier then ends the step. Learning reads the sources' new values, so it
+runs after the barrier on a refreshed halo. Rows are stepped and learn with
+the same operations as the single-process step, so results match it
+exactly.
+
+The parent only touches the shared buffers between run() calls: values and
+tensions are copied back into the BrainTensor once per run(), learned
+weights and adaptation counters only on demand (recoger). Workers run
+single-threaded, so throughput scales with the number of cores.
+"""
+
+from __future__ import annotations
+
+import logging
+import traceback
+import weakref
+from typing import Any
+
+import torch
+import torch.multiprocessing as mp
+
+from .brain_tensor import BrainTensor
+from .fused_step import METRICA_ACTIVAS, METRICA_TENSION, Aprendizaje, FusedStep
+
+logger = logging.getLogger(__name__)
+
+# Steps per run() command (size of the shared input-frame and metrics buffers)
+_BLOQUE = 256
+
+# Soft params sent to the workers (BrainTensor attributes)
+_PARAMS = ("process_mode", "tension_fns", "adaptation_enabled", "max_active_steps", "refractory_steps")
+
+
+def _bandas(height: int, n: int) -> list[tuple[int, int]]:
+    """Split rows [0, height) into n contiguous bands of (almost) equal height."""
+    return [(i * height // n, (i + 1) * height // n) for i in range(n)]
+
+
+class DomainEngine:
+    """Steps the tissue of a BrainTensor in row bands on worker processes."""
+
+    def __init__(self, brain_tensor: BrainTensor, width: int, height: int, workers: int) -> None:
+        """Start the workers (at most one per grid row) and allocate the shared buffers.
+
+        Expects the Experiment layout: width*height tissue rows first. Call
+        cargar() to hand the network to the workers before run().
+        """
+        self.brain_tensor = brain_tensor
+        self.width = width
+        self.height = height
+        self.n_tissue = width * height
+        self.n_valores = brain_tensor.valores.shape[0]
+        self.bandas = _bandas(height, max(1, min(workers, height)))
+        n = len(self.bandas)
+
+        self._valores = torch.zeros(2, self.n_valores).share_memory_()
+        self._tensiones = torch.zeros(self.n_tissue).share_memory_()
+        self._metricas = torch.zeros(_BLOQUE, n, 2).share_memory_()
+        self._entradas: torch.Tensor | None = None
+        self._fase = 0
+
+        ctx = mp.get_context("spawn")
+        # Held for the engine's lifetime: spawned workers attach to it while starting
+        self._barrera = barrera = ctx.Barrier(n)
+        self._conexiones = []
+        self._procesos = []
+        for i in range(n):
+            padre, hijo = ctx.Pipe()
+            proceso = ctx.Process(
+                target=_trabajador,
+                args=(hijo, barrera, i, self._valores, self._tensiones, self._metricas),
+                name=f"neuroflow-domain-{i}",
+                daemon=True,
+            )
+            proceso.start()
+            hijo.close()
+            self._conexiones.append(padre)
+            self._procesos.append(proceso)
+        self._finalizar = weakref.finalize(self, _cerrar, self._conexiones, self._procesos)
+
+    @property
+    def workers(self) -> int:
+        return len(self.bandas)
+
+    def admite(self, brain_tensor: BrainTensor, width: int, height: int, workers: int) -> bool:
+        """Whether this engine (its processes and buffers) can take that network."""
+        return (
+            self._finalizar.alive
+            and (width, height) == (self.width, self.height)
+            and brain_tensor.valores.shape[0] == self.n_valores
+            and min(workers, height) == self.workers
+        )
+
+    def cargar(self, brain_tensor: BrainTensor, aprendizaje: Aprendizaje) -> None:
+        """Send each worker its band of the network (weights, topology and state)."""
+        bt = brain_tensor
+        self.brain_tensor = bt
+        params = tuple(getattr(bt, p) for p in _PARAMS)
+        for conn, (y0, y1) in zip(self._conexiones, self.bandas):
+            conn.send(("cargar", _banda(bt, y0 * self.width, y1 * self.width), params, aprendizaje))
+        self._esperar()
+
+    def configurar(self, aprendizaje: Aprendizaje) -> None:
+        """Send the BrainTensor's current soft params and learning rates to the workers."""
+        params = tuple(getattr(self.brain_tensor, p) for p in _PARAMS)
+        for conn in self._conexiones:
+            conn.send(("configurar", params, aprendizaje))
+        self._esperar()
+
+    def run(
+        self,
+        n: int,
+        entradas: torch.Tensor | None = None,
+        inicio_entrada: int = 0,
+        metricas: torch.Tensor | None = None,
+        n_tejido: int | None = None,
+    ) -> None:
+        """n steps on the workers (same arguments as FusedStep.run).
+
+        The BrainTensor's values (paint, clicks, projected input) are pushed
+        to the workers first; values and tensions come back at the end.
+        """
+        bt = self.brain_tensor
+        limite = n_tejido if n_tejido is not None else self.n_tissue
+        self._valores.copy_(bt.valores.detach().cpu().expand(2, -1))
+        if entradas is not None and (self._entradas is None or self._entradas.shape[1] != entradas.shape[1]):
+            # New frame size: a fresh shared buffer travels with the next command
+            self._entradas = torch.zeros(_BLOQUE, entradas.shape[1]).share_memory_()
+
+        hecho = 0
+        while hecho < n:
+            k = min(_BLOQUE, n - hecho)
+            region = None
+            if entradas is not None:
+                self._entradas[:k] = entradas[hecho : hecho + k]
+                region = (self._entradas, inicio_entrada)
+            for conn in self._conexiones:
+                conn.send(("run", k, self._fase, region, metricas is not None))
+            self._esperar()
+            self._fase ^= k & 1
+            if metricas is not None:
+                bloque = self._metricas[:k].sum(dim=1)
+                metricas[hecho : hecho + k, METRICA_ACTIVAS] = bloque[:, 0].to(metricas.device)
+                metricas[hecho : hecho + k, METRICA_TENSION] = (bloque[:, 1] / limite).to(metricas.device)
+            hecho += k
+
+        nt = self.n_tissue
+        bt.valores[:nt] = self._valores[self._fase, :nt].to(bt.device)
+        bt.tensiones[:nt] = self._tensiones.to(bt.device)
+        if entradas is not None and n:
+            bt.valores[inicio_entrada : inicio_entrada + entradas.shape[1]] = entradas[n - 1]
+
+    def recoger(self) -> None:
+        """Copy learned weights and adaptation counters from the workers into the BrainTensor."""
+        bt = self.brain_tensor
+        for conn in self._conexiones:
+            conn.send(("recoger",))
+        for conn, (y0, y1) in zip(self._conexiones, self.bandas):
+            filas = slice(y0 * self.width, y1 * self.width)
+            pesos, activas, refractario = self._respuesta(conn)
+            bt.pesos_sinapsis[filas] = pesos.to(bt.device, bt.pesos_sinapsis.dtype)
+            bt.active_counts[filas] = activas.to(bt.device)
+            bt.refractory_remaining[filas] = refractario.to(bt.device)
+
+    def cerrar(self) -> None:
+        """Stop the worker processes."""
+        self._finalizar()
+
+    def _esperar(self) -> None:
+        for conn in self._conexiones:
+            self._respuesta(conn)
+
+    def _respuesta(self, conn: Any) -> Any:
+        estado, valor = conn.recv()
+        if estado == "error":
+            self.cerrar()
+            raise RuntimeError(f"domain worker failed:\n{valor}")
+        return valor
+
+
+def _banda(bt: BrainTensor, r0: int, r1: int) -> dict[str, Any]:
+    """Tensors of tissue rows [r0, r1) with sources remapped to the local value vector."""
+    filas = slice(r0, r1)
+    nr = r1 - r0
+    indices = bt.indices_fuente[filas].long().cpu()
+    propios = (indices >= r0) & (indices < r1)
+    externos = torch.unique(indices[~propios])
+    locales = torch.empty_like(indices)
+    locales[propios] = indices[propios] - r0
+    locales[~propios] = nr + torch.searchsorted(externos, indices[~propios])
+
+    def cpu(t: torch.Tensor) -> torch.Tensor:
+        return t[filas].cpu()
+
+    return {
+        "inicio": r0,
+        "fin": r1,
+        "externos": externos,
+        "indices": locales,
+        "pesos_sinapsis": cpu(bt.pesos_sinapsis),
+        "pesos_dendrita": cpu(bt.pesos_dendrita),
+        "mascara_valida": cpu(bt.mascara_valida),
+        "dendrita_ids": cpu(bt.dendrita_ids),
+        "max_dendritas": bt.max_dendritas,
+        "umbrales": cpu(bt.umbrales),
+        "mascara_entrada": cpu(bt.mascara_entrada),
+        "es_exc_syn": cpu(bt.es_exc_syn),
+        "es_inh_syn": cpu(bt.es_inh_syn),
+        "es_input_syn": cpu(bt.es_input_syn),
+        "active_counts": cpu(bt.active_counts),
+        "refractory_remaining": cpu(bt.refractory_remaining),
+        "compact": bt.compact,
+        "weight_dtype": bt.weight_dtype,
+    }
+
+
+class _Dominio:
+    """One band inside a worker: a BrainTensor over the local value vector."""
+
+    def __init__(self, banda: dict[str, Any]) -> None:
+        self.inicio, self.fin = banda["inicio"], banda["fin"]
+        self.externos = banda["externos"]
+        nr = self.fin - self.inicio
+        n_ext = self.externos.numel()
+        self.nr = nr
+        self.bt = BrainTensor(
+            valores=torch.zeros(nr + n_ext),
+            pesos_sinapsis=banda["pesos_sinapsis"],
+            indices_fuente=banda["indices"],
+            pesos_dendrita=banda["pesos_dendrita"],
+            mascara_valida=banda["mascara_valida"],
+            dendrita_ids=banda["dendrita_ids"],
+            max_dendritas=banda["max_dendritas"],
+            # External sources are frozen, like input neurons
+            umbrales=torch.cat([banda["umbrales"], torch.zeros(n_ext)]),
+            mascara_entrada=torch.cat([banda["mascara_entrada"], torch.ones(n_ext, dtype=torch.bool)]),
+            n_real=nr,
+            es_exc_syn=banda["es_exc_syn"],
+            es_inh_syn=banda["es_inh_syn"],
+            es_input_syn=banda["es_input_syn"],
+            compact=banda["compact"],
+            weight_dtype=banda["weight_dtype"],
+        )
+        self.bt.active_counts[:nr] = banda["active_counts"]
+        self.bt.refractory_remaining[:nr] = banda["refractory_remaining"]
+        self.paso: FusedStep | None = None
+        self.aprendizaje: Aprendizaje = None
+        self._entrada: tuple[int, int, torch.Tensor, torch.Tensor] | None = None
+
+    def configurar(self, params: tuple, aprendizaje: Aprendizaje) -> None:
+        for nombre, valor in zip(_PARAMS, params):
+            setattr(self.bt, nombre, valor)
+        self.paso = FusedStep(self.bt)
+        self.aprendizaje = aprendizaje
+
+    def _posiciones_entrada(self, inicio: int, tamano: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """(local positions, frame offsets) of the input neurons this band reads."""
+        if self._entrada is None or self._entrada[:2] != (inicio, tamano):
+            sel = (self.externos >= inicio) & (self.externos < inicio + tamano)
+            posiciones = self.nr + torch.nonzero(sel).flatten()
+            self._entrada = (inicio, tamano, posiciones, self.externos[sel] - inicio)
+        return self._entrada[2], self._entrada[3]
+
+    def run(
+        self,
+        n: int,
+        fase: int,
+        region: tuple[torch.Tensor, int] | None,
+        valores: torch.Tensor,
+        tensiones: torch.Tensor,
+        metricas: torch.Tensor | None,
+        columna: int,
+        barrera: Any,
+    ) -> None:
+        bt, nr = self.bt, self.nr
+        propias = slice(self.inicio, self.fin)
+        if region is not None:
+            entradas, inicio = region
+            posiciones, offsets = self._posiciones_entrada(inicio, entradas.shape[1])
+        # Own rows may have been painted since the last command
+        bt.valores[:nr] = valores[fase, propias]
+        for k in range(n):
+            # Halo exchange: read neighbours from the current half of the buffer
+            bt.valores[nr:] = valores[fase][self.externos]
+            if region is not None:
+                bt.valores[posiciones] = entradas[k][offsets]
+            self.paso()
+            valores[1 - fase, propias] = bt.valores[:nr]
+            tensiones[propias] = bt.tensiones[:nr]
+            if metricas is not None:
+                metricas[k, columna, 0] = (bt.valores[:nr] > 0.5).sum()
+                metricas[k, columna, 1] = bt.tensiones[:nr].sum()
+            barrera.wait()
+            fase ^= 1
+            if self.aprendizaje is not None:
+                # Every band has written its new values: learn from them
+                bt.valores[nr:] = valores[fase][self.externos]
+                if region is not None:
+                    bt.valores[posiciones] = entradas[k][offsets]
+                bt.learn(*self.aprendizaje)
+
+    def estado(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        nr = self.nr
+        return (
+            self.bt.pesos_sinapsis.clone(),
+            self.bt.active_counts[:nr].clone(),
+            self.bt.refractory_remaining[:nr].clone(),
+        )
+
+
+def _trabajador(
+    conn: Any,
+    barrera: Any,
+    columna: int,
+    valores: torch.Tensor,
+    tensiones: torch.Tensor,
+    metricas: torch.Tensor,
+) -> None:
+    """Worker process: serve commands from the DomainEngine until 'cerrar'."""
+    torch.set_num_threads(1)
+    dominio: _Dominio | None = None
+    while True:
+        try:
+            orden, *args = conn.recv()
+        except EOFError:
+            return
+        if orden == "cerrar":
+            return
+        try:
+            resultado = None
+            if orden == "cargar":
+                banda, params, aprendizaje = args
+                dominio = _Dominio(banda)
+                dominio.configurar(params, aprendizaje)
+            elif orden == "configurar":
+                dominio.configurar(*args)
+            elif orden == "run":
+                n, fase, region, con_metricas = args
+                dominio.run(
+                    n, fase, region, valores, tensiones,
+                    metricas if con_metricas else None, columna, barrera,
+                )
+            elif orden == "recoger":
+                resultado = dominio.estado()
+            conn.send(("ok", resultado))
+        except Exception:
+            # Release the other workers if they are waiting on this one
+            barrera.abort()
+            conn.send(("error", traceback.format_exc()))
+
+
+def _cerrar(conexiones: list[Any], procesos: list[Any]) -> None:
+    for conn in conexiones:
+        try:
+            conn.send(("cerrar",))
+        except (BrokenPipeError, OSError):
+            pass
+        conn.close()
+    for proceso in procesos:
+        proceso.join(timeout=5)
+        if proceso.is_alive():
+            proceso.terminate()
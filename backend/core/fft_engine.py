@@ -0,0 +1,200 @@
+"""FFTEngine — spectral evaluation of fixed-weight lateral masks.
+
+When every tissue neuron has the same lateral synapse weights (masks with
+random_weights False, `fixed: true` deamon wirings), each lateral dendrite
+is a cross-correlation of the tissue state with a constant kernel. With
+binary values a synapse is affine in its input:
+
+    1 - |w - v| = a + b·v,   a = 1 - |w|,   b = |w| - |w - 1|,   v ∈ {0, 1}
+
+so the sum of a dendrite at every cell is  Σa + (kernel ⋆ V)  on the
+toroidal grid. Two evaluators share that form:
+
+  - Dendrites built from complete square rings (Chebyshev shells, as made
+    by _moore/_ring_sq and the deamon "square" cups) with one weight per
+    ring are differences of box sums, read from a toroidal summed-area
+    table in O(1) per cell for any radius (exact integer sums).
+  - Any other dendrite (sectors, sparse rings, petals) uses the kernel's
+    FFT, computed once: one rFFT of the state plus one inverse per dendrite.
+
+Either way the per-step cost does not depend on the mask radius. Box sums
+are exact; procesar() accumulates in float32, so where an excitatory and
+an inhibitory term tie exactly the two paths may round to different sides
+(weights that are dyadic fractions avoid this). Input
+dendrites (learned, per-neuron weights) stay on the gather path, and the
+dendrite values go through BrainTensor.activar, so combination,
+thresholds and adaptation are shared with procesar().
+"""
+
+from __future__ import annotations
+
+import torch
+
+from .brain_tensor import BrainTensor
+
+# Dendrite sums are snapped to this grid (float64 FFT round-off is ~1e-12),
+# so empty or exactly cancelling dendrites stay exactly 0 as in procesar().
+_SNAP = 2.0**20
+
+
+class FFTEngine:
+    """Lateral dendrites by box sums or FFT, input dendrites by gather, on a BrainTensor."""
+
+    def __init__(self, brain_tensor: BrainTensor, width: int, height: int, n_lateral: int) -> None:
+        """Precompute box-sum coefficients and kernel spectra from the first tissue row.
+
+        Use FFTEngine.compilar(), which checks that the weights are shared.
+        """
+        bt = brain_tensor
+        self.brain_tensor = bt
+        self.width = width
+        self.height = height
+        self.n_tissue = width * height
+        self.n_lateral = n_lateral  # lateral synapse columns
+
+        cols = slice(0, n_lateral)
+        fuentes = bt.indices_fuente[0, cols].long()
+        pesos = bt.pesos_sinapsis[0, cols].double()
+        dendritas = bt.dendrita_ids[0, cols].long()
+        b = pesos.abs() - (pesos - 1.0).abs()
+        n = self.n_dendritas = int(dendritas.max()) + 1 if n_lateral else 0
+
+        self._base = torch.zeros(n, dtype=torch.float64, device=bt.device)
+        self._base.index_add_(0, dendritas, 1.0 - pesos.abs())
+        self._conteos = torch.zeros(n, dtype=torch.float64, device=bt.device)
+        self._conteos.index_add_(0, dendritas, torch.ones_like(pesos))
+
+        # Row 0 is cell (0, 0): its source index is the (wrapped) offset itself
+        sx, sy = fuentes % width, fuentes // width
+        dx = (sx + width // 2) % width - width // 2
+        dy = (sy + height // 2) % height - height // 2
+
+        # Square-ring dendrites → coefficients over box sums of each radius
+        radio_max = (min(width, height) - 1) // 2
+        anillos: dict[int, list[tuple[int, float]]] = {}
+        for d in range(n):
+            sel = dendritas == d
+            rings = _anillos_cuadrados(dx[sel].tolist(), dy[sel].tolist(), b[sel].tolist(), radio_max)
+            if rings is not None:
+                anillos[d] = rings
+        self._sat_ids = torch.tensor(sorted(anillos), dtype=torch.long, device=bt.device)
+        self._radios = sorted({r for rings in anillos.values() for r, _ in rings}
+                              | {r - 1 for rings in anillos.values() for r, _ in rings if r > 0})
+        self._sat_coef = torch.zeros(len(anillos), len(self._radios), dtype=torch.float64, device=bt.device)
+        for row, d in enumerate(sorted(anillos)):
+            for r, peso in anillos[d]:
+                # ring r = box(r) - box(r - 1)
+                self._sat_coef[row, self._radios.index(r)] += peso
+                if r > 0:
+                    self._sat_coef[row, self._radios.index(r - 1)] -= peso
+
+        # Everything else → kernel spectra.
+        # Placing b at -offset turns the circular convolution into V(p + offset).
+        fft = [d for d in range(n) if d not in anillos]
+        self._fft_ids = torch.tensor(fft, dtype=torch.long, device=bt.device)
+        self._espectros: torch.Tensor | None = None  # [n_fft, H, W//2+1]
+        if fft:
+            sel = torch.isin(dendritas, self._fft_ids)
+            fila = torch.searchsorted(self._fft_ids, dendritas[sel])
+            kernels = torch.zeros(len(fft), height, width, dtype=torch.float64, device=bt.device)
+            kernels.index_put_((fila, (-dy[sel]) % height, (-dx[sel]) % width), b[sel], accumulate=True)
+            self._espectros = torch.fft.rfft2(kernels)
+
+    @staticmethod
+    def compilar(brain_tensor: BrainTensor, width: int, height: int) -> FFTEngine | None:
+        """Build the engine if the lateral block is one shared toroidal kernel, else None.
+
+        Expects the Experiment tissue layout: width*height tissue rows first,
+        lateral synapses at the start of each row, followed by input synapses.
+        """
+        bt = brain_tensor
+        n_tissue = width * height
+        if bt.n_real < n_tissue:
+            return None
+        lateral = bt.mascara_valida[:n_tissue] & ~bt.es_input_syn[:n_tissue]
+        n_lateral = int(lateral[0].sum())
+        if n_lateral == 0 or not bool(lateral[:, :n_lateral].all()):
+            return None
+        if not bool((lateral.sum(dim=1) == n_lateral).all()):
+            return None
+        cols = slice(0, n_lateral)
+        pesos = bt.pesos_sinapsis[:n_tissue, cols]
+        ids = bt.dendrita_ids[:n_tissue, cols]
+        if not (bool((pesos == pesos[:1]).all()) and bool((ids == ids[:1]).all())):
+            return None
+        return FFTEngine(bt, width, height, n_lateral)
+
+    def _sumas_caja(self, grid: torch.Tensor) -> torch.Tensor:
+        """Toroidal box sums of a binary [H, W] grid for every radius in _radios → [n_r, H, W]."""
+        h, w = self.height, self.width
+        R = self._radios[-1]
+        g = grid.to(torch.int32)
+        if R > 0:
+            g = torch.cat([g[-R:], g, g[:R]], dim=0)
+            g = torch.cat([g[:, -R:], g, g[:, :R]], dim=1)
+        sat = torch.zeros(h + 2 * R + 1, w + 2 * R + 1, dtype=torch.int32, device=grid.device)
+        sat[1:, 1:] = g.cumsum(0).cumsum(1)
+        cajas = []
+        for r in self._radios:
+            lo, hi = R - r, R + r + 1
+            cajas.append(
+                sat[hi:hi + h, hi:hi + w] - sat[lo:lo + h, hi:hi + w]
+                - sat[hi:hi + h, lo:lo + w] + sat[lo:lo + h, lo:lo + w]
+            )
+        return torch.stack(cajas).double()
+
+    def procesar(self) -> bool:
+        """One step. Returns False (nothing done) if the tissue state is not binary."""
+        bt = self.brain_tensor
+        nt, n_dend = self.n_tissue, self.n_dendritas
+        v = bt.valores[:nt]
+        if not bool(((v == 0.0) | (v == 1.0)).all()):
+            return False
+
+        grid = v.reshape(self.height, self.width)
+        sumas = torch.empty(n_dend, self.height, self.width, dtype=torch.float64, device=bt.device)
+        if self._sat_ids.numel():
+            cajas = self._sumas_caja(grid)
+            sumas[self._sat_ids] = torch.einsum("dr,rhw->dhw", self._sat_coef, cajas)
+        if self._espectros is not None:
+            espectro = torch.fft.rfft2(grid.double())
+            conv = torch.fft.irfft2(espectro * self._espectros, s=(self.height, self.width))
+            sumas[self._fft_ids] = torch.round(conv * _SNAP) / _SNAP
+        medias = (self._base[:, None, None] + sumas) / self._conteos[:, None, None]
+
+        promedios = torch.zeros(bt.n_real, bt.max_dendritas, device=bt.device)
+        promedios[:nt, :n_dend] = medias.reshape(n_dend, nt).T.float()
+
+        # Input dendrite (id n_dend): gather over the remaining columns
+        cols = slice(self.n_lateral, bt.pesos_sinapsis.shape[1])
+        mascara = bt.mascara_valida[:nt, cols]
+        if n_dend < bt.max_dendritas and bool(mascara.any()):
+            entradas = bt.valores[bt.indices_fuente[:nt, cols]]
+            syn = (1.0 - torch.abs(bt.pesos_sinapsis[:nt, cols] - entradas)) * mascara
+            promedios[:nt, n_dend] = syn.sum(dim=1) / mascara.sum(dim=1).clamp(min=1)
+
+        bt.activar(promedios * bt._dend_pesos)
+        return True
+
+
+def _anillos_cuadrados(
+    dx: list[int], dy: list[int], b: list[float], radio_max: int,
+) -> list[tuple[int, float]] | None:
+    """(radius, b) per complete square ring of a dendrite, or None if it has other shapes.
+
+    A ring of radius r is every offset with max(|dx|, |dy|) == r (8r offsets,
+    the cell itself for r = 0), all with the same weight.
+    """
+    por_radio: dict[int, dict[tuple[int, int], float]] = {}
+    for x, y, peso in zip(dx, dy, b):
+        r = max(abs(x), abs(y))
+        if r > radio_max or (x, y) in por_radio.setdefault(r, {}):
+            return None
+        por_radio[r][(x, y)] = peso
+    anillos = []
+    for r, offsets in sorted(por_radio.items()):
+        pesos = set(offsets.values())
+        if len(offsets) != max(1, 8 * r) or len(pesos) != 1:
+            return None
+        anillos.append((r, pesos.pop()))
+    return anillos
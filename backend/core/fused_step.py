@@ -0,0 +1,291 @@
+"""FusedStep — procesar() (+ learn()) specialized for one configuration.
+
+BrainTensor.procesar dispatches on process_mode, parses the tension
+function names and recomputes constant tensors (dendrite synapse counts,
+per-synapse learning rates) on every call. FusedStep resolves all of that
+once, for one combination of
+
+    process_mode × tension polynomial × adaptation (and its ticks) × learning rates
+
+and builds a single step function over the network tensors:
+
+  - constants hoisted: dendrite counts, non-input mask, lr per synapse
+    (the first and last shared through the topology registry by every
+    network on the same topology);
+  - the tension polynomial is a list of (power, coefficient);
+  - the adaptation block uses masked fills on a few masks instead of
+    nested torch.where with full-size temporaries;
+  - learning runs in the same function, right after activation;
+  - per-network state may carry a leading batch dimension, so BatchedStep
+    runs the same function for several networks at once.
+
+The function is pure (tensors in, tensors out), so it can be handed to
+torch.compile (opt-in, config section "compile"), which fuses the
+elementwise chains into a few kernels. If compilation fails the eager
+version is used. In eager mode results match procesar() + learn()
+exactly: every floating-point operation is kept in the same order (a
+compiler backend is free to reorder them).
+
+Rebuild it when any of those parameters or the network tensors change
+(FusedStep.clave identifies the configuration).
+
+run(n) chains n steps without leaving the engine: input frames for every
+step come in one precomputed tensor, and per-step metrics are written into
+a preallocated device buffer (no host sync until the caller reads it).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable
+
+import torch
+
+from .brain_tensor import BrainTensor
+from .topology_registry import derivado
+
+logger = logging.getLogger(__name__)
+
+# (lr, lr_exc, lr_inh, lr_input), or None without learning
+Aprendizaje = tuple[float, float, float, float] | None
+
+# Columns of the run() metrics buffer
+METRICA_ACTIVAS, METRICA_TENSION = range(2)
+
+
+def _polinomio(tension_fns: list[tuple[str, float]]) -> list[tuple[int, float]] | None:
+    """Tension function names → [(power, coeff)], None when there is none (identity)."""
+    if not tension_fns:
+        return None
+    terminos = []
+    for nombre, coef in tension_fns:
+        if nombre == "x":
+            terminos.append((1, coef))
+        elif nombre.startswith("x_pow_"):
+            terminos.append((int(nombre.split("_pow_")[1]), coef))
+    return terminos
+
+
+def _combinador(process_mode: str) -> Callable[[torch.Tensor], torch.Tensor]:
+    """Dendrite values [..., NR, max_dend] → tension [..., NR] (same ops as combinar_dendritas)."""
+    if process_mode == "sum":
+        def combinar(d: torch.Tensor) -> torch.Tensor:
+            return d.sum(dim=-1).clamp(-1.0, 1.0)
+    elif process_mode in ("avg_vs_avg", "avg_vs_avg_normalized"):
+        normalizado = process_mode == "avg_vs_avg_normalized"
+
+        def combinar(d: torch.Tensor) -> torch.Tensor:
+            pos_mask = d > 0
+            neg_mask = d < 0
+            pos_avg = (d * pos_mask).sum(dim=-1) / pos_mask.sum(dim=-1).clamp(min=1.0)
+            neg_avg = (d * neg_mask).sum(dim=-1) / neg_mask.sum(dim=-1).clamp(min=1.0)
+            raw = pos_avg + neg_avg
+            if normalizado:
+                return (raw / (pos_avg - neg_avg).clamp(min=1e-8)).clamp(-1.0, 1.0)
+            return raw.clamp(-1.0, 1.0)
+    else:
+        def combinar(d: torch.Tensor) -> torch.Tensor:
+            minimos, maximos = torch.aminmax(d, dim=-1)
+            return (maximos.clamp(min=0.0) + minimos.clamp(max=0.0)).clamp(-1.0, 1.0)
+    return combinar
+
+
+def _recoger(valores: torch.Tensor, indices: torch.Tensor) -> torch.Tensor:
+    """valores[..., indices]: source values per synapse, for one network or a batch."""
+    return torch.index_select(valores, -1, indices.reshape(-1)).view(*valores.shape[:-1], *indices.shape)
+
+
+class FusedStep:
+    """One specialized step (procesar, then learn if enabled) for a BrainTensor."""
+
+    def __init__(
+        self,
+        brain_tensor: BrainTensor,
+        aprendizaje: Aprendizaje = None,
+        compilar: dict[str, Any] | None = None,
+    ) -> None:
+        """Specialize for the current soft params of brain_tensor.
+
+        Args:
+            brain_tensor: The network; its tensors are read on every call.
+            aprendizaje: (lr, lr_exc, lr_inh, lr_input) to fuse learn(), or None.
+            compilar: torch.compile kwargs (e.g. {"backend": "inductor"}), or None for eager.
+        """
+        bt = brain_tensor
+        self.brain_tensor = bt
+        self.clave = FusedStep.clave_de(bt, aprendizaje, compilar)
+        self.aprende = aprendizaje is not None
+        NR = bt.n_real
+        D = bt.max_dendritas
+
+        # Constants of the topology
+        def contar() -> torch.Tensor:
+            conteos = torch.zeros(NR, D + 1, device=bt.device)
+            conteos.scatter_add_(1, bt._safe_dend_ids, bt.mascara_valida.float())
+            return conteos[:, :D].clamp(min=1.0)
+
+        self._conteos = derivado(bt, "conteos", None, ("_safe_dend_ids", "mascara_valida"), contar)
+        self._procesables = ~bt.mascara_entrada[:NR]
+        self._coef_lr: torch.Tensor | None = None
+        if aprendizaje is not None:
+            lr, lr_exc, lr_inh, lr_input = aprendizaje
+            self._coef_lr = derivado(
+                bt, "coef_lr", aprendizaje, ("es_exc_syn", "es_inh_syn", "es_input_syn"),
+                lambda: lr * (
+                    bt.es_exc_syn.float() * lr_exc
+                    + bt.es_inh_syn.float() * lr_inh
+                    + bt.es_input_syn.float() * lr_input
+                ),
+            )
+
+        eager = self._especializar(
+            bt.process_mode, _polinomio(bt.tension_fns),
+            bt.adaptation_enabled and bt.max_active_steps > 0,
+            bt.max_active_steps, bt.refractory_steps, aprendizaje is not None, bt.weight_dtype,
+        )
+        self._eager = eager
+        self._fn = eager
+        self.compilado = False
+        if compilar is not None and hasattr(torch, "compile"):
+            self._fn = torch.compile(eager, dynamic=False, **compilar)
+            self.compilado = True
+
+    @staticmethod
+    def clave_de(bt: BrainTensor, aprendizaje: Aprendizaje, compilar: dict[str, Any] | None) -> tuple:
+        """What a FusedStep is specialized on (the network itself excluded)."""
+        return (
+            bt.process_mode,
+            tuple(bt.tension_fns),
+            bt.adaptation_enabled,
+            bt.max_active_steps,
+            bt.refractory_steps,
+            aprendizaje,
+            tuple(sorted((compilar or {}).items())) if compilar is not None else None,
+        )
+
+    def __call__(self) -> None:
+        """One step, written back into the BrainTensor."""
+        bt = self.brain_tensor
+        NR = bt.n_real
+        args = (
+            bt.valores, bt.pesos_sinapsis, bt.indices_fuente, bt.mascara_valida,
+            bt._safe_dend_ids, bt._dend_pesos, bt.umbrales[:NR], bt.mascara_entrada[:NR],
+            bt.active_counts[:NR], bt.refractory_remaining[:NR],
+            self._conteos, self._procesables, self._coef_lr,
+        )
+        try:
+            valores, tension, ac, refr, pesos = self._fn(*args)
+        except Exception:
+            if not self.compilado:
+                raise
+            logger.warning("torch.compile failed for the fused step, using the eager version", exc_info=True)
+            self._fn, self.compilado = self._eager, False
+            valores, tension, ac, refr, pesos = self._fn(*args)
+
+        bt.valores.copy_(valores)
+        bt.tensiones[:NR] = tension
+        bt.active_counts[:NR] = ac
+        bt.refractory_remaining[:NR] = refr
+        if pesos is not None:
+            bt.pesos_sinapsis = pesos
+
+    def run(
+        self,
+        n: int,
+        entradas: torch.Tensor | None = None,
+        inicio_entrada: int = 0,
+        metricas: torch.Tensor | None = None,
+        n_tejido: int | None = None,
+    ) -> None:
+        """n steps in a row.
+
+        Args:
+            n: Number of steps.
+            entradas: [n, size] frames; frame k is copied into
+                valores[inicio_entrada : inicio_entrada + size] before step k.
+            inicio_entrada: First neuron of the input region.
+            metricas: Preallocated [n, 2] float buffer; row k gets the active
+                count and mean tension of the first n_tejido neurons after step k.
+            n_tejido: Neurons the metrics cover (default: all real neurons).
+        """
+        bt = self.brain_tensor
+        limite = n_tejido if n_tejido is not None else bt.n_real
+        region = slice(inicio_entrada, inicio_entrada + entradas.shape[1]) if entradas is not None else None
+        for k in range(n):
+            if entradas is not None:
+                bt.valores[region] = entradas[k]
+            self()
+            if metricas is not None:
+                metricas[k, METRICA_ACTIVAS] = (bt.valores[:limite] > 0.5).sum()
+                metricas[k, METRICA_TENSION] = bt.tensiones[:limite].mean()
+
+    @staticmethod
+    def _especializar(
+        process_mode: str,
+        polinomio: list[tuple[int, float]] | None,
+        adaptacion: bool,
+        max_active_steps: int,
+        refractory_steps: int,
+        aprende: bool,
+        weight_dtype: torch.dtype,
+    ) -> Callable[..., tuple]:
+        combinar = _combinador(process_mode)
+
+        def paso(
+            valores: torch.Tensor,
+            pesos: torch.Tensor,
+            indices: torch.Tensor,
+            mascara: torch.Tensor,
+            safe_ids: torch.Tensor,
+            dend_pesos: torch.Tensor,
+            umbrales: torch.Tensor,
+            entrada: torch.Tensor,
+            ac: torch.Tensor,
+            refr: torch.Tensor,
+            conteos: torch.Tensor,
+            procesables: torch.Tensor,
+            coef_lr: torch.Tensor | None,
+        ) -> tuple:
+            NR, D = conteos.shape
+
+            # Gather → synapse match → dendrite means (counts are constant)
+            fuentes = _recoger(valores, indices)
+            syn = (1.0 - torch.abs(pesos - fuentes)) * mascara
+            sumas = torch.zeros(*syn.shape[:-1], D + 1, dtype=syn.dtype, device=syn.device)
+            sumas.scatter_add_(-1, safe_ids.expand_as(syn), syn)
+            # Invalid dendrites have weight 0, so they are already neutral (0)
+            dendritas = sumas[..., :D] / conteos * dend_pesos
+
+            tension = combinar(dendritas)
+            if polinomio is not None:
+                resultado = torch.zeros_like(tension)
+                for potencia, coef in polinomio:
+                    resultado = resultado + coef * (tension if potencia == 1 else tension.pow(potencia))
+                tension = resultado.clamp(-1.0, 1.0)
+
+            reales = valores[..., :NR]
+            v = torch.where(entrada, reales, (tension > umbrales).float())
+
+            if adaptacion:
+                # Refractory neurons stay off and count down
+                en_refractario = procesables & (refr > 0)
+                v = v.masked_fill(en_refractario, 0.0)
+                refr = refr - en_refractario.to(refr.dtype)
+                # The others extend or reset their active streak
+                libres = procesables & ~en_refractario
+                ac = torch.where(libres, (ac + 1) * (v > 0.5), ac)
+                # Streak at the limit: off and into the refractory period
+                limite = libres & (ac >= max_active_steps)
+                v = v.masked_fill(limite, 0.0)
+                ac = ac.masked_fill(limite, 0)
+                refr = refr.masked_fill(limite, refractory_steps)
+
+            valores = torch.cat([v, valores[..., NR:]], dim=-1)
+
+            nuevos_pesos = None
+            if aprende:
+                delta = coef_lr * tension.unsqueeze(-1) * (_recoger(valores, indices) - pesos)
+                nuevos_pesos = (pesos + delta * mascara).clamp(0.0, 1.0).to(weight_dtype)
+            return valores, tension, ac, refr, nuevos_pesos
+
+        return paso
@@ -0,0 +1,155 @@
+"""Image datasets as a visual input stream.
+
+Reads a local stack of uint8 grayscale images — a ``.npy`` array of shape
+(n, h, w) or a raw headerless file with a given (h, w) — through
+``np.memmap``, so the source is never loaded into RAM. Each image is
+resized (box filter) and thresholded to the input resolution ONCE; the
+preprocessed stack is cached on disk as packed 0/1 uint8 rows and
+memory-mapped again for streaming. Reads of the next block of frames are
+prefetched on a background thread.
+
+Datasets live under DATASETS_DIR; paths in configs are relative to it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+DATASETS_DIR = Path(__file__).parent.parent / "data" / "datasets"
+CACHE_DIR = Path(__file__).parent.parent / "data" / "dataset_cache"
+
+_DEFAULT_THRESHOLD = 0.5
+_PREPROCESS_CHUNK = 1024
+
+
+def resolve_dataset_path(path: str) -> Path:
+    """Resolve a config path inside DATASETS_DIR. Raises ValueError if it escapes it."""
+    root = DATASETS_DIR.resolve()
+    resolved = (root / path).resolve()
+    if root != resolved and root not in resolved.parents:
+        raise ValueError(f"Dataset path must be inside {DATASETS_DIR}: {path!r}")
+    if not resolved.is_file():
+        raise FileNotFoundError(f"Dataset not found: {path!r}")
+    return resolved
+
+
+def _open_source(path: Path, image_shape: tuple[int, int] | None) -> np.ndarray:
+    """Memory-map the source stack as uint8 [n, h, w]."""
+    if path.suffix == ".npy":
+        stack = np.load(path, mmap_mode="r")
+        if stack.dtype != np.uint8 or stack.ndim != 3:
+            raise ValueError(
+                f"Expected a uint8 array of shape (n, h, w), got {stack.dtype} {stack.shape}"
+            )
+        return stack
+    if image_shape is None:
+        raise ValueError("Raw datasets need input.image_shape: [height, width]")
+    h, w = image_shape
+    n = path.stat().st_size // (h * w)
+    return np.memmap(path, dtype=np.uint8, mode="r", shape=(n, h, w))
+
+
+def _preprocess(
+    source: np.ndarray,
+    resolution: int,
+    threshold: float,
+    out_path: Path,
+) -> None:
+    """Resize + threshold every image once, writing a [n, res*res] 0/1 uint8 stack."""
+    n = source.shape[0]
+    tmp_path = out_path.with_suffix(f".{os.getpid()}.tmp")
+    out = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=np.uint8, shape=(n, resolution * resolution)
+    )
+    level = threshold * 255.0
+    for start in range(0, n, _PREPROCESS_CHUNK):
+        chunk = source[start : start + _PREPROCESS_CHUNK]
+        if chunk.shape[1:] == (resolution, resolution):
+            resized = np.asarray(chunk, dtype=np.float32)
+        else:
+            resized = np.stack([
+                np.asarray(
+                    Image.fromarray(img).resize((resolution, resolution), Image.Resampling.BOX),
+                    dtype=np.float32,
+                )
+                for img in chunk
+            ])
+        out[start : start + len(chunk)] = (resized > level).reshape(len(chunk), -1)
+    out.flush()
+    del out
+    os.replace(tmp_path, out_path)
+
+
+class ImageDataset:
+    """Preprocessed, memory-mapped image stack with prefetching reads."""
+
+    def __init__(
+        self,
+        path: str,
+        resolution: int,
+        threshold: float = _DEFAULT_THRESHOLD,
+        image_shape: tuple[int, int] | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Open (and preprocess on first use) a dataset.
+
+        Args:
+            path: File path relative to DATASETS_DIR (.npy or raw uint8).
+            resolution: Output grid size (square).
+            threshold: Pixel level in [0, 1] above which a pixel is active.
+            image_shape: (height, width) of each image, required for raw files.
+            cache_dir: Where preprocessed stacks are stored (default CACHE_DIR).
+        """
+        source_path = resolve_dataset_path(path)
+        self.resolution = resolution
+        self.path = path
+
+        stat = source_path.stat()
+        key = hashlib.sha1(
+            f"{source_path}|{stat.st_size}|{stat.st_mtime_ns}|{resolution}|{threshold}|{image_shape}".encode()
+        ).hexdigest()[:16]
+        cache_dir = cache_dir or CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = cache_dir / f"{source_path.stem}_{resolution}_{key}.npy"
+        if not cache_path.is_file():
+            _preprocess(_open_source(source_path, image_shape), resolution, threshold, cache_path)
+
+        self._frames: np.ndarray = np.load(cache_path, mmap_mode="r")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataset-prefetch")
+        self._pending: tuple[int, int, Future] | None = None
+
+    def __len__(self) -> int:
+        return self._frames.shape[0]
+
+    def _read(self, start: int, count: int) -> np.ndarray:
+        """Read frames [start, start + count) with wrap-around → float32 [count, res*res]."""
+        n = len(self)
+        start %= n
+        end = start + count
+        if end <= n:
+            block = self._frames[start:end]
+        else:
+            block = np.concatenate([
+                self._frames[start:],
+                self._frames[np.arange(end - n) % n],
+            ])
+        return block.astype(np.float32)
+
+    def read(self, start: int, count: int) -> np.ndarray:
+        """Return frames [start, start + count), using a prefetched read if one matches."""
+        pending = self._pending
+        if pending is not None and pending[0] == start % len(self) and pending[1] == count:
+            self._pending = None
+            return pending[2].result()
+        return self._read(start, count)
+
+    def prefetch(self, start: int, count: int) -> None:
+        """Start reading frames [start, start + count) on the background thread."""
+        future = self._executor.submit(self._read, start, count)
+        self._pending = (start % len(self), count, future)
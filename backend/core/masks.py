@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import math
 import random as _random_mod
-from typing import Any
+from typing import Any, Callable
+
+import numpy as np
 
 
 MaskDef = list[dict[str, Any]]
@@ -281,174 +283,291 @@ def compile_deamon_wiring(wiring: DeamonWiringDef) -> MaskDef:
 # ---------------------------------------------------------------------------
 # Mask presets
 # ---------------------------------------------------------------------------
+# Each preset mask is a factory registered with @_preset_mask. Factories run
+# on the first get_mask() of their preset and the result is memoized, so
+# importing this module builds no offsets at all.
+
+_MASK_FACTORIES: dict[str, Callable[[], MaskDef]] = {}
+_mask_cache: dict[str, MaskDef] = {}
+
+
+def _preset_mask(preset_id: str) -> Callable[[Callable[[], MaskDef]], Callable[[], MaskDef]]:
+    """Register a lazy mask factory for a preset ID."""
+    def register(factory: Callable[[], MaskDef]) -> Callable[[], MaskDef]:
+        _MASK_FACTORIES[preset_id] = factory
+        return factory
+    return register
+
 
 # Diagnostic masks — minimal single-dendrite cases for validating activation flow
-MASK_ALL_EXC: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-]
+@_preset_mask("all_exc")
+def _mask_all_exc() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+    ]
+
+
+@_preset_mask("all_inh")
+def _mask_all_inh() -> MaskDef:
+    return [
+        {"peso_dendrita": -1.0, "offsets": _moore(1)},
+    ]
 
-MASK_ALL_INH: MaskDef = [
-    {"peso_dendrita": -1.0, "offsets": _moore(1)},
-]
 
 # simple — Mexican hat mask (Moore r=1 exc, 12 inhibitory sectors r=2-4)
-MASK_SIMPLE: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 4), -1.0, 12),
-]
-
-MASK_WIDE_HAT: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 7), -1.0, 12),
-]
-
-MASK_NARROW_HAT: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 3), -1.0, 12),
-]
-
-MASK_BIG_CENTER: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(4, 7), -1.0, 12),
-]
-
-MASK_BIG_CENTER_WIDE_INH: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(4, 10), -1.0, 12),
-]
-
-MASK_SMALL_CENTER_GAP_WIDE_INH_X2: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(3, 13), -1.0, 12),
-]
-
-MASK_BIG_CENTER_WIDE_INH_X2: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(4, 14), -1.0, 12),
-]
-
-MASK_XL_CENTER_GAP_WIDE_INH_X2: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(5, 15), -1.0, 12),
-]
-
-MASK_DEAMON_3_EN_50: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(5, 15), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_UP: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 0, 1)},
-    *_make_inhibitory(_shift(_ring(5, 15), 0, 1), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_DOWN: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 0, -1)},
-    *_make_inhibitory(_shift(_ring(5, 15), 0, -1), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_LEFT: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 1, 0)},
-    *_make_inhibitory(_shift(_ring(5, 15), 1, 0), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_RIGHT: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), -1, 0)},
-    *_make_inhibitory(_shift(_ring(5, 15), -1, 0), -1.0, 12),
-]
-
-MASK_DEAMON_1_EN_50: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_sparse_ring(5, 35, step=2), -1.0, 12),
-]
-
-MASK_DEAMON_1_5_EN_50: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(7, 17), -1.0, 12),
-]
-
-MASK_DEAMON_1_5_EN_50_G6: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(10, 20), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I11: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(16, 26), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I5: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(16, 20), -1.0, 12),
-]
-
-MASK_DEAMON_E1_G12_I1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(14, 14), -1.0, 12),
-]
-
-MASK_DEAMON_E2_G12_I1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(15, 15), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(16, 16), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I3: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(16, 18), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I3_DE3_DI3: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(3), 1 / 3, seed=42)},
-    *_make_inhibitory(_random_sparse(_ring(16, 18), 1 / 3, seed=43), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I3_DE1_DI3: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_random_sparse(_ring(16, 18), 1 / 3, seed=43), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G12_I3_DE3_DI1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(3), 1 / 3, seed=42)},
-    *_make_inhibitory(_ring(16, 18), -1.0, 12),
-]
-
-MASK_DEAMON_E2_G3_I3_DE1_5_DI1_5: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(2), 2 / 3, seed=44)},
-    *_make_inhibitory(_random_sparse(_ring(6, 8), 2 / 3, seed=45), -1.0, 12),
-]
-
-MASK_DEAMON_E2_G3_I3_DE1_DI1_5: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_random_sparse(_ring(6, 8), 2 / 3, seed=45), -1.0, 12),
-]
-
-MASK_DEAMON_E2_G3_I3_DE1_DI1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(6, 8), -1.0, 12),
-]
-
-MASK_DEAMON_E2_G6_I3_DE1_DI1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(2)},
-    *_make_inhibitory(_ring(9, 11), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G8_I3_DE1_DI1_1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_random_sparse(_ring(12, 14), 1 / 1.1, seed=43), -1.0, 12),
-]
-
-MASK_DEAMON_E3_G2_I12_DE1_DI1: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(3)},
-    *_make_inhibitory(_ring(6, 17), -1.0, 12),
-]
+@_preset_mask("simple")
+def _mask_simple() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 4), -1.0, 12),
+    ]
+
+
+@_preset_mask("wide_hat")
+def _mask_wide_hat() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 7), -1.0, 12),
+    ]
+
+
+@_preset_mask("narrow_hat")
+def _mask_narrow_hat() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 3), -1.0, 12),
+    ]
+
+
+@_preset_mask("big_center")
+def _mask_big_center() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(4, 7), -1.0, 12),
+    ]
+
+
+@_preset_mask("big_center_wide_inh")
+def _mask_big_center_wide_inh() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(4, 10), -1.0, 12),
+    ]
+
+
+@_preset_mask("small_center_gap_wide_inh_x2")
+def _mask_small_center_gap_wide_inh_x2() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(3, 13), -1.0, 12),
+    ]
+
+
+@_preset_mask("big_center_wide_inh_x2")
+def _mask_big_center_wide_inh_x2() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(4, 14), -1.0, 12),
+    ]
+
+
+@_preset_mask("xl_center_gap_wide_inh_x2")
+def _mask_xl_center_gap_wide_inh_x2() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(5, 15), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_3_en_50")
+def _mask_deamon_3_en_50() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(5, 15), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g1_i11_de1_di1_move_up")
+def _mask_deamon_e3_g1_i11_de1_di1_move_up() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 0, 1)},
+        *_make_inhibitory(_shift(_ring(5, 15), 0, 1), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g1_i11_de1_di1_move_down")
+def _mask_deamon_e3_g1_i11_de1_di1_move_down() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 0, -1)},
+        *_make_inhibitory(_shift(_ring(5, 15), 0, -1), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g1_i11_de1_di1_move_left")
+def _mask_deamon_e3_g1_i11_de1_di1_move_left() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), 1, 0)},
+        *_make_inhibitory(_shift(_ring(5, 15), 1, 0), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g1_i11_de1_di1_move_right")
+def _mask_deamon_e3_g1_i11_de1_di1_move_right() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _shift(_moore(3), -1, 0)},
+        *_make_inhibitory(_shift(_ring(5, 15), -1, 0), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_1_en_50")
+def _mask_deamon_1_en_50() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_sparse_ring(5, 35, step=2), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_1_5_en_50")
+def _mask_deamon_1_5_en_50() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(7, 17), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_1_5_en_50_g6")
+def _mask_deamon_1_5_en_50_g6() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(10, 20), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i11")
+def _mask_deamon_e3_g12_i11() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(16, 26), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i5")
+def _mask_deamon_e3_g12_i5() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(16, 20), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e1_g12_i1")
+def _mask_deamon_e1_g12_i1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(14, 14), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e2_g12_i1")
+def _mask_deamon_e2_g12_i1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(15, 15), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i1")
+def _mask_deamon_e3_g12_i1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(16, 16), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i3")
+def _mask_deamon_e3_g12_i3() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(16, 18), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i3_de3_di3")
+def _mask_deamon_e3_g12_i3_de3_di3() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(3), 1 / 3, seed=42)},
+        *_make_inhibitory(_random_sparse(_ring(16, 18), 1 / 3, seed=43), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i3_de1_di3")
+def _mask_deamon_e3_g12_i3_de1_di3() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_random_sparse(_ring(16, 18), 1 / 3, seed=43), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g12_i3_de3_di1")
+def _mask_deamon_e3_g12_i3_de3_di1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(3), 1 / 3, seed=42)},
+        *_make_inhibitory(_ring(16, 18), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e2_g3_i3_de1_5_di1_5")
+def _mask_deamon_e2_g3_i3_de1_5_di1_5() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _random_sparse(_moore(2), 2 / 3, seed=44)},
+        *_make_inhibitory(_random_sparse(_ring(6, 8), 2 / 3, seed=45), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e2_g3_i3_de1_di1_5")
+def _mask_deamon_e2_g3_i3_de1_di1_5() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_random_sparse(_ring(6, 8), 2 / 3, seed=45), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e2_g3_i3_de1_di1")
+def _mask_deamon_e2_g3_i3_de1_di1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(6, 8), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e2_g6_i3_de1_di1")
+def _mask_deamon_e2_g6_i3_de1_di1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(2)},
+        *_make_inhibitory(_ring(9, 11), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g8_i3_de1_di1_1")
+def _mask_deamon_e3_g8_i3_de1_di1_1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_random_sparse(_ring(12, 14), 1 / 1.1, seed=43), -1.0, 12),
+    ]
+
+
+@_preset_mask("deamon_e3_g2_i12_de1_di1")
+def _mask_deamon_e3_g2_i12_de1_di1() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(3)},
+        *_make_inhibitory(_ring(6, 17), -1.0, 12),
+    ]
+
 
 # Same topology, fixed synapse weights (random_weights=False in the preset)
-MASK_DEAMON_E3_G2_I12_DE1_DI1_WE1_WI1: MaskDef = MASK_DEAMON_E3_G2_I12_DE1_DI1
+@_preset_mask("deamon_e3_g2_i12_de1_di1_we1_wi1")
+def _mask_deamon_e3_g2_i12_de1_di1_we1_wi1() -> MaskDef:
+    return get_mask("deamon_e3_g2_i12_de1_di1")
+
 
 # Discrete Mexican-hat approximation: gradient weights per ring, square shape
 _WIRING_MHAT_SQ: DeamonWiringDef = {
@@ -463,82 +582,122 @@ _WIRING_MHAT_SQ: DeamonWiringDef = {
         "weights": [0.50, 0.85, 0.70, 0.60, 0.55, 0.40, 0.30, 0.25, 0.20, 0.15, 0.10],
     },
 }
-MASK_DEAMON_E3_G2_I12_MHAT_SQ: MaskDef = compile_deamon_wiring(_WIRING_MHAT_SQ)
-
-MASK_BIG_CENTER_SOFT_WIDE_INH: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    {"peso_dendrita": 0.7, "offsets": _ring(2, 2)},
-    *_make_inhibitory(_ring(4, 10), -1.0, 12),
-]
-
-MASK_CROSS_CENTER: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _von_neumann(1)},
-    *_make_inhibitory(_ring(2, 4), -1.0, 4),
-]
-
-MASK_ONE_DENDRITE: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    {"peso_dendrita": -1.0, "offsets": _ring(2, 4)},
-]
-
-MASK_FINE_GRAIN: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 4), -1.0, 16),
-]
-
-MASK_DOUBLE_RING: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 3), -1.0, 12),
-    *_make_inhibitory(_ring(5, 7), -0.5, 12),
-]
-
-MASK_SOFT_INHIBIT: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 4), -0.5, 12),
-]
-
-MASK_STRONG_CENTER: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    {"peso_dendrita": 1.0, "offsets": _moore(1)},
-    *_make_inhibitory(_ring(2, 4), -1.0, 12),
-]
-
-MASK_GRADUAL_CENTER: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
-    {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
-    *_make_inhibitory(_sparse_ring(6, 11), -1.0, 12),
-]
-
-MASK_GRADUAL_BIG_INH: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
-    {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
-    *_make_inhibitory(_sparse_ring(8, 19, step=3), -1.0, 12),
-]
-
-MASK_GRADUAL_XXL_INH: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
-    {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
-    *_make_inhibitory(_sparse_ring(8, 30, step=4), -1.0, 12),
-]
-
-MASK_GRADUAL_XXL_INH_SMALL: MaskDef = [
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    *_make_inhibitory(_sparse_ring(5, 30, step=4), -1.0, 12),
-]
-
-MASK_MEXICAN_HAT: MaskDef = [
-    # Excitatory peak — sharp falloff
-    {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
-    {"peso_dendrita": 0.5, "offsets": _ring(2, 2)},
-    # Inhibitory profile — strong near center, decays with distance
-    *_make_inhibitory(_ring(3, 5), -1.0, 12),
-    *_make_inhibitory(_sparse_ring(6, 12, step=2), -0.6, 12),
-    *_make_inhibitory(_sparse_ring(13, 20, step=3), -0.25, 12),
-    *_make_inhibitory(_sparse_ring(21, 30, step=5), -0.08, 12),
-]
+
+
+@_preset_mask("deamon_e3_g2_i12_mhat_sq")
+def _mask_deamon_e3_g2_i12_mhat_sq() -> MaskDef:
+    return compile_deamon_wiring(_WIRING_MHAT_SQ)
+
+
+@_preset_mask("big_center_soft_wide_inh")
+def _mask_big_center_soft_wide_inh() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        {"peso_dendrita": 0.7, "offsets": _ring(2, 2)},
+        *_make_inhibitory(_ring(4, 10), -1.0, 12),
+    ]
+
+
+@_preset_mask("cross_center")
+def _mask_cross_center() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _von_neumann(1)},
+        *_make_inhibitory(_ring(2, 4), -1.0, 4),
+    ]
+
+
+@_preset_mask("one_dendrite")
+def _mask_one_dendrite() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        {"peso_dendrita": -1.0, "offsets": _ring(2, 4)},
+    ]
+
+
+@_preset_mask("fine_grain")
+def _mask_fine_grain() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 4), -1.0, 16),
+    ]
+
+
+@_preset_mask("double_ring")
+def _mask_double_ring() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 3), -1.0, 12),
+        *_make_inhibitory(_ring(5, 7), -0.5, 12),
+    ]
+
+
+@_preset_mask("soft_inhibit")
+def _mask_soft_inhibit() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 4), -0.5, 12),
+    ]
+
+
+@_preset_mask("strong_center")
+def _mask_strong_center() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        {"peso_dendrita": 1.0, "offsets": _moore(1)},
+        *_make_inhibitory(_ring(2, 4), -1.0, 12),
+    ]
+
+
+@_preset_mask("gradual_center")
+def _mask_gradual_center() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
+        {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
+        *_make_inhibitory(_sparse_ring(6, 11), -1.0, 12),
+    ]
+
+
+@_preset_mask("gradual_big_inh")
+def _mask_gradual_big_inh() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
+        {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
+        *_make_inhibitory(_sparse_ring(8, 19, step=3), -1.0, 12),
+    ]
+
+
+@_preset_mask("gradual_xxl_inh")
+def _mask_gradual_xxl_inh() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        {"peso_dendrita": 0.6, "offsets": _ring(2, 2)},
+        {"peso_dendrita": 0.3, "offsets": _ring(3, 3)},
+        *_make_inhibitory(_sparse_ring(8, 30, step=4), -1.0, 12),
+    ]
+
+
+@_preset_mask("gradual_xxl_inh_small")
+def _mask_gradual_xxl_inh_small() -> MaskDef:
+    return [
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        *_make_inhibitory(_sparse_ring(5, 30, step=4), -1.0, 12),
+    ]
+
+
+@_preset_mask("mexican_hat")
+def _mask_mexican_hat() -> MaskDef:
+    return [
+        # Excitatory peak — sharp falloff
+        {"peso_dendrita": 1.0, "offsets": _ring(1, 1)},
+        {"peso_dendrita": 0.5, "offsets": _ring(2, 2)},
+        # Inhibitory profile — strong near center, decays with distance
+        *_make_inhibitory(_ring(3, 5), -1.0, 12),
+        *_make_inhibitory(_sparse_ring(6, 12, step=2), -0.6, 12),
+        *_make_inhibitory(_sparse_ring(13, 20, step=3), -0.25, 12),
+        *_make_inhibitory(_sparse_ring(21, 30, step=5), -0.08, 12),
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -571,8 +730,14 @@ def _wolfram_mask(rule: int) -> MaskDef:
     return dendrites
 
 
-MASK_RULE_110 = _wolfram_mask(110)
-MASK_RULE_30 = _wolfram_mask(30)
+@_preset_mask("rule_110")
+def _mask_rule_110() -> MaskDef:
+    return _wolfram_mask(110)
+
+
+@_preset_mask("rule_30")
+def _mask_rule_30() -> MaskDef:
+    return _wolfram_mask(30)
 
 
 # ---------------------------------------------------------------------------
@@ -588,7 +753,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_3_EN_50,
     },
     "deamon_e3_g1_i11_de1_di1_move_up": {
         "id": "deamon_e3_g1_i11_de1_di1_move_up",
@@ -598,7 +762,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15 shifted 1px down, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_UP,
     },
     "deamon_e3_g1_i11_de1_di1_move_down": {
         "id": "deamon_e3_g1_i11_de1_di1_move_down",
@@ -608,7 +771,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15 shifted 1px up, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_DOWN,
     },
     "deamon_e3_g1_i11_de1_di1_move_left": {
         "id": "deamon_e3_g1_i11_de1_di1_move_left",
@@ -618,7 +780,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15 shifted 1px right, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_LEFT,
     },
     "deamon_e3_g1_i11_de1_di1_move_right": {
         "id": "deamon_e3_g1_i11_de1_di1_move_right",
@@ -628,7 +789,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15 shifted 1px left, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G1_I11_DE1_DI1_MOVE_RIGHT,
     },
     "deamon_1_en_50": {
         "id": "deamon_1_en_50",
@@ -638,7 +798,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-35 sparse step=2, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_1_EN_50,
     },
     "deamon_1_5_en_50": {
         "id": "deamon_1_5_en_50",
@@ -648,7 +807,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=7-17, gap r=4-6 silence (x3)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_1_5_EN_50,
     },
     "deamon_1_5_en_50_g6": {
         "id": "deamon_1_5_en_50_g6",
@@ -658,7 +816,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=10-20, gap r=4-9 silence (x6)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_1_5_EN_50_G6,
     },
     "deamon_e3_g12_i11": {
         "id": "deamon_e3_g12_i11",
@@ -668,7 +825,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-26, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I11,
     },
     "deamon_e3_g12_i5": {
         "id": "deamon_e3_g12_i5",
@@ -678,7 +834,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-20, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I5,
     },
     "deamon_e1_g12_i1": {
         "id": "deamon_e1_g12_i1",
@@ -688,7 +843,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=14, gap r=2-13 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E1_G12_I1,
     },
     "deamon_e2_g12_i1": {
         "id": "deamon_e2_g12_i1",
@@ -698,7 +852,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=15, gap r=3-14 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E2_G12_I1,
     },
     "deamon_e3_g12_i1": {
         "id": "deamon_e3_g12_i1",
@@ -708,7 +861,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I1,
     },
     "deamon_e3_g12_i3": {
         "id": "deamon_e3_g12_i3",
@@ -718,7 +870,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-18, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I3,
     },
     "deamon_e3_g12_i3_de3_di3": {
         "id": "deamon_e3_g12_i3_de3_di3",
@@ -728,7 +879,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-18 sparse ~33%, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I3_DE3_DI3,
     },
     "deamon_e3_g12_i3_de1_di3": {
         "id": "deamon_e3_g12_i3_de1_di3",
@@ -738,7 +888,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-18 sparse ~33%, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I3_DE1_DI3,
     },
     "deamon_e3_g12_i3_de3_di1": {
         "id": "deamon_e3_g12_i3_de3_di1",
@@ -748,7 +897,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=16-18 full, gap r=4-15 silence (x12)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G12_I3_DE3_DI1,
     },
     "deamon_e2_g3_i3_de1_5_di1_5": {
         "id": "deamon_e2_g3_i3_de1_5_di1_5",
@@ -758,7 +906,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-8 sparse ~67%, gap r=3-5 silence (x3)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E2_G3_I3_DE1_5_DI1_5,
     },
     "deamon_e2_g3_i3_de1_di1_5": {
         "id": "deamon_e2_g3_i3_de1_di1_5",
@@ -768,7 +915,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-8 sparse ~67%, gap r=3-5 silence (x3)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E2_G3_I3_DE1_DI1_5,
     },
     "deamon_e2_g3_i3_de1_di1": {
         "id": "deamon_e2_g3_i3_de1_di1",
@@ -778,7 +924,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-8 full, gap r=3-5 silence (x3)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E2_G3_I3_DE1_DI1,
     },
     "deamon_e2_g6_i3_de1_di1": {
         "id": "deamon_e2_g6_i3_de1_di1",
@@ -788,7 +933,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=9-11 full, gap r=3-8 silence (x6)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E2_G6_I3_DE1_DI1,
     },
     "deamon_e3_g8_i3_de1_di1_1": {
         "id": "deamon_e3_g8_i3_de1_di1_1",
@@ -798,7 +942,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=12-14 sparse ~91%, gap r=4-11 silence (x8)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G8_I3_DE1_DI1_1,
     },
     "deamon_e3_g2_i12_de1_di1": {
         "id": "deamon_e3_g2_i12_de1_di1",
@@ -808,7 +951,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-17 full, gap r=4-5 silence (x2)",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_DEAMON_E3_G2_I12_DE1_DI1,
     },
     "deamon_e3_g2_i12_de1_di1_we1_wi1": {
         "id": "deamon_e3_g2_i12_de1_di1_we1_wi1",
@@ -818,7 +960,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-17 full, gap r=4-5 silence (x2)",
         "dendrites_inh": 12,
         "random_weights": False,
-        "mask": MASK_DEAMON_E3_G2_I12_DE1_DI1_WE1_WI1,
     },
     "deamon_e3_g2_i12_mhat_sq": {
         "id": "deamon_e3_g2_i12_mhat_sq",
@@ -829,7 +970,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "dendrites_inh": 11,
         "random_weights": False,
         "wiring": _WIRING_MHAT_SQ,
-        "mask": MASK_DEAMON_E3_G2_I12_MHAT_SQ,
     },
     "all_exc": {
         "id": "all_exc",
@@ -839,7 +979,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "no inhibition",
         "dendrites_inh": 0,
         "random_weights": True,
-        "mask": MASK_ALL_EXC,
     },
     "all_inh": {
         "id": "all_inh",
@@ -849,7 +988,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "no excitation",
         "dendrites_inh": 1,
         "random_weights": True,
-        "mask": MASK_ALL_INH,
     },
     "simple": {
         "id": "simple",
@@ -859,7 +997,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, 8 blocks 3x3",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_SIMPLE,
     },
     "wide_hat": {
         "id": "wide_hat",
@@ -869,7 +1006,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-7, large corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_WIDE_HAT,
     },
     "narrow_hat": {
         "id": "narrow_hat",
@@ -879,7 +1015,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-3, close corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_NARROW_HAT,
     },
     "big_center": {
         "id": "big_center",
@@ -889,7 +1024,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=4-7, far corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_BIG_CENTER,
     },
     "big_center_wide_inh": {
         "id": "big_center_wide_inh",
@@ -899,7 +1033,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=4-10, extended corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_BIG_CENTER_WIDE_INH,
     },
     "small_center_gap_wide_inh_x2": {
         "id": "small_center_gap_wide_inh_x2",
@@ -909,7 +1042,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=3-13, gap r=2 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_SMALL_CENTER_GAP_WIDE_INH_X2,
     },
     "big_center_wide_inh_x2": {
         "id": "big_center_wide_inh_x2",
@@ -919,7 +1051,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=4-14, very extended corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_BIG_CENTER_WIDE_INH_X2,
     },
     "xl_center_gap_wide_inh_x2": {
         "id": "xl_center_gap_wide_inh_x2",
@@ -929,7 +1060,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-15, gap r=4 silence",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_XL_CENTER_GAP_WIDE_INH_X2,
     },
     "big_center_soft_wide_inh": {
         "id": "big_center_soft_wide_inh",
@@ -939,7 +1069,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=4-10, extended corona",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_BIG_CENTER_SOFT_WIDE_INH,
     },
     "cross_center": {
         "id": "cross_center",
@@ -949,7 +1078,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, 4 cardinal blocks",
         "dendrites_inh": 4,
         "random_weights": True,
-        "mask": MASK_CROSS_CENTER,
     },
     "one_dendrite": {
         "id": "one_dendrite",
@@ -959,7 +1087,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, all in 1 dendrite",
         "dendrites_inh": 1,
         "random_weights": True,
-        "mask": MASK_ONE_DENDRITE,
     },
     "fine_grain": {
         "id": "fine_grain",
@@ -969,7 +1096,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, 16 sectors",
         "dendrites_inh": 16,
         "random_weights": True,
-        "mask": MASK_FINE_GRAIN,
     },
     "double_ring": {
         "id": "double_ring",
@@ -979,7 +1105,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-3 (-1) + r=5-7 (-0.5)",
         "dendrites_inh": 24,
         "random_weights": True,
-        "mask": MASK_DOUBLE_RING,
     },
     "soft_inhibit": {
         "id": "soft_inhibit",
@@ -989,7 +1114,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, weight -0.5",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_SOFT_INHIBIT,
     },
     "strong_center": {
         "id": "strong_center",
@@ -999,7 +1123,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=2-4, weight -1",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_STRONG_CENTER,
     },
     "gradual_center": {
         "id": "gradual_center",
@@ -1009,7 +1132,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=6-11, checkerboard sparse",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_GRADUAL_CENTER,
     },
     "gradual_big_inh": {
         "id": "gradual_big_inh",
@@ -1019,7 +1141,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=8-19, sparse step=3",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_GRADUAL_BIG_INH,
     },
     "gradual_xxl_inh": {
         "id": "gradual_xxl_inh",
@@ -1029,7 +1150,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=8-30, sparse step=4",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_GRADUAL_XXL_INH,
     },
     "gradual_xxl_inh_small": {
         "id": "gradual_xxl_inh_small",
@@ -1039,7 +1159,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=5-30, sparse step=4",
         "dendrites_inh": 12,
         "random_weights": True,
-        "mask": MASK_GRADUAL_XXL_INH_SMALL,
     },
     "mexican_hat": {
         "id": "mexican_hat",
@@ -1049,7 +1168,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "corona": "r=3-5(-1) → r=6-12(-0.6) → r=13-20(-0.25) → r=21-30(-0.08)",
         "dendrites_inh": 48,
         "random_weights": True,
-        "mask": MASK_MEXICAN_HAT,
     },
     "rule_110": {
         "id": "rule_110",
@@ -1060,7 +1178,6 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "dendrites_inh": 0,
         "random_weights": False,
         "mask_type": "wolfram",
-        "mask": MASK_RULE_110,
     },
     "rule_30": {
         "id": "rule_30",
@@ -1071,14 +1188,29 @@ MASK_PRESETS: dict[str, dict[str, Any]] = {
         "dendrites_inh": 0,
         "random_weights": False,
         "mask_type": "wolfram",
-        "mask": MASK_RULE_30,
     },
 }
 
 
 def get_mask(mask_id: str) -> MaskDef:
-    """Get a mask definition by its ID. Raises KeyError if not found."""
-    return MASK_PRESETS[mask_id]["mask"]
+    """Get a mask definition by its ID. Raises KeyError if not found.
+
+    The mask is built on first use and shared afterwards.
+    """
+    mask = _mask_cache.get(mask_id)
+    if mask is None:
+        if mask_id not in MASK_PRESETS:
+            raise KeyError(mask_id)
+        mask = _mask_cache.setdefault(mask_id, _MASK_FACTORIES[mask_id]())
+    return mask
+
+
+def __getattr__(name: str) -> MaskDef:
+    """Module-level MASK_<PRESET_ID> constants, materialized lazily."""
+    preset_id = name[len("MASK_"):].lower() if name.startswith("MASK_") else ""
+    if preset_id in _MASK_FACTORIES:
+        return get_mask(preset_id)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_mask_type(mask_id: str) -> str:
@@ -1091,6 +1223,51 @@ def get_random_weights(mask_id: str) -> bool:
     return MASK_PRESETS[mask_id].get("random_weights", True)
 
 
+def _flatten_mask(
+    mask: MaskDef,
+    grid_width: int,
+    grid_height: int,
+) -> dict[str, np.ndarray]:
+    """Flatten a mask into per-synapse arrays, keeping synapses inside the preview grid.
+
+    Returns arrays (all of the same length) with the synapse column/row,
+    dendrite index, dendrite weight, base synapse weight, noise amplitude
+    (NaN when the dendrite has none) and whether explicit pesos_sinapsis
+    were given.
+    """
+    cols, rows, dend, peso_d, base, noise, explicit = [], [], [], [], [], [], []
+    cx = grid_width // 2
+    cy = grid_height // 2
+    for d_idx, dendrite in enumerate(mask):
+        offsets = np.asarray(dendrite["offsets"], dtype=np.int64).reshape(-1, 2)
+        n = offsets.shape[0]
+        pesos_s = dendrite.get("pesos_sinapsis")
+        noise_amp = dendrite.get("random_noise")  # None for presets, float for inline deamons
+        cols.append(cx + offsets[:, 0])
+        rows.append(cy + offsets[:, 1])
+        dend.append(np.full(n, d_idx))
+        peso_d.append(np.full(n, float(dendrite["peso_dendrita"])))
+        base.append(np.asarray(pesos_s, dtype=np.float64) if pesos_s else np.ones(n))
+        noise.append(np.full(n, np.nan if noise_amp is None else float(noise_amp)))
+        explicit.append(np.full(n, bool(pesos_s)))
+
+    if not cols:
+        empty = np.zeros(0)
+        return {k: empty for k in ("col", "row", "dend", "peso_d", "base", "noise", "explicit")}
+
+    col, row = np.concatenate(cols), np.concatenate(rows)
+    inside = (col >= 0) & (col < grid_width) & (row >= 0) & (row < grid_height)
+    return {
+        "col": col[inside],
+        "row": row[inside],
+        "dend": np.concatenate(dend)[inside],
+        "peso_d": np.concatenate(peso_d)[inside],
+        "base": np.concatenate(base)[inside],
+        "noise": np.concatenate(noise)[inside],
+        "explicit": np.concatenate(explicit)[inside],
+    }
+
+
 def _compute_preview_grid(
     mask: MaskDef,
     grid_width: int = 50,
@@ -1104,39 +1281,50 @@ def _compute_preview_grid(
     random_weights=True) or uses 1.0 (if random_weights=False), and computes
     ``effective_weight = synapse_peso × dendrite_peso``, matching how
     ``inspect()`` displays real connections.  When multiple dendrites share a
-    source cell, effective weights are summed and clamped to [-1, 1].
+    source cell, effective weights are added in mask order and the running
+    sum is clamped to [-1, 1] after each addition.
     """
-    rng = _random_mod.Random(42)
-
-    center_x = grid_width // 2
-    center_y = grid_height // 2
-
-    grid: list[list[float | None]] = [[None] * grid_width for _ in range(grid_height)]
-    grid[center_y][center_x] = 999.0
-
-    for dendrite in mask:
-        peso_d: float = dendrite["peso_dendrita"]
-        pesos_s = dendrite.get("pesos_sinapsis")
-        noise_amp = dendrite.get("random_noise")  # None for presets, float for inline deamons
-        for i, (dx, dy) in enumerate(dendrite["offsets"]):
-            col = center_x + dx
-            row = center_y + dy
-            if 0 <= row < grid_height and 0 <= col < grid_width:
-                base = pesos_s[i] if pesos_s else 1.0
-                if not random_weights:
-                    syn_w = base
-                elif noise_amp is not None:
-                    scale = rng.uniform(1.0 - noise_amp, 1.0) if noise_amp > 0 else 1.0
-                    syn_w = base * scale
-                else:
-                    syn_w = base * rng.random() if pesos_s else rng.random()
-                effective = syn_w * peso_d
-                existing = grid[row][col]
-                if existing is not None and existing != 999.0:
-                    effective = max(-1.0, min(1.0, existing + effective))
-                grid[row][col] = effective
-
-    return grid
+    syn = _flatten_mask(mask, grid_width, grid_height)
+    syn_w = syn["base"].copy()
+
+    if random_weights and syn_w.size:
+        # One draw per synapse in mask order, except noise-free dendrites
+        has_noise = ~np.isnan(syn["noise"])
+        draws = ~has_noise | (syn["noise"] > 0)
+        rng = _random_mod.Random(42)
+        u = np.zeros(syn_w.size)
+        u[draws] = [rng.random() for _ in range(int(draws.sum()))]
+        noisy = has_noise & draws
+        # uniform(1 - a, 1) == (1 - a) + a * u
+        syn_w[noisy] *= (1.0 - syn["noise"][noisy]) + syn["noise"][noisy] * u[noisy]
+        syn_w[~has_noise] *= u[~has_noise]
+
+    cells = syn["row"] * grid_width + syn["col"]
+    size = grid_width * grid_height
+    effective = syn_w * syn["peso_d"]
+    sums = np.zeros(size)
+    np.add.at(sums, cells, effective)
+    counts = np.bincount(cells, minlength=size)
+    values = np.where(counts > 1, np.clip(sums, -1.0, 1.0), sums)
+    # The running sum is clamped after every addition. With one sign that is
+    # the same as clamping the total; mixed-sign cells are replayed in order.
+    mixed = (np.bincount(cells, effective > 0, minlength=size) > 0) & (
+        np.bincount(cells, effective < 0, minlength=size) > 0
+    )
+    for cell in np.flatnonzero(mixed):
+        contributions = effective[cells == cell]
+        total = contributions[0]
+        for value in contributions[1:]:
+            total = max(-1.0, min(1.0, total + value))
+        values[cell] = total
+
+    grid = np.full(size, None, dtype=object)
+    hit = counts > 0
+    grid[hit] = values[hit]
+    center = (grid_height // 2) * grid_width + grid_width // 2
+    if not hit[center]:
+        grid[center] = 999.0
+    return grid.reshape(grid_height, grid_width).tolist()
 
 
 def _compute_mask_stats(mask: MaskDef) -> dict[str, Any]:
@@ -1153,9 +1341,9 @@ def _compute_mask_stats(mask: MaskDef) -> dict[str, Any]:
 
     for dendrite in mask:
         peso: float = dendrite["peso_dendrita"]
-        offsets = dendrite["offsets"]
-        n = len(offsets)
-        max_r = max((max(abs(dx), abs(dy)) for dx, dy in offsets), default=0)
+        offsets = np.asarray(dendrite["offsets"], dtype=np.int64).reshape(-1, 2)
+        n = offsets.shape[0]
+        max_r = int(np.abs(offsets).max()) if n else 0
         if peso > 0:
             exc_synapses += n
             exc_dendrites += 1
@@ -1183,29 +1371,25 @@ def _compute_dendrite_info(
     grid_height: int,
 ) -> list[dict[str, Any]]:
     """Return per-dendrite info for the preview: centroid, avg weight, cell list."""
-    cx = grid_width // 2
-    cy = grid_height // 2
+    syn = _flatten_mask(mask, grid_width, grid_height)
+    n_dend = len(mask)
+    dend = syn["dend"].astype(np.int64)
+    counts = np.bincount(dend, minlength=n_dend)
+    sum_col = np.bincount(dend, weights=syn["col"], minlength=n_dend)
+    sum_row = np.bincount(dend, weights=syn["row"], minlength=n_dend)
+    sum_eff = np.bincount(dend, weights=syn["base"] * syn["peso_d"], minlength=n_dend)
+
+    # Synapses are grouped by dendrite in mask order
+    cells = np.stack([syn["col"], syn["row"]], axis=1).astype(np.int64).tolist()
+    bounds = np.concatenate([[0], np.cumsum(counts)]).tolist()
+
     result = []
-    for dendrite in mask:
-        peso_d: float = dendrite["peso_dendrita"]
-        pesos_s: list[float] | None = dendrite.get("pesos_sinapsis")
-        valid_cells: list[list[int]] = []
-        eff_weights: list[float] = []
-        for i, (dx, dy) in enumerate(dendrite["offsets"]):
-            col, row = cx + dx, cy + dy
-            if 0 <= col < grid_width and 0 <= row < grid_height:
-                valid_cells.append([col, row])
-                syn = pesos_s[i] if pesos_s else 1.0
-                eff_weights.append(syn * peso_d)
-        if not valid_cells:
-            continue
-        centroid_col = sum(c for c, _ in valid_cells) / len(valid_cells)
-        centroid_row = sum(r for _, r in valid_cells) / len(valid_cells)
-        avg_eff = sum(eff_weights) / len(eff_weights)
+    for d in np.flatnonzero(counts).tolist():
+        n = int(counts[d])
         result.append({
-            "centroid": [centroid_col, centroid_row],
-            "avg_effective": round(avg_eff, 4),
-            "cells": valid_cells,
+            "centroid": [float(sum_col[d]) / n, float(sum_row[d]) / n],
+            "avg_effective": round(float(sum_eff[d]) / n, 4),
+            "cells": cells[bounds[d]:bounds[d + 1]],
         })
     return result
 
@@ -1217,13 +1401,14 @@ def get_mask_info(
     """Get metadata for all mask presets (without the mask data itself)."""
     result = []
     for preset in MASK_PRESETS.values():
-        entry = {k: v for k, v in preset.items() if k != "mask"}
+        mask = get_mask(preset["id"])
+        entry = dict(preset)
         entry["preview_grid"] = _compute_preview_grid(
-            preset["mask"], grid_width, grid_height,
+            mask, grid_width, grid_height,
             random_weights=preset.get("random_weights", True),
         )
-        entry["mask_stats"] = _compute_mask_stats(preset["mask"])
-        entry["dendrites"] = _compute_dendrite_info(preset["mask"], grid_width, grid_height)
+        entry["mask_stats"] = _compute_mask_stats(mask)
+        entry["dendrites"] = _compute_dendrite_info(mask, grid_width, grid_height)
         result.append(entry)
     return result
 
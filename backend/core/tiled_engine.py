@@ -0,0 +1,254 @@
+"""TiledEngine — temporal tiling: k steps per tile while its weights stay in cache.
+
+Each procesar() step streams the whole [N, max_syn] weight block from
+memory. On grids larger than the cache that makes the step bandwidth
+bound. TiledEngine splits the tissue into tiles of whole grid rows and
+advances each tile k steps in a row, so its block is read once per k steps
+from memory and k-1 times from cache.
+
+A tile is its own rows plus a ghost zone: every cell the own rows depend
+on within k-1 steps (k-1 mask radii of rows around the tile). All of them
+are stepped, and the sources they read one step further are held frozen:
+
+    [ computed cells (own rows + ghost zone) | frozen sources (halo, input, zero neuron) ]
+
+Ghost cells go stale from the outside in, one radius per step, so after k
+steps the own rows are exact (the usual overlapping-tile trade: some
+redundant work for k times less memory traffic). Tiles are at least as
+tall as both ghost bands together, so a round never steps more than twice
+the tissue; when that does not fit in the grid there is a single tile and
+no ghost zone. Tiles read the state at
+the start of the round and are independent, so a thread pool steps them
+concurrently; results are written back once all tiles are done.
+
+Each tile runs a FusedStep over a BrainTensor of its cells, so values,
+tensions and adaptation match the fused step exactly. Learning changes
+the weights every step and is not supported: Experiment only uses the
+engine without it.
+"""
+
+from __future__ import annotations
+
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from .brain_tensor import BrainTensor
+from .fused_step import METRICA_ACTIVAS, METRICA_TENSION, FusedStep
+
+# Default tile: about this many bytes of per-synapse tensors (a typical L2)
+_TILE_BYTES = 1 << 20
+
+
+class _Tile:
+    """Own cells, ghost zone and frozen sources of one tile, as a BrainTensor."""
+
+    def __init__(self, bt: BrainTensor, propias: torch.Tensor, pasos: int) -> None:
+        indices = bt.indices_fuente.long()
+        fija = bt.mascara_entrada
+
+        # Ghost zone: what the own cells depend on within pasos - 1 steps
+        calculadas = propias
+        for _ in range(pasos - 1):
+            fuentes = indices[calculadas][bt.mascara_valida[calculadas]].unique()
+            nuevas = torch.unique(torch.cat([calculadas, fuentes[~fija[fuentes]]]))
+            if nuevas.numel() == calculadas.numel():
+                break
+            calculadas = nuevas
+        fuentes = indices[calculadas].unique()
+        externas = fuentes[~torch.isin(fuentes, calculadas)]
+
+        self.celdas = torch.cat([calculadas, externas])
+        self.propias = propias
+        nc, ne = calculadas.numel(), externas.numel()
+        mapa = torch.full((bt.valores.shape[0],), -1, dtype=torch.long, device=indices.device)
+        mapa[self.celdas] = torch.arange(nc + ne, device=indices.device)
+        self.posiciones = mapa[propias]
+        self._mapa = mapa
+        self._entrada: tuple[int, int, torch.Tensor, torch.Tensor] | None = None
+
+        # A tile that does not wrap is a contiguous block of rows: slice views
+        # of the global tensors instead of copies
+        inicio = int(calculadas[0])
+        if int(calculadas[-1]) - inicio + 1 == nc:
+            filas = slice(inicio, inicio + nc)
+        else:
+            filas = calculadas
+
+        self.bt = BrainTensor(
+            valores=torch.zeros(nc + ne, device=bt.device),
+            pesos_sinapsis=bt.pesos_sinapsis[filas],
+            indices_fuente=mapa[indices[filas]],
+            pesos_dendrita=bt.pesos_dendrita[filas],
+            mascara_valida=bt.mascara_valida[filas],
+            dendrita_ids=bt.dendrita_ids[filas],
+            max_dendritas=bt.max_dendritas,
+            # Frozen sources behave like input neurons
+            umbrales=torch.cat([bt.umbrales[calculadas], torch.zeros(ne, device=bt.device)]),
+            mascara_entrada=torch.cat([fija[calculadas], torch.ones(ne, dtype=torch.bool, device=bt.device)]),
+            n_real=nc,
+            device=bt.device,
+            max_active_steps=bt.max_active_steps,
+            refractory_steps=bt.refractory_steps,
+            adaptation_enabled=bt.adaptation_enabled,
+            process_mode=bt.process_mode,
+            tension_fns=bt.tension_fns,
+            es_exc_syn=bt.es_exc_syn[filas],
+            es_inh_syn=bt.es_inh_syn[filas],
+            es_input_syn=bt.es_input_syn[filas],
+            compact=bt.compact,
+            weight_dtype=bt.weight_dtype,
+        )
+        self.n_calculadas = nc
+        self.paso = FusedStep(self.bt)
+
+    def _posiciones_entrada(self, inicio: int, tamano: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """(local positions, frame offsets) of the input neurons this tile reads."""
+        if self._entrada is None or self._entrada[:2] != (inicio, tamano):
+            locales = self._mapa[inicio : inicio + tamano]
+            sel = locales >= 0
+            offsets = torch.nonzero(sel).flatten()
+            self._entrada = (inicio, tamano, locales[sel], offsets)
+        return self._entrada[2], self._entrada[3]
+
+    def avanzar(
+        self,
+        global_bt: BrainTensor,
+        n: int,
+        entradas: torch.Tensor | None,
+        inicio_entrada: int,
+        metricas: bool,
+    ) -> tuple[torch.Tensor, ...]:
+        """n (<= pasos) steps from the global state; returns the own cells' results."""
+        bt, nc = self.bt, self.n_calculadas
+        calculadas = self.celdas[:nc]
+        bt.valores.copy_(global_bt.valores[self.celdas])
+        bt.active_counts[:nc] = global_bt.active_counts[calculadas]
+        bt.refractory_remaining[:nc] = global_bt.refractory_remaining[calculadas]
+        if entradas is not None:
+            posiciones, offsets = self._posiciones_entrada(inicio_entrada, entradas.shape[1])
+        parciales = torch.zeros(n, 2, device=bt.device) if metricas else None
+        pos = self.posiciones
+        for k in range(n):
+            if entradas is not None:
+                bt.valores[posiciones] = entradas[k][offsets]
+            self.paso()
+            if parciales is not None:
+                parciales[k, METRICA_ACTIVAS] = (bt.valores[pos] > 0.5).sum()
+                parciales[k, METRICA_TENSION] = bt.tensiones[pos].sum()
+        return (
+            bt.valores[pos], bt.tensiones[pos],
+            bt.active_counts[pos], bt.refractory_remaining[pos], parciales,
+        )
+
+
+def _radio_filas(bt: BrainTensor, width: int, height: int) -> int:
+    """Largest row distance (on the toroidal grid) from a tissue cell to a tissue source."""
+    n_tissue = width * height
+    radio = 0
+    # Whole rows per chunk, about 1M synapses at a time
+    bloque = max(1, (1 << 20) // max(1, width * bt.indices_fuente.shape[1])) * width
+    for inicio in range(0, n_tissue, bloque):
+        fin = min(inicio + bloque, n_tissue)
+        fuentes = bt.indices_fuente[inicio:fin].long()
+        validas = bt.mascara_valida[inicio:fin] & (fuentes < n_tissue)
+        filas = torch.arange(inicio, fin, device=fuentes.device).unsqueeze(1) // width
+        dy = (fuentes // width - filas) % height
+        dy = torch.minimum(dy, height - dy)[validas]
+        if dy.numel():
+            radio = max(radio, int(dy.max()))
+    return radio
+
+
+class TiledEngine:
+    """Steps a BrainTensor's tissue in rounds of k steps per row tile (no learning)."""
+
+    def __init__(
+        self,
+        brain_tensor: BrainTensor,
+        width: int,
+        height: int,
+        pasos: int = 4,
+        filas: int | None = None,
+        hilos: int | None = None,
+    ) -> None:
+        """Build the tiles.
+
+        Args:
+            brain_tensor: The network; tissue rows (width*height) come first.
+            width, height: Tissue grid.
+            pasos: Steps per tile per round (k).
+            filas: Grid rows per tile (default: about _TILE_BYTES of synapse
+                data). Raised to the height of the two ghost bands,
+                2·(k-1)·mask radius; one tile if that leaves no room.
+            hilos: Threads stepping tiles concurrently (default: CPU count).
+        """
+        bt = brain_tensor
+        self.brain_tensor = bt
+        self.pasos = max(1, pasos)
+        self.n_tissue = width * height
+        if filas is None:
+            por_fila = width * bt.pesos_sinapsis.shape[1] * (
+                bt.pesos_sinapsis.element_size() + bt.indices_fuente.element_size() + 1
+            )
+            filas = _TILE_BYTES // max(1, por_fila)
+        # Ghost bands taller than the tile would make every tile hold (and
+        # step) most of the network
+        fantasma = 2 * (self.pasos - 1) * _radio_filas(bt, width, height) if self.pasos > 1 else 0
+        filas = max(1, filas, fantasma)
+        if filas + fantasma >= height:
+            filas = height
+        self.filas = filas
+        # Spread the rows evenly so no tile is shorter than filas
+        n_tiles = height // filas
+        limites = [i * height // n_tiles for i in range(n_tiles + 1)]
+        self.tiles = [
+            _Tile(bt, torch.arange(a * width, b * width, device=bt.device), self.pasos)
+            for a, b in zip(limites, limites[1:])
+        ]
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, min(hilos or os.cpu_count() or 1, len(self.tiles))),
+            thread_name_prefix="neuroflow-tile",
+        )
+        weakref.finalize(self, self._pool.shutdown, wait=False)
+
+    def celdas_calculadas(self) -> int:
+        """Cells stepped per round over all tiles (tissue plus ghost zones)."""
+        return sum(t.n_calculadas for t in self.tiles)
+
+    def run(
+        self,
+        n: int,
+        entradas: torch.Tensor | None = None,
+        inicio_entrada: int = 0,
+        metricas: torch.Tensor | None = None,
+        n_tejido: int | None = None,
+    ) -> None:
+        """n steps, in rounds of at most k (same arguments as FusedStep.run)."""
+        bt = self.brain_tensor
+        limite = n_tejido if n_tejido is not None else self.n_tissue
+        hecho = 0
+        while hecho < n:
+            k = min(self.pasos, n - hecho)
+            frames = entradas[hecho : hecho + k] if entradas is not None else None
+            resultados = list(self._pool.map(
+                lambda tile: tile.avanzar(bt, k, frames, inicio_entrada, metricas is not None),
+                self.tiles,
+            ))
+            # Every tile has read the round's starting state: write back
+            suma = torch.zeros(k, 2, device=bt.device) if metricas is not None else None
+            for tile, (valores, tensiones, activas, refractario, parciales) in zip(self.tiles, resultados):
+                bt.valores[tile.propias] = valores
+                bt.tensiones[tile.propias] = tensiones
+                bt.active_counts[tile.propias] = activas
+                bt.refractory_remaining[tile.propias] = refractario
+                if suma is not None:
+                    suma += parciales
+            if metricas is not None:
+                metricas[hecho : hecho + k, METRICA_ACTIVAS] = suma[:, METRICA_ACTIVAS]
+                metricas[hecho : hecho + k, METRICA_TENSION] = suma[:, METRICA_TENSION] / limite
+            hecho += k
+        if entradas is not None and n:
+            bt.valores[inicio_entrada : inicio_entrada + entradas.shape[1]] = entradas[n - 1]
@@ -0,0 +1,315 @@
+"""Process-wide registry of compiled topologies shared between BrainTensors.
+
+Sessions started from the same template compile identical connectivity:
+source indices, dendrite IDs, validity and synapse-type masks, dendrite
+weights, thresholds. compartir() hashes those tensors and, if an equal
+topology is already registered, points the BrainTensor at the registered
+tensors, so each extra session only owns its mutable state (values,
+synapse weights, tensions, adaptation counters).
+
+Shared tensors are copy-on-write by convention: BrainTensor never writes
+them in place, and code that changes one (set_dendrite_weights) assigns a
+new tensor, which detaches that field from the registry for that network
+only. Entries are reference-counted per attached BrainTensor and dropped
+when the last one is garbage-collected.
+
+Constants computed from the topology alone (a FusedStep's per-synapse
+learning rates, dendrite synapse counts) are shared the same way with
+derivado(): cached on the entry per name and parameters for as long as
+some network holds them.
+
+Across processes (several server workers), configurar_directorio() adds a
+disk tier: each topology is published once as raw files under
+<dir>/<key>/ (written to a temporary directory, then renamed into place)
+and every process maps them with torch.from_file. The mapping is private,
+so clean pages are shared by all workers through the page cache and a
+stray write would only copy one page for that process.
+
+Ownership is tracked with lease files, <dir>/<key>/leases/<pid>: a process
+holds one while it has the topology registered. When a process releases
+its last reference, or when a process configures the directory (e.g. a
+restarted worker), leases of dead processes are removed and topologies
+without live leases are deleted. Processes that already mapped the files
+keep them until they unmap them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+from pathlib import Path
+
+import torch
+
+from .brain_tensor import BrainTensor
+
+logger = logging.getLogger(__name__)
+
+# Immutable BrainTensor fields (everything else is per-network state)
+CAMPOS_TOPOLOGIA = (
+    "indices_fuente",
+    "dendrita_ids",
+    "mascara_valida",
+    "_safe_dend_ids",
+    "pesos_dendrita",
+    "_dend_pesos",
+    "_dendrita_mascara",
+    "umbrales",
+    "mascara_entrada",
+    "es_exc_syn",
+    "es_inh_syn",
+    "es_input_syn",
+)
+
+# Written last when publishing: its presence marks a complete topology
+_META = "meta.json"
+_LEASES = "leases"
+
+
+@dataclass
+class _Entrada:
+    tensores: dict[str, torch.Tensor]
+    referencias: int = 0
+    tamano: int = 0
+    ruta: Path | None = None  # published directory, when mapped from disk
+    # (name, params) → tensor derived from the topology, while referenced
+    derivados: weakref.WeakValueDictionary = field(default_factory=weakref.WeakValueDictionary)
+
+
+_registro: dict[str, _Entrada] = {}
+_registro_lock = threading.Lock()
+_directorio: Path | None = None
+
+
+def configurar_directorio(directorio: str | Path | None) -> None:
+    """Publish and map topologies under directorio (None = this process only).
+
+    Also sweeps the directory: leftovers of dead processes are removed.
+    """
+    global _directorio
+    with _registro_lock:
+        _directorio = Path(directorio) if directorio is not None else None
+        if _directorio is not None:
+            _directorio.mkdir(parents=True, exist_ok=True)
+            _barrer(_directorio)
+
+
+def clave_topologia(bt: BrainTensor) -> str:
+    """Content hash of the BrainTensor's topology fields (and their dtypes/shapes)."""
+    h = hashlib.blake2b(digest_size=32)
+    h.update(repr((bt.n_real, bt.max_dendritas, str(bt.device))).encode())
+    for nombre in CAMPOS_TOPOLOGIA:
+        t = getattr(bt, nombre)
+        h.update(f"{nombre}:{t.dtype}:{tuple(t.shape)}".encode())
+        h.update(t.detach().contiguous().cpu().view(torch.uint8).numpy().tobytes())
+    return h.hexdigest()
+
+
+def compartir(bt: BrainTensor) -> str:
+    """Attach bt to the registered copy of its topology (registering it if new).
+
+    Returns the topology key. The reference is released when bt is
+    garbage-collected.
+    """
+    clave = clave_topologia(bt)
+    with _registro_lock:
+        entrada = _registro.get(clave)
+        if entrada is None:
+            entrada = _registrar(clave, {n: getattr(bt, n) for n in CAMPOS_TOPOLOGIA}, str(bt.device))
+        elif not all(torch.equal(entrada.tensores[n], getattr(bt, n)) for n in CAMPOS_TOPOLOGIA):
+            entrada = None  # hash collision: keep this network's own tensors
+            clave = ""
+        if entrada is not None:
+            for nombre, tensor in entrada.tensores.items():
+                setattr(bt, nombre, tensor)
+            entrada.referencias += 1
+            weakref.finalize(bt, _liberar, clave)
+    bt.topologia = clave or None
+    return clave
+
+
+def _registrar(clave: str, tensores: dict[str, torch.Tensor], device: str) -> _Entrada:
+    """New registry entry, backed by the disk tier when configured (CPU only)."""
+    ruta = None
+    if _directorio is not None and device == "cpu":
+        mapeados = _publicar(_directorio / clave, tensores)
+        if mapeados is not None and all(torch.equal(mapeados[n], tensores[n]) for n in tensores):
+            tensores, ruta = mapeados, _directorio / clave
+        elif mapeados is not None:
+            logger.warning("Published topology %s does not match, keeping it in memory", clave[:12])
+            _soltar(_directorio / clave)
+    entrada = _Entrada(tensores, tamano=sum(t.numel() * t.element_size() for t in tensores.values()), ruta=ruta)
+    _registro[clave] = entrada
+    return entrada
+
+
+def _publicar(ruta: Path, tensores: dict[str, torch.Tensor]) -> dict[str, torch.Tensor] | None:
+    """Take a lease on the topology at ruta (writing it first if missing) and map it.
+
+    Returns None if the disk tier fails; the caller keeps its own tensors.
+    """
+    lease = ruta / _LEASES / str(os.getpid())
+    try:
+        if ruta.is_dir():
+            # Lease before anything else: a sweep keeps topologies with live leases
+            lease.parent.mkdir(exist_ok=True)
+            lease.touch()
+        if not (ruta / _META).is_file():
+            tmp = ruta.with_name(f".{ruta.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.mkdir(parents=True)
+            # The lease is published with the files, so the topology is never unowned
+            (tmp / _LEASES).mkdir()
+            (tmp / _LEASES / lease.name).touch()
+            meta = {}
+            for nombre, t in tensores.items():
+                t = t.detach().contiguous().cpu()
+                (tmp / f"{nombre}.bin").write_bytes(t.view(torch.uint8).numpy().tobytes())
+                meta[nombre] = {"dtype": str(t.dtype).removeprefix("torch."), "shape": list(t.shape)}
+            (tmp / _META).write_text(json.dumps(meta))
+            try:
+                os.rename(tmp, ruta)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)  # another process published it first
+                lease.parent.mkdir(exist_ok=True)
+                lease.touch()
+        meta = json.loads((ruta / _META).read_text())
+        return {nombre: _mapear(ruta / f"{nombre}.bin", m) for nombre, m in meta.items()}
+    except (OSError, ValueError, RuntimeError):
+        logger.warning("Could not share topology under %s, keeping it in memory", ruta, exc_info=True)
+        return None
+
+
+def _mapear(archivo: Path, meta: dict) -> torch.Tensor:
+    dtype = getattr(torch, meta["dtype"])
+    shape = meta["shape"]
+    numel = 1
+    for d in shape:
+        numel *= d
+    if numel == 0:
+        return torch.empty(shape, dtype=dtype)
+    # Private mapping: pages come from the shared page cache until written
+    return torch.from_file(str(archivo), shared=False, size=numel, dtype=dtype).view(shape)
+
+
+def _liberar(clave: str) -> None:
+    with _registro_lock:
+        entrada = _registro.get(clave)
+        if entrada is None:
+            return
+        entrada.referencias -= 1
+        if entrada.referencias <= 0:
+            del _registro[clave]
+            if entrada.ruta is not None:
+                _soltar(entrada.ruta)
+
+
+def _soltar(ruta: Path) -> None:
+    """Drop this process's lease on ruta, deleting the topology if no live lease remains."""
+    try:
+        (ruta / _LEASES / str(os.getpid())).unlink(missing_ok=True)
+    except OSError:
+        pass
+    _barrer_topologia(ruta)
+
+
+def _vivo(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _barrer_topologia(ruta: Path) -> None:
+    """Remove leases of dead processes; delete the topology when none is left."""
+    leases = ruta / _LEASES
+    vivos = 0
+    try:
+        for lease in leases.iterdir():
+            if lease.name.isdigit() and _vivo(int(lease.name)):
+                vivos += 1
+            else:
+                lease.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    if not vivos:
+        shutil.rmtree(ruta, ignore_errors=True)
+
+
+def _barrer(directorio: Path) -> None:
+    """Sweep every topology and the temporary directories of dead writers."""
+    for ruta in directorio.iterdir():
+        if ruta.name.startswith("."):
+            partes = ruta.name.split(".")
+            if ruta.name.endswith(".tmp") and len(partes) > 2 and partes[2].isdigit() and not _vivo(int(partes[2])):
+                shutil.rmtree(ruta, ignore_errors=True)
+        elif ruta.is_dir() and ruta.name not in {clave for clave in _registro}:
+            _barrer_topologia(ruta)
+
+
+def es_compartido(bt: BrainTensor, nombre: str) -> bool:
+    """Whether bt's field still is the registered (shared) tensor."""
+    clave = getattr(bt, "topologia", None)
+    entrada = _registro.get(clave) if clave else None
+    return entrada is not None and getattr(bt, nombre) is entrada.tensores[nombre]
+
+
+def derivado(
+    bt: BrainTensor,
+    nombre: str,
+    parametros: Hashable,
+    campos: tuple[str, ...],
+    construir: Callable[[], torch.Tensor],
+) -> torch.Tensor:
+    """construir(), shared by every network on bt's topology with the same parameters.
+
+    construir must only read bt's fields `campos` (and parametros). When
+    any of them is no longer shared, bt gets a private result.
+    """
+    clave = getattr(bt, "topologia", None)
+    if not clave or not all(es_compartido(bt, c) for c in campos):
+        return construir()
+    with _registro_lock:
+        entrada = _registro.get(clave)
+        if entrada is None:
+            return construir()
+        tensor = entrada.derivados.get((nombre, parametros))
+        if tensor is None:
+            tensor = construir()
+            entrada.derivados[(nombre, parametros)] = tensor
+    return tensor
+
+
+def compartidos(bt: BrainTensor) -> list[torch.Tensor]:
+    """The registry tensors bt uses: its still-shared fields and the derived constants."""
+    clave = getattr(bt, "topologia", None)
+    with _registro_lock:
+        entrada = _registro.get(clave) if clave else None
+        if entrada is None:
+            return []
+        return [
+            *(getattr(bt, n) for n in CAMPOS_TOPOLOGIA if getattr(bt, n) is entrada.tensores[n]),
+            *entrada.derivados.values(),
+        ]
+
+
+def estadisticas_topologias() -> dict[str, int]:
+    """Registered topologies, attached networks and bytes held by the registry."""
+    with _registro_lock:
+        return {
+            "topologies": len(_registro),
+            "references": sum(e.referencias for e in _registro.values()),
+            "bytes": sum(e.tamano for e in _registro.values()),
+            "mapped": sum(e.ruta is not None for e in _registro.values()),
+        }
@@ -0,0 +1,183 @@
+"""WolframEngine — bit-parallel evaluation of Wolfram elementary-CA masks.
+
+The rule_* masks give every neuron one dendrite per active pattern, each
+reading the three cells below it ((x-1, y+1), (x, y+1), (x+1, y+1)). With
+binary values the tension of a neuron depends only on those three bits,
+so the whole step is an 8-entry lookup. The table is computed once from
+the mask with the same arithmetic as BrainTensor.procesar (any
+process_mode / tension function), and the grid is stored as bit-packed
+uint64 rows (bit x of a row is word x // 64, bit x % 64):
+
+    izq = row shifted right by one cell, der = shifted left (toroidal)
+    new = rule(izq, row, der)   as a bitwise expression of the three planes
+
+i.e. a few bitwise ops per 64 cells. The bottom row is the input row
+(NeuronaEntrada in crear_grilla) and keeps its bits.
+
+Adaptation and learning make the neuron stateful or change the weights,
+so Experiment only uses the engine without them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import torch
+
+from .brain_tensor import combinar_dendritas
+
+WOLFRAM_OFFSETS: list[tuple[int, int]] = [(-1, 1), (0, 1), (1, 1)]
+
+_UNO = np.uint64(1)
+
+
+class WolframEngine:
+    """Wolfram CA grid as packed uint64 rows, stepped with bitwise ops."""
+
+    def __init__(self, width: int, height: int, disparos: list[bool], tensiones: list[float]) -> None:
+        """Empty (all-zero) grid with a rule given per 3-bit pattern (left, center, right).
+
+        Use WolframEngine.compilar() to derive the table from a mask.
+        """
+        self.width = width
+        self.height = height
+        self.n_palabras = (width + 63) // 64
+        self.disparos = list(disparos)
+        self._tabla_tension = torch.tensor(tensiones, dtype=torch.float32)
+
+        self.filas = np.zeros((height, self.n_palabras), dtype=np.uint64)
+        # Grid before the last step (its patterns give the tensions), None before the first
+        self._previas: np.ndarray | None = None
+
+        # Valid bits of the last word (the padding must stay 0)
+        resto = width % 64
+        self._mascara_final = np.uint64((1 << resto) - 1) if resto else ~np.uint64(0)
+
+
+    @staticmethod
+    def compilar(
+        mascara: list[dict[str, Any]],
+        process_mode: str,
+        tension_fns: list[tuple[str, float]],
+        umbral: float,
+        width: int,
+        height: int,
+    ) -> WolframEngine | None:
+        """Build the engine for a mask whose dendrites all read WOLFRAM_OFFSETS, else None."""
+        dendritas = [d for d in mascara if d["offsets"]]
+        if not dendritas or any(list(map(tuple, d["offsets"])) != WOLFRAM_OFFSETS for d in dendritas):
+            return None
+
+        # Every 3-bit neighborhood, as procesar() would see it: [8, 3]
+        bits = torch.tensor([[(p >> 2) & 1, (p >> 1) & 1, p & 1] for p in range(8)], dtype=torch.float32)
+        valores = []
+        for d in dendritas:
+            pesos = torch.tensor(d.get("pesos_sinapsis") or [1.0] * 3, dtype=torch.float32)
+            syn = 1.0 - torch.abs(pesos - bits)
+            valores.append(syn.sum(dim=1) / 3.0 * float(d["peso_dendrita"]))
+        tension = combinar_dendritas(torch.stack(valores, dim=1), process_mode, tension_fns)
+        disparos = (tension > torch.tensor(umbral, dtype=torch.float32)).tolist()
+        return WolframEngine(width, height, disparos, tension.tolist())
+
+    # ── State ──
+
+    def cargar(self, valores: torch.Tensor) -> bool:
+        """Pack neuron values [W*H] into the grid. Returns False if they are not binary."""
+        v = valores[:self.width * self.height]
+        if not bool(((v == 0.0) | (v == 1.0)).all()):
+            return False
+        self.filas = self._empaquetar(v.reshape(self.height, self.width).cpu().numpy() > 0.5)
+        return True
+
+    def valores(self) -> torch.Tensor:
+        """Neuron values [W*H] as float32 (the layout of BrainTensor.valores)."""
+        return torch.from_numpy(self._desempaquetar(self.filas).astype(np.float32)).reshape(-1)
+
+    def tensiones(self) -> torch.Tensor:
+        """Tensions [W*H] of the last step (zeros before the first one)."""
+        if self._previas is None:
+            return torch.zeros(self.width * self.height)
+        fuente = np.roll(self._previas, -1, axis=0)  # row y reads row y + 1
+        izq, der = self._vecinos(fuente)
+        patron = (
+            4 * self._desempaquetar(izq).astype(np.int64)
+            + 2 * self._desempaquetar(fuente).astype(np.int64)
+            + self._desempaquetar(der).astype(np.int64)
+        )
+        return self._tabla_tension[torch.from_numpy(patron).reshape(-1)]
+
+    def valor(self, idx: int) -> float:
+        """Value of one cell (flat index y*W + x)."""
+        y, x = divmod(idx, self.width)
+        return float((self.filas[y, x // 64] >> np.uint64(x % 64)) & _UNO)
+
+    def set_valor(self, idx: int, valor: float) -> None:
+        """Set one cell (flat index y*W + x) on (valor >= 0.5) or off."""
+        y, x = divmod(idx, self.width)
+        bit = _UNO << np.uint64(x % 64)
+        if valor >= 0.5:
+            self.filas[y, x // 64] |= bit
+        else:
+            self.filas[y, x // 64] &= ~bit
+
+    # ── Processing ──
+
+    def avanzar(self, n: int = 1) -> None:
+        """Advance n steps."""
+        for _ in range(n):
+            nuevas = np.empty_like(self.filas)
+            nuevas[:-1] = self._regla(self.filas[1:])
+            nuevas[-1] = self.filas[-1]
+            self._previas, self.filas = self.filas, nuevas
+
+    def _regla(self, fuente: np.ndarray) -> np.ndarray:
+        """Apply the rule to packed rows → the packed rows above them.
+
+        Shannon expansion on the left bit, then the center bit: each
+        cofactor over the right bit is 0, der, ~der or all ones, and
+        a ^ (s & (a ^ b)) selects b where s is set. At most ~10 word ops.
+        """
+        izq, der = self._vecinos(fuente)
+        no_der = ~der
+        cofactores = {
+            (False, False): np.uint64(0), (True, True): ~np.uint64(0),
+            (False, True): der, (True, False): no_der,
+        }
+        mitades = []
+        for l in (0, 1):
+            c0 = cofactores[tuple(self.disparos[4 * l:4 * l + 2])]
+            c1 = cofactores[tuple(self.disparos[4 * l + 2:4 * l + 4])]
+            mitades.append(c0 ^ (fuente & (c0 ^ c1)))
+        salida = mitades[0] ^ (izq & (mitades[0] ^ mitades[1]))
+        salida = np.broadcast_to(salida, fuente.shape).copy()
+        salida[:, -1] &= self._mascara_final
+        return salida
+
+    def _vecinos(self, filas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """(left, right) neighbor planes: izq[x] = filas[x - 1], der[x] = filas[x + 1] (toroidal)."""
+        resto = self.width % 64
+        izq = filas << _UNO
+        izq[:, 1:] |= filas[:, :-1] >> np.uint64(63)
+        der = filas >> _UNO
+        der[:, :-1] |= filas[:, 1:] << np.uint64(63)
+        if resto:
+            # The wrap crosses the padding: bit W-1 goes to x = 0 and bit 0 to x = W-1
+            ultimo = np.uint64(resto - 1)
+            izq[:, 0] |= (filas[:, -1] >> ultimo) & _UNO
+            der[:, -1] |= (filas[:, 0] & _UNO) << ultimo
+        else:
+            izq[:, 0] |= filas[:, -1] >> np.uint64(63)
+            der[:, -1] |= filas[:, 0] << np.uint64(63)
+        return izq, der
+
+    def _empaquetar(self, grilla: np.ndarray) -> np.ndarray:
+        """bool [H, W] → uint64 [H, n_palabras]."""
+        relleno = np.zeros((self.height, self.n_palabras * 64), dtype=bool)
+        relleno[:, :self.width] = grilla
+        return np.packbits(relleno, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+    def _desempaquetar(self, filas: np.ndarray) -> np.ndarray:
+        """uint64 [H, n_palabras] → uint8 [H, W] of 0/1."""
+        octetos = np.ascontiguousarray(filas).astype("<u8").view(np.uint8)
+        return np.unpackbits(octetos, axis=1, bitorder="little")[:, :self.width]
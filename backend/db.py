@@ -1,90 +1,139 @@
-"""Config persistence — SQLite storage for experiment configurations."""
+"""Config persistence — SQLite storage for experiment configurations.
+
+Connections are opened once per thread (route handlers run on the server's
+worker threads, never on the event loop) in WAL mode, so readers do not
+block the writer. Statements are module constants and hit sqlite3's
+per-connection statement cache.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
+import threading
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "data" / "neuroflow.db"
 
+HISTORY_PAGE_SIZE = 100
+HISTORY_MAX_PAGE_SIZE = 1000
+_MAX_ROWID = 2**63 - 1
+
+_local = threading.local()
+
+_SELECT_LAST_HASH = (
+    "SELECT config_hash FROM config_snapshots "
+    "WHERE experiment = ? AND preset_id = ? ORDER BY id DESC LIMIT 1"
+)
+_INSERT_SNAPSHOT = (
+    "INSERT INTO config_snapshots (experiment, preset_id, config, config_hash) "
+    "VALUES (?, ?, ?, ?)"
+)
+_SELECT_LATEST = (
+    "SELECT config FROM config_snapshots "
+    "WHERE experiment = ? AND preset_id = ? ORDER BY id DESC LIMIT 1"
+)
+_SELECT_HISTORY_PAGE = (
+    "SELECT id, config, created_at FROM config_snapshots "
+    "WHERE experiment = ? AND preset_id = ? AND id < ? ORDER BY id DESC LIMIT ?"
+)
+
 
 def _connect() -> sqlite3.Connection:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(str(DB_PATH))
+    """Return this thread's connection to DB_PATH, opening it on first use."""
+    conns: dict[Path, sqlite3.Connection] | None = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(DB_PATH)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_PATH))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conns[DB_PATH] = conn
+    return conn
+
+
+def config_hash(config: dict) -> str:
+    """Content hash of a config; equal dicts hash equal regardless of key order."""
+    canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
 
 
 def init_db() -> None:
     conn = _connect()
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS config_snapshots (
-            id         INTEGER PRIMARY KEY AUTOINCREMENT,
-            experiment TEXT    NOT NULL,
-            preset_id  TEXT    NOT NULL DEFAULT '_default',
-            config     TEXT    NOT NULL,
-            created_at TEXT    NOT NULL DEFAULT (datetime('now'))
-        )
-    """)
-    # Migration: add preset_id if table already existed without it
-    cols = [r[1] for r in conn.execute("PRAGMA table_info(config_snapshots)").fetchall()]
-    if "preset_id" not in cols:
-        conn.execute(
-            "ALTER TABLE config_snapshots "
-            "ADD COLUMN preset_id TEXT NOT NULL DEFAULT '_default'"
-        )
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_snapshots_exp_preset
-        ON config_snapshots(experiment, preset_id, id DESC)
-    """)
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS config_snapshots (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                experiment  TEXT    NOT NULL,
+                preset_id   TEXT    NOT NULL DEFAULT '_default',
+                config      TEXT    NOT NULL,
+                config_hash TEXT,
+                created_at  TEXT    NOT NULL DEFAULT (datetime('now'))
+            )
+        """)
+        cols = [r[1] for r in conn.execute("PRAGMA table_info(config_snapshots)").fetchall()]
+        # Migration: add preset_id if table already existed without it
+        if "preset_id" not in cols:
+            conn.execute(
+                "ALTER TABLE config_snapshots "
+                "ADD COLUMN preset_id TEXT NOT NULL DEFAULT '_default'"
+            )
+        # Migration: add config_hash and fill it for existing rows
+        if "config_hash" not in cols:
+            conn.execute("ALTER TABLE config_snapshots ADD COLUMN config_hash TEXT")
+            rows = conn.execute("SELECT id, config FROM config_snapshots").fetchall()
+            conn.executemany(
+                "UPDATE config_snapshots SET config_hash = ? WHERE id = ?",
+                [(config_hash(json.loads(cfg)), sid) for sid, cfg in rows],
+            )
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_snapshots_exp_preset
+            ON config_snapshots(experiment, preset_id, id DESC)
+        """)
 
 
 def save_config(experiment: str, preset_id: str, config: dict) -> int:
     """Save a config snapshot. Returns -1 if identical to the last saved for this preset."""
+    digest = config_hash(config)
     conn = _connect()
-
-    last = conn.execute(
-        "SELECT config FROM config_snapshots "
-        "WHERE experiment = ? AND preset_id = ? ORDER BY id DESC LIMIT 1",
-        (experiment, preset_id),
-    ).fetchone()
-    if last and json.loads(last[0]) == config:
-        conn.close()
-        return -1
-
-    cur = conn.execute(
-        "INSERT INTO config_snapshots (experiment, preset_id, config) VALUES (?, ?, ?)",
-        (experiment, preset_id, json.dumps(config)),
-    )
-    sid = cur.lastrowid
-
-    conn.commit()
-    conn.close()
-    return sid  # type: ignore[return-value]
+    with conn:
+        last = conn.execute(_SELECT_LAST_HASH, (experiment, preset_id)).fetchone()
+        if last and last[0] == digest:
+            return -1
+        cur = conn.execute(
+            _INSERT_SNAPSHOT, (experiment, preset_id, json.dumps(config), digest),
+        )
+    return cur.lastrowid  # type: ignore[return-value]
 
 
 def get_latest(experiment: str, preset_id: str) -> dict | None:
-    conn = _connect()
-    row = conn.execute(
-        "SELECT config FROM config_snapshots "
-        "WHERE experiment = ? AND preset_id = ? ORDER BY id DESC LIMIT 1",
-        (experiment, preset_id),
-    ).fetchone()
-    conn.close()
+    row = _connect().execute(_SELECT_LATEST, (experiment, preset_id)).fetchone()
     return json.loads(row[0]) if row else None
 
 
-def get_history(experiment: str, preset_id: str) -> list[dict]:
-    """All executed configs for an experiment+preset, oldest first."""
-    conn = _connect()
-    rows = conn.execute(
-        "SELECT id, config, created_at FROM config_snapshots "
-        "WHERE experiment = ? AND preset_id = ? ORDER BY id ASC",
-        (experiment, preset_id),
+def get_history(
+    experiment: str,
+    preset_id: str,
+    before: int | None = None,
+    limit: int = HISTORY_PAGE_SIZE,
+) -> tuple[list[dict], int | None]:
+    """One page of executed configs for an experiment+preset, oldest first.
+
+    Returns the newest `limit` snapshots with id < `before` (all ids when
+    None) and the cursor for the next (older) page, or None on the last page.
+    """
+    limit = max(1, min(limit, HISTORY_MAX_PAGE_SIZE))
+    cursor = before if before is not None else _MAX_ROWID
+    rows = _connect().execute(
+        _SELECT_HISTORY_PAGE, (experiment, preset_id, cursor, limit + 1),
     ).fetchall()
-    conn.close()
-    return [
+    more = len(rows) > limit
+    rows = rows[:limit]
+    page = [
         {"id": r[0], "config": json.loads(r[1]), "created_at": r[2]}
-        for r in rows
+        for r in reversed(rows)
     ]
+    return page, (rows[-1][0] if more else None)
@@ -66,6 +66,9 @@ class Experimento(ABC):
         """Reset the experiment."""
         ...
 
+    def close(self) -> None:
+        """Release resources held outside the object (e.g. worker processes)."""
+
     def get_frame(self) -> list[list[float]]:
         """Return the current grid as a value matrix."""
         if self.brain is None:
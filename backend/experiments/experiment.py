@@ -2,10 +2,14 @@
 
 Supports all features through opt-in config sections:
   - grid + wiring (required)
-  - input (optional: ASCII/synthetic input stream)
+  - input (optional: ASCII/synthetic input stream, or an image dataset)
   - noise (optional: background, shift, inter-char)
   - learning (optional: Hebbian weight updates)
   - spiking (optional: spike frequency adaptation)
+  - compact (optional: narrow dtypes / reduced-precision weight storage)
+  - compile (optional: torch.compile the fused step, kwargs for torch.compile)
+  - domains (optional: step the tissue in row bands on worker processes)
+  - tiling (optional: bulk steps k at a time per cache-sized tile, no learning)
 
 Config is nested JSON. Section present = feature enabled.
 Section absent = feature disabled.
@@ -14,77 +18,141 @@ Section absent = feature disabled.
 from __future__ import annotations
 
 import logging
-import random
+import secrets
 from collections import deque
 from typing import Any
 
 import numpy as np
 import torch
+import torch.nn.functional as F
 
+from core.batched_step import BatchedStep, clave_lote
 from core.constructor import Constructor
 from core.constructor_tensor import ConstructorTensor
+from core.domain_engine import DomainEngine
+from core.fft_engine import FFTEngine
+from core.fused_step import METRICA_ACTIVAS, METRICA_TENSION, FusedStep
+from core.tiled_engine import TiledEngine
+from core.topology_registry import compartir
+from core.wolfram_engine import WolframEngine
 from core.neurona import Neurona, NeuronaEntrada
 from core.brain import Brain
 from core.region import Region
 from core.sinapsis import Sinapsis
 from core.dendrita import Dendrita
 from core.masks import get_mask, get_mask_type, get_random_weights, compile_deamon_wiring
-from core.ascii_renderer import render_char, apply_white_noise, apply_shift_noise
+from core.ascii_renderer import render_char
+from core.image_dataset import ImageDataset
 from .base import Experimento
+from .input_schedule import InputSchedule
 
 logger = logging.getLogger(__name__)
 
 _STABILITY_WINDOW = 20
 _DAEMON_THRESHOLD = 0.5
 _MIN_DAEMON_SIZE = 3
+_LABEL_ROUNDS = 8
+
+# Wolfram masks: neuron threshold, and the largest grid that also builds the
+# compiled network (inspect, non-binary paint). Bigger grids run on the
+# bit-parallel WolframEngine alone.
+_WOLFRAM_THRESHOLD = 0.99
+_WOLFRAM_NETWORK_CELLS = 128 * 128
+
+# run(): steps per precomputed input chunk
+_RUN_CHUNK = 256
+
+# compact.weights → storage dtype of synapse/dendrite weights
+_WEIGHT_DTYPES = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+
+# Layout of the packed tensor returned by _daemon_stats()
+_ST_ACTIVE, _ST_COUNT, _ST_DAEMON_CELLS, _ST_NOISE_CELLS, _ST_INSIDE_SUM, _ST_OUTSIDE_SUM, _ST_CONVERGED = range(7)
+
+
+def _propagate_labels(
+    labels: torch.Tensor,
+    active: torch.Tensor,
+    rounds: int,
+) -> torch.Tensor:
+    """Spread the max label over 8-connected active cells (non-wrapping).
+
+    labels is a [H, W] float64 grid where each active cell holds its
+    flat index + 1 and inactive cells hold 0. Each round takes the 3x3 max
+    and then jumps every label to the label of the cell it names, so blobs
+    converge in a few rounds instead of one round per cell of diameter.
+    """
+    flat_active = active.flatten()
+    for _ in range(rounds):
+        pooled = F.max_pool2d(labels[None, None], 3, stride=1, padding=1)[0, 0]
+        labels = pooled * active
+        flat = labels.flatten()
+        jumped = flat[(flat.long() - 1).clamp(min=0)]
+        labels = torch.where(flat_active, jumped, flat).reshape(active.shape)
+    return labels
 
 
-def _detect_daemons(
+def _daemon_stats(
     values: torch.Tensor,
     width: int,
     height: int,
     threshold: float,
     min_size: int = _MIN_DAEMON_SIZE,
-) -> tuple[int, set[int], set[int], list[int]]:
+) -> list[float]:
     """Detect daemons as connected components of active neurons (8-connectivity).
 
-    Returns (count, daemon_indices, noise_indices, sizes).
+    Labeling and every reduction run on the tensor's device; the results
+    are packed into one small tensor and copied to the host once (a second
+    copy only happens if labeling needed more than _LABEL_ROUNDS rounds).
+
+    Returns the packed stats indexed by the _ST_* constants.
     """
     n = width * height
-    active = (values[:n] > threshold).tolist()
-    visited = [False] * n
-    daemon_indices: set[int] = set()
-    noise_indices: set[int] = set()
-    sizes: list[int] = []
-
-    for idx in range(n):
-        if active[idx] and not visited[idx]:
-            queue = [idx]
-            visited[idx] = True
-            cluster: list[int] = []
-            head = 0
-            while head < len(queue):
-                cidx = queue[head]
-                head += 1
-                cluster.append(cidx)
-                cx, cy = cidx % width, cidx // width
-                for dy in (-1, 0, 1):
-                    for dx in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx, ny = cx + dx, cy + dy
-                        if 0 <= nx < width and 0 <= ny < height:
-                            nidx = ny * width + nx
-                            if active[nidx] and not visited[nidx]:
-                                visited[nidx] = True
-                                queue.append(nidx)
-            if len(cluster) >= min_size:
-                daemon_indices.update(cluster)
-                sizes.append(len(cluster))
-            else:
-                noise_indices.update(cluster)
-
-    return len(sizes), daemon_indices, noise_indices, sizes
+    vals = values[:n]
+    active_flat = vals > threshold
+    active = active_flat.reshape(height, width)
+
+    labels = torch.where(
+        active_flat,
+        torch.arange(1, n + 1, device=vals.device, dtype=torch.float64),
+        torch.zeros((), device=vals.device, dtype=torch.float64),
+    ).reshape(height, width)
+
+    rounds = _LABEL_ROUNDS
+    while True:
+        labels = _propagate_labels(labels, active, rounds)
+        pooled = F.max_pool2d(labels[None, None], 3, stride=1, padding=1)[0, 0]
+        converged = ((pooled * active) == labels).all()
+
+        flat_labels = labels.flatten().long()
+        sizes = torch.bincount(flat_labels, minlength=n + 1)
+        sizes[0] = 0
+        in_daemon = active_flat & (sizes[flat_labels] >= min_size)
+        n_active = active_flat.sum()
+        n_daemon = in_daemon.sum()
+        vals64 = vals.to(torch.float64)
+
+        packed = torch.stack([
+            n_active.to(torch.float64),
+            (sizes >= min_size).sum().to(torch.float64),
+            n_daemon.to(torch.float64),
+            (n_active - n_daemon).to(torch.float64),
+            (vals64 * in_daemon).sum(),
+            (vals64 * ~in_daemon).sum(),
+            converged.to(torch.float64),
+        ]).tolist()
+
+        if packed[_ST_CONVERGED]:
+            return packed
+        rounds *= 2
+
+
+def _new_seed() -> int:
+    """Fresh random seed (31 bits, so it survives a JSON round trip through JS)."""
+    return secrets.randbelow(2**31)
 
 
 def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -132,12 +200,22 @@ class Experiment(Experimento):
     _SYNTHETIC_PATTERNS = {
         "HALF_TOP", "HALF_BOT", "BARS_H", "BARS_V", "DOT_TL", "DOT_BR",
     }
+    _DATASET_KEYS = ("path", "threshold", "image_shape")
 
     def __init__(self) -> None:
         super().__init__()
         self._config: dict[str, Any] = {}
         self.brain_tensor = None
         self.process_mode: str = "min_vs_max"
+        self._fft_engine: FFTEngine | None = None
+        self._wolfram_engine: WolframEngine | None = None
+        self._fused_step: FusedStep | None = None
+        self._domain_engine: DomainEngine | None = None
+        self._tiled_engine: TiledEngine | None = None
+
+        # Every random draw of a run comes from this generator
+        self.seed: int = 0
+        self._generator = torch.Generator()
 
         # Input state
         self.input_enabled: bool = False
@@ -148,13 +226,13 @@ class Experiment(Experimento):
         self.input_portion: tuple[int, int] | None = None
         self._font_id: str = "press_start_2p"
         self._font_size: int = 10
-        self._char_images: dict[str, np.ndarray] = {}
-        self._char_index: int = 0
-        self._frame_in_char: int = 0
-        self._in_gap: bool = False
-        self._current_input_frame: np.ndarray | None = None
+        self._input_items: list[str] = []
+        self._input_synthetic: bool = False
+        self.input_source: str = "ascii"
+        self._dataset_cfg: dict[str, Any] = {}
+        self._dataset: ImageDataset | None = None
+        self._input_schedule: InputSchedule | None = None
         self._input_start_idx: int = 0
-        self._rng: np.random.Generator = np.random.default_rng()
 
         # Noise state
         self.background_noise: float = 0.0
@@ -178,10 +256,26 @@ class Experiment(Experimento):
         self.up_ticks: int = 5
         self.down_ticks: int = 5
 
+        # Storage
+        self.compact: bool = False
+        self.weight_dtype: torch.dtype = torch.float32
+
+        # torch.compile kwargs for the fused step (None = eager)
+        self._compile_options: dict[str, Any] | None = None
+
+        # Worker processes of the DomainEngine (0 = single process)
+        self.domain_workers: int = 0
+
+        # Temporal tiling of bulk steps ({"steps", "rows", "threads"}, None = off)
+        self._tiling: dict[str, Any] | None = None
+
         # Daemon stats
         self._daemon_history: deque[int] = deque(maxlen=_STABILITY_WINDOW)
         self._last_history_gen: int = -1
 
+        # Inspect cache (see inspect())
+        self._inspect_cache: dict[str, Any] | None = None
+
     def setup(self, config: dict[str, Any]) -> None:
         """Build the network from a nested config.
 
@@ -192,6 +286,10 @@ class Experiment(Experimento):
         self._config = config
         self.generation = 0
 
+        # ── Seed ──
+        self.seed = int(config["seed"]) if config.get("seed") is not None else _new_seed()
+        self._generator.manual_seed(self.seed)
+
         # ── Grid ──
         grid = config["grid"]
         self.width = grid["width"]
@@ -199,7 +297,6 @@ class Experiment(Experimento):
 
         # ── Wiring ──
         wiring = config["wiring"]
-        mask_id: str = wiring.get("mask", "")
         self.process_mode = wiring["process_mode"]
 
         self.dendrite_exc_weight = wiring.get("dendrite_exc_weight")
@@ -223,6 +320,10 @@ class Experiment(Experimento):
             self.input_density = float(input_cfg.get("density", 1.0))
             self._font_id = input_cfg.get("font", "press_start_2p")
             self._font_size = input_cfg.get("font_size", 10)
+            self.input_source = input_cfg.get("source", "ascii")
+            self._dataset_cfg = {
+                k: input_cfg[k] for k in self._DATASET_KEYS if k in input_cfg
+            }
             portion_raw = input_cfg.get("portion")
             if portion_raw is not None:
                 self.input_portion = (int(portion_raw[0]), int(portion_raw[1]))
@@ -230,6 +331,8 @@ class Experiment(Experimento):
                 self.input_portion = None
         else:
             self.input_text = ""
+            self.input_source = "ascii"
+            self._dataset_cfg = {}
             self.input_resolution = 0
             self.input_density = 1.0
             self.input_portion = None
@@ -266,43 +369,41 @@ class Experiment(Experimento):
             self.up_ticks = 5
             self.down_ticks = 5
 
+        # ── Compact storage (opt-in) ──
+        compact_cfg = config.get("compact")
+        self.compact = compact_cfg is not None
+        weights = (compact_cfg or {}).get("weights", "float16") if self.compact else "float32"
+        if weights not in _WEIGHT_DTYPES:
+            raise ValueError(f"compact.weights must be one of {sorted(_WEIGHT_DTYPES)}, got: {weights}")
+        self.weight_dtype = _WEIGHT_DTYPES[weights]
+
+        # ── torch.compile (opt-in) ──
+        compile_cfg = config.get("compile")
+        self._compile_options = dict(compile_cfg) if compile_cfg is not None else None
+
+        # ── Domain decomposition (opt-in) ──
+        domains_cfg = config.get("domains")
+        self.domain_workers = max(1, int(domains_cfg.get("workers", 2))) if domains_cfg is not None else 0
+
+        # ── Temporal tiling (opt-in) ──
+        tiling_cfg = config.get("tiling")
+        self._tiling = dict(tiling_cfg) if tiling_cfg is not None else None
+
         # ── Mask setup ──
-        if "deamon" in wiring:
-            self._mask_type = "kohonen"
-            deamon_cfg = wiring["deamon"]
-            # fixed: true → exact pesos_sinapsis, no random scaling
-            # default → pesos_sinapsis × random[0.2, 1.0] per neuron (enables daemon formation)
-            self._random_weights = not deamon_cfg.get("fixed", False)
-            raw_mask = compile_deamon_wiring(deamon_cfg)
-        else:
-            self._mask_type = get_mask_type(mask_id)
-            self._random_weights = get_random_weights(mask_id)
-            raw_mask = get_mask(mask_id)
-
-        # Apply flat dendrite-weight override when specified in wiring config.
-        # Works for both preset masks and inline deamon specs (compile_deamon_wiring
-        # always outputs ±1.0 for peso_dendrita — the gradient lives in pesos_sinapsis).
-        has_override = (
-            self.dendrite_exc_weight is not None or self.dendrite_inh_weight is not None
-        )
-        if has_override:
-            mask = []
-            for d in raw_mask:
-                peso = d["peso_dendrita"]
-                if self.dendrite_exc_weight is not None and peso > 0:
-                    mask.append({**d, "peso_dendrita": self.dendrite_exc_weight})
-                elif self.dendrite_inh_weight is not None and peso < 0:
-                    mask.append({**d, "peso_dendrita": self.dendrite_inh_weight})
-                else:
-                    mask.append(d)
-        else:
-            mask = raw_mask
+        self._mask_type, self._random_weights, self._raw_mask = self._resolve_mask(wiring)
+        mask = self._lateral_mask()
 
         # ── Neurons ──
         is_wolfram = self._mask_type == "wolfram"
         n_input = self.input_resolution * self.input_resolution if self.input_enabled else 0
         self._input_start_idx = self.width * self.height
 
+        if is_wolfram and not self._wolfram_needs_network():
+            engine = self._compile_wolfram()
+            if engine is not None:
+                self._setup_wolfram_engine(engine)
+                return
+
         if is_wolfram:
             constructor = Constructor()
             self.brain, self.regiones = constructor.crear_grilla(
@@ -310,7 +411,7 @@ class Experiment(Experimento):
                 height=self.height,
                 filas_entrada=[self.height - 1],
                 filas_salida=[],
-                umbral=0.99,
+                umbral=_WOLFRAM_THRESHOLD,
             )
         else:
             tissue_neurons: list[Neurona] = []
@@ -340,13 +441,14 @@ class Experiment(Experimento):
                 self.regiones["input"] = region_input
 
         # ── Wiring ──
+        # Structure only: random weights are drawn after compiling (_randomize_state)
         constructor = Constructor()
         constructor.aplicar_mascara_2d(
             self.brain,
             self.width,
             self.height,
             mask,
-            random_weights=self._random_weights,
+            random_weights=False,
         )
 
         # ── Input dendrites ──
@@ -383,26 +485,33 @@ class Experiment(Experimento):
                     rx = min(tx * n_div_x // self.width, n_div_x - 1)
                     ry = min(ty * n_div_y // self.height, n_div_y - 1)
                     sinapsis_list: list[Sinapsis] = [
-                        Sinapsis(neurona_entrante=inp_n, peso=random.uniform(0.2, 1.0))
+                        Sinapsis(neurona_entrante=inp_n, peso=1.0)
                         for inp_n in inp_regions[(ry, rx)]
                     ]
                     tissue_n.dendritas.append(
                         Dendrita(sinapsis=sinapsis_list, peso=self.dendrite_input_weight)
                     )
             else:
-                k = max(1, round(len(input_neuron_list) * self.input_density))
-                for tissue_n in tissue_list:
-                    sampled = random.sample(input_neuron_list, k) if k < len(input_neuron_list) else input_neuron_list
-                    sinapsis_list = []
-                    for inp_n in sampled:
-                        sinapsis_list.append(
-                            Sinapsis(neurona_entrante=inp_n, peso=random.uniform(0.2, 1.0))
-                        )
+                n_inp = len(input_neuron_list)
+                k = max(1, round(n_inp * self.input_density))
+                chosen: list[list[int]] | None = None
+                if k < n_inp:
+                    # k distinct inputs per tissue neuron, sampled in one batch
+                    keys = torch.rand(len(tissue_list), n_inp, generator=self._generator)
+                    chosen = keys.argsort(dim=1)[:, :k].tolist()
+                for i, tissue_n in enumerate(tissue_list):
+                    sampled = (
+                        [input_neuron_list[j] for j in chosen[i]] if chosen is not None
+                        else input_neuron_list
+                    )
+                    sinapsis_list = [
+                        Sinapsis(neurona_entrante=inp_n, peso=1.0) for inp_n in sampled
+                    ]
                     tissue_n.dendritas.append(
                         Dendrita(sinapsis=sinapsis_list, peso=self.dendrite_input_weight)
                     )
 
-        # ── Initialization ──
+        # ── Initialization (Wolfram; the rest is drawn in _randomize_state) ──
         if is_wolfram:
             for neurona in self.brain.neuronas:
                 neurona.activar_external(0.0)
@@ -411,11 +520,6 @@ class Experiment(Experimento):
             self.brain.get_neurona(
                 f"x{center_x}y{bottom_y}"
             ).activar_external(1.0)
-        else:
-            tissue_region = self.regiones.get("tissue")
-            if tissue_region:
-                for neurona in tissue_region.neuronas.values():
-                    neurona.activar_external(random.random())
 
         # ── Compile ──
         self.brain_tensor = ConstructorTensor.compilar(
@@ -425,22 +529,22 @@ class Experiment(Experimento):
             adaptation_enabled=self.adaptation_enabled,
             process_mode=self.process_mode,
             tension_fns=self._tension_fns,
+            compact=self.compact,
+            weight_dtype=self.weight_dtype,
         )
-
-        # ── Pre-render characters ──
-        self._char_images = {}
-        if self.input_enabled and not self._is_synthetic_input():
-            for char in set(self.input_text):
-                self._char_images[char] = render_char(
-                    char, self.input_resolution,
-                    font_id=self._font_id, font_size=self._font_size,
-                )
-
-        # ── Frame tracking ──
-        self._char_index = 0
-        self._frame_in_char = 0
-        self._in_gap = False
-        self._rng = np.random.default_rng()
+        # Sessions with the same connectivity share one copy of it
+        compartir(self.brain_tensor)
+        if not is_wolfram:
+            # Restart the stream so setup and reset(seed) draw the same state
+            self._generator.manual_seed(self.seed)
+            self._randomize_state()
+        self._compile_engine()
+
+        # ── Input schedule (pre-render + compile frames) ──
+        self._dataset = None
+        self._input_schedule = None
+        if self.input_enabled:
+            self._compile_input()
 
         # ── Daemon stats ──
         self._daemon_history.clear()
@@ -448,7 +552,93 @@ class Experiment(Experimento):
 
         # ── Project initial frame ──
         if self.input_enabled:
-            self._generate_and_project()
+            self._project_input()
+
+    # ── Wolfram helpers ──
+
+    def _wolfram_needs_network(self) -> bool:
+        """Whether a Wolfram setup builds the compiled network next to the engine."""
+        return (
+            self.width * self.height <= _WOLFRAM_NETWORK_CELLS
+            or self.input_enabled
+            or self.learning_enabled
+            or self.adaptation_enabled
+        )
+
+    def _compile_wolfram(self) -> WolframEngine | None:
+        return WolframEngine.compilar(
+            self._lateral_mask(), self.process_mode, self._tension_fns,
+            _WOLFRAM_THRESHOLD, self.width, self.height,
+        )
+
+    def _setup_wolfram_engine(self, engine: WolframEngine) -> None:
+        """Finish setup for a large Wolfram grid held only by the engine (no network)."""
+        self.brain = None
+        self.regiones = {}
+        self.brain_tensor = None
+        self._fft_engine = None
+        self._fused_step = None
+        self._tiled_engine = None
+        self._close_domains()
+        self._dataset = None
+        self._input_schedule = None
+        engine.set_valor((self.height - 1) * self.width + self.width // 2, 1.0)
+        self._wolfram_engine = engine
+        self._daemon_history.clear()
+        self._last_history_gen = -1
+
+    def _advance_wolfram(self, count: int) -> None:
+        """Run count steps on the WolframEngine, syncing the network when there is one."""
+        engine = self._wolfram_engine
+        bt = self.brain_tensor
+        if bt is None:
+            engine.avanzar(count)
+            return
+        while count and not engine.cargar(bt.valores):
+            # Painted with non-binary values: step through the network
+            bt.procesar()
+            count -= 1
+        if not count:
+            return
+        engine.avanzar(count)
+        n = self.width * self.height
+        bt.valores[:n] = engine.valores().to(bt.device)
+        bt.tensiones[:n] = engine.tensiones().to(bt.device)
+
+    def _learns_lateral(self) -> bool:
+        return self.learning_enabled and bool(self.learning_rate) and bool(self.lr_exc or self.lr_inh)
+
+    # ── Wiring helpers ──
+
+    @staticmethod
+    def _resolve_mask(wiring: dict[str, Any]) -> tuple[str, bool, list[dict[str, Any]]]:
+        """(mask_type, random_weights, mask) for a wiring section, before weight overrides."""
+        if "deamon" in wiring:
+            deamon_cfg = wiring["deamon"]
+            # fixed: true → exact pesos_sinapsis, no random scaling
+            # default → pesos_sinapsis × random[0.2, 1.0] per neuron (enables daemon formation)
+            return "kohonen", not deamon_cfg.get("fixed", False), compile_deamon_wiring(deamon_cfg)
+        mask_id: str = wiring.get("mask", "")
+        return get_mask_type(mask_id), get_random_weights(mask_id), get_mask(mask_id)
+
+    def _lateral_mask(self) -> list[dict[str, Any]]:
+        """The raw mask with the flat dendrite-weight overrides applied.
+
+        Works for both preset masks and inline deamon specs (compile_deamon_wiring
+        always outputs ±1.0 for peso_dendrita — the gradient lives in pesos_sinapsis).
+        """
+        if self.dendrite_exc_weight is None and self.dendrite_inh_weight is None:
+            return self._raw_mask
+        mask = []
+        for d in self._raw_mask:
+            peso = d["peso_dendrita"]
+            if self.dendrite_exc_weight is not None and peso > 0:
+                mask.append({**d, "peso_dendrita": self.dendrite_exc_weight})
+            elif self.dendrite_inh_weight is not None and peso < 0:
+                mask.append({**d, "peso_dendrita": self.dendrite_inh_weight})
+            else:
+                mask.append(d)
+        return mask
 
     # ── Input helpers ──
 
@@ -460,6 +650,82 @@ class Experiment(Experimento):
             for tok in self.input_text.split(",")
         )
 
+    def _compile_input(self, keep_position: bool = False) -> None:
+        """Tokenize input_text once and compile it into an on-device InputSchedule.
+
+        Glyphs come from the renderer's process-wide cache, so characters
+        already rendered by any session are not rendered again.
+        """
+        if self.input_source == "dataset":
+            self._compile_dataset_input()
+            return
+
+        res = self.input_resolution
+        self._dataset = None
+        self._input_synthetic = self._is_synthetic_input()
+        if not self.input_text:
+            self._input_items = []
+        elif self._input_synthetic:
+            self._input_items = [t.strip() for t in self.input_text.split(",")]
+        else:
+            self._input_items = list(self.input_text)
+
+        base_frames: torch.Tensor | None = None
+        if self._input_items:
+            if self._input_synthetic:
+                frames = [self._make_synthetic(name, res) for name in self._input_items]
+            else:
+                frames = [
+                    render_char(char, res, font_id=self._font_id, font_size=self._font_size)
+                    for char in self._input_items
+                ]
+            base_frames = torch.from_numpy(
+                np.stack(frames).reshape(len(frames), res * res)
+            ).float().to(self.brain_tensor.device)
+
+        old = self._input_schedule
+        keep = keep_position and old is not None
+        self._input_schedule = InputSchedule(
+            base_frames,
+            res,
+            # Keep the old timing so the position maps to the same item;
+            # update_config rebases it onto new timing afterwards.
+            frames_per_char=old.frames_per_char if keep else self.frames_per_char,
+            inter_char_noise=old.inter_char_noise if keep else self.inter_char_noise,
+            background_noise=self.background_noise,
+            shift_noise=self.shift_noise and not self._input_synthetic,
+            generator=self._generator,
+            device=self.brain_tensor.device,
+        )
+        if keep:
+            self._input_schedule.position = old.position
+
+    def _compile_dataset_input(self) -> None:
+        """Open the configured image dataset and stream it through a new InputSchedule."""
+        cfg = self._dataset_cfg
+        if "path" not in cfg:
+            raise ValueError("input.source 'dataset' requires input.path")
+        image_shape = cfg.get("image_shape")
+        self._dataset = ImageDataset(
+            cfg["path"],
+            self.input_resolution,
+            threshold=float(cfg.get("threshold", 0.5)),
+            image_shape=tuple(image_shape) if image_shape is not None else None,
+        )
+        self._input_synthetic = False
+        self._input_items = []
+        self._input_schedule = InputSchedule(
+            None,
+            self.input_resolution,
+            frames_per_char=self.frames_per_char,
+            inter_char_noise=self.inter_char_noise,
+            background_noise=self.background_noise,
+            shift_noise=self.shift_noise,
+            generator=self._generator,
+            device=self.brain_tensor.device,
+            dataset=self._dataset,
+        )
+
     @staticmethod
     def _make_synthetic(name: str, res: int) -> np.ndarray:
         frame = np.zeros((res, res), dtype=np.float64)
@@ -485,44 +751,38 @@ class Experiment(Experimento):
             frame[-5:, -5:] = 1.0
         return frame
 
-    def _generate_and_project(self) -> None:
-        res = self.input_resolution
-
-        if not self.input_text:
-            frame = self._rng.integers(0, 2, size=(res, res)).astype(np.float64)
-        elif self._in_gap:
-            frame = self._rng.integers(0, 2, size=(res, res)).astype(np.float64)
-        elif self._is_synthetic_input():
-            tokens = [t.strip() for t in self.input_text.split(",")]
-            pattern_name = tokens[self._char_index % len(tokens)]
-            frame = self._make_synthetic(pattern_name, res)
-            if self.background_noise > 0:
-                frame = apply_white_noise(frame, noise_prob=self.background_noise, rng=self._rng)
-        else:
-            char = self.input_text[self._char_index]
-            base = self._char_images[char]
-            frame = base.copy()
-            if self.shift_noise:
-                frame = apply_shift_noise(frame, self._rng)
-            if self.background_noise > 0:
-                frame = apply_white_noise(frame, noise_prob=self.background_noise, rng=self._rng)
-
-        self._current_input_frame = frame
-
-        if self.brain_tensor is not None:
-            flat = torch.from_numpy(frame.flatten()).float()
-            start = self._input_start_idx
-            end = start + len(flat)
-            self.brain_tensor.valores[start:end] = flat
+    def _project_input(self) -> None:
+        """Copy the current scheduled input frame into the input region."""
+        frame = self._input_schedule.next_frame()
+        start = self._input_start_idx
+        self.brain_tensor.valores[start : start + frame.shape[0]].copy_(frame)
 
     # ── Processing ──
 
     def step(self) -> dict[str, Any]:
-        if self.input_enabled:
-            self._generate_and_project()
-        self.brain_tensor.procesar()
+        self._advance()
+        self.generation += 1
+        return self._frame_message()
 
-        if self.learning_enabled and self.brain_tensor is not None:
+    def _advance(self) -> None:
+        """One step: input, network, learning, schedule (no frame, stats or generation)."""
+        if self.input_enabled:
+            self._project_input()
+        if self._learns_lateral():
+            # Lateral weights are about to drift away from the shared kernel
+            self._fft_engine = None
+        fused = False
+        if self._wolfram_engine is not None:
+            self._advance_wolfram(1)
+        elif self._domain_engine is not None:
+            self._domain_engine.run(1)
+            fused = True
+        elif self._fft_engine is None or not self._fft_engine.procesar():
+            self._fused_step()
+            fused = True
+
+        # The fused step already learned
+        if self.learning_enabled and self.brain_tensor is not None and not fused:
             self.brain_tensor.learn(
                 lr=self.learning_rate,
                 lr_exc=self.lr_exc,
@@ -530,28 +790,10 @@ class Experiment(Experimento):
                 lr_input=self.lr_input,
             )
 
-        self.generation += 1
-
-        if self.input_enabled and self.input_text:
-            n_items = (
-                len([t.strip() for t in self.input_text.split(",")])
-                if self._is_synthetic_input()
-                else len(self.input_text)
-            )
-            self._frame_in_char += 1
-            if self._in_gap:
-                if self._frame_in_char >= self.frames_per_char:
-                    self._in_gap = False
-                    self._frame_in_char = 0
-                    self._char_index = (self._char_index + 1) % n_items
-            elif self._frame_in_char >= self.frames_per_char:
-                if self.inter_char_noise:
-                    self._in_gap = True
-                    self._frame_in_char = 0
-                else:
-                    self._frame_in_char = 0
-                    self._char_index = (self._char_index + 1) % n_items
+        if self.input_enabled:
+            self._input_schedule.advance()
 
+    def _frame_message(self) -> dict[str, Any]:
         return {
             "type": "frame",
             "generation": self.generation,
@@ -560,13 +802,97 @@ class Experiment(Experimento):
         }
 
     def step_n(self, count: int) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        for _ in range(count):
-            result = self.step()
-        return result
+        """count steps at engine speed, then one frame (stats are sampled once)."""
+        if count <= 0 or (self.brain_tensor is None and self._wolfram_engine is None):
+            return {}
+        self.run(count)
+        return self._frame_message()
+
+    def run(self, count: int, metrics: bool = False) -> torch.Tensor | None:
+        """Advance count steps without building frames or stats.
+
+        On the fused step (or the DomainEngine / TiledEngine), input frames
+        are taken from the schedule in chunks of _RUN_CHUNK steps and
+        learning runs inside the step, so the whole chunk stays in
+        FusedStep.run; the Wolfram engine advances all steps at once. Other
+        engines step one at a time.
+
+        Returns a [count, 2] tensor of per-step metrics when metrics is True
+        (columns METRICA_ACTIVAS / METRICA_TENSION: active tissue cells and
+        mean tissue tension after each step), else None.
+        """
+        n_tissue = self.width * self.height
+        bt = self.brain_tensor
+        device = bt.device if bt is not None else "cpu"
+        buffer = torch.zeros(count, 2, device=device) if metrics else None
+        if self._learns_lateral():
+            self._fft_engine = None
+
+        if self._wolfram_engine is not None and buffer is None:
+            self._advance_wolfram(count)
+        elif bt is not None and self._wolfram_engine is None and self._fft_engine is None:
+            stepper = self._domain_engine or self._tiled_engine or self._fused_step
+            done = 0
+            while done < count:
+                k = min(_RUN_CHUNK, count - done)
+                frames = self._input_schedule.take(k) if self.input_enabled else None
+                stepper.run(
+                    k, frames, self._input_start_idx,
+                    buffer[done : done + k] if buffer is not None else None, n_tissue,
+                )
+                done += k
+        else:
+            for k in range(count):
+                self._advance()
+                if buffer is not None:
+                    if bt is not None:
+                        valores, tensiones = bt.valores, bt.tensiones
+                    else:
+                        valores, tensiones = self._wolfram_engine.valores(), self._wolfram_engine.tensiones()
+                    buffer[k, METRICA_ACTIVAS] = (valores[:n_tissue] > 0.5).sum()
+                    buffer[k, METRICA_TENSION] = tensiones[:n_tissue].mean()
+        self.generation += count
+        return buffer
+
+    def batch_key(self) -> tuple | None:
+        """Experiments with equal keys can advance together (run_batched); None if this one cannot.
+
+        Only experiments on the plain fused step qualify: same registered
+        topology, same step specialization, same grid and input region.
+        """
+        if (
+            self._fused_step is None or self._wolfram_engine is not None or self._fft_engine is not None
+            or self._domain_engine is not None or self._tiled_engine is not None
+        ):
+            return None
+        clave = clave_lote(self._fused_step)
+        if clave is None:
+            return None
+        return (clave, self.width, self.height, self.input_enabled, self._input_start_idx)
+
+    @staticmethod
+    def run_batched(experiments: list[Experiment], count: int) -> None:
+        """Advance experiments with the same batch_key() count steps in one BatchedStep.
+
+        Same result as calling run(count) on each of them.
+        """
+        lead = experiments[0]
+        batch = BatchedStep([exp._fused_step for exp in experiments])
+        done = 0
+        while done < count:
+            k = min(_RUN_CHUNK, count - done)
+            frames = [exp._input_schedule.take(k) for exp in experiments] if lead.input_enabled else None
+            batch.run(k, frames, lead._input_start_idx, None, lead.width * lead.height)
+            done += k
+        for exp in experiments:
+            exp.generation += count
 
     def click(self, x: int, y: int) -> None:
         if self.brain_tensor is None:
+            if self._wolfram_engine is not None and 0 <= x < self.width and 0 <= y < self.height:
+                engine = self._wolfram_engine
+                idx = y * self.width + x
+                engine.set_valor(idx, 0.0 if engine.valor(idx) >= 0.5 else 1.0)
             return
         idx = y * self.width + x
         limit = self._input_start_idx if self.input_enabled else self.brain_tensor.n_real
@@ -574,43 +900,58 @@ class Experiment(Experimento):
             current = self.brain_tensor.valores[idx].item()
             self.brain_tensor.set_valor(idx, 0.0 if current >= 0.5 else 1.0)
 
+    def set_cell(self, x: int, y: int, value: float) -> None:
+        """Set the value of one tissue cell (paint)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        idx = y * self.width + x
+        if self.brain_tensor is not None:
+            self.brain_tensor.set_valor(idx, value)
+        elif self._wolfram_engine is not None:
+            self._wolfram_engine.set_valor(idx, value)
+
     def get_frame(self) -> list[list[float]]:
         if self.brain_tensor:
             return self.brain_tensor.get_grid(self.width, self.height)
+        if self._wolfram_engine is not None:
+            return self._wolfram_engine.valores().reshape(self.height, self.width).tolist()
         return super().get_frame()
 
     def get_tension_frame(self) -> list[list[float]] | None:
         if self.brain_tensor:
             return self.brain_tensor.get_tension_grid(self.width, self.height)
+        if self._wolfram_engine is not None:
+            return self._wolfram_engine.tensiones().reshape(self.height, self.width).tolist()
         return None
 
     def get_input_frame(self) -> list[list[float]] | None:
-        if not self.input_enabled:
+        if not self.input_enabled or self._input_schedule is None:
             return None
-        if self._current_input_frame is not None:
-            return self._current_input_frame.tolist()
+        frame = self._input_schedule.current_frame
+        if frame is not None:
+            res = self.input_resolution
+            return frame.reshape(res, res).tolist()
         return None
 
     def get_stats(self) -> dict[str, Any]:
-        if self.brain_tensor is None:
+        if self.brain_tensor is not None:
+            valores = self.brain_tensor.valores
+        elif self._wolfram_engine is not None:
+            valores = self._wolfram_engine.valores()
+        else:
             return super().get_stats()
 
         n_tissue = self.width * self.height
-        vals = self.brain_tensor.valores[:n_tissue]
-        active = int((vals > _DAEMON_THRESHOLD).sum().item())
-
-        # Daemon detection
-        count, daemon_indices, noise_indices, sizes = _detect_daemons(
-            self.brain_tensor.valores, self.width, self.height, _DAEMON_THRESHOLD
-        )
-        avg_size = round(sum(sizes) / len(sizes), 1) if sizes else 0.0
-
-        if daemon_indices:
-            daemon_mask = torch.zeros(n_tissue, dtype=torch.bool)
-            daemon_mask[list(daemon_indices)] = True
-            inside_mean = vals[daemon_mask].mean().item()
-            outside = vals[~daemon_mask]
-            outside_mean = outside.mean().item() if outside.numel() > 0 else 0.0
+        packed = _daemon_stats(valores, self.width, self.height, _DAEMON_THRESHOLD)
+        active = int(packed[_ST_ACTIVE])
+        count = int(packed[_ST_COUNT])
+        daemon_cells = int(packed[_ST_DAEMON_CELLS])
+        avg_size = round(daemon_cells / count, 1) if count else 0.0
+
+        if daemon_cells:
+            inside_mean = packed[_ST_INSIDE_SUM] / daemon_cells
+            n_outside = n_tissue - daemon_cells
+            outside_mean = packed[_ST_OUTSIDE_SUM] / n_outside if n_outside > 0 else 0.0
             exclusion = inside_mean - outside_mean
         else:
             exclusion = 0.0
@@ -636,26 +977,27 @@ class Experiment(Experimento):
             "steps": self.generation,
             "daemon_count": count,
             "avg_daemon_size": avg_size,
-            "noise_cells": len(noise_indices),
+            "noise_cells": int(packed[_ST_NOISE_CELLS]),
             "stability": stability,
             "exclusion": round(exclusion, 3),
+            "seed": self.seed,
         }
 
         if self.input_enabled:
-            if not self.input_text:
+            schedule = self._input_schedule
+            if schedule.n_items == 0:
                 current_char = ""
-            elif self._in_gap:
+            elif schedule.in_gap:
                 current_char = "gap"
-            elif self._is_synthetic_input():
-                tokens = [t.strip() for t in self.input_text.split(",")]
-                current_char = tokens[self._char_index % len(tokens)]
+            elif self._dataset is not None:
+                current_char = f"#{schedule.item_index}"
             else:
-                current_char = self.input_text[self._char_index]
+                current_char = self._input_items[schedule.item_index]
 
             stats.update({
                 "current_char": current_char,
-                "char_index": self._char_index,
-                "frame_in_char": self._frame_in_char,
+                "char_index": schedule.item_index,
+                "frame_in_char": schedule.frame_in_item,
                 "frames_per_char": self.frames_per_char,
                 "input_resolution": self.input_resolution,
             })
@@ -663,68 +1005,89 @@ class Experiment(Experimento):
         return stats
 
     def inspect(self, x: int, y: int) -> dict[str, Any]:
-        """Return connection weights from brain_tensor (live, trained weights)."""
+        """Return connection weights from brain_tensor (live, trained weights).
+
+        The weight grids are cached per neuron and rebuilt only when that
+        neuron's synapse or dendrite weights have changed since the last call.
+        """
         if self.brain_tensor is None:
             result = super().inspect(x, y)
             result["input_weight_grid"] = None
             return result
 
+        bt = self.brain_tensor
+        if self._domain_engine is not None and self.learning_enabled:
+            # Learned weights stay in the workers until gathered
+            self._domain_engine.recoger()
         neuron_idx = y * self.width + x
+        weights = bt.pesos_sinapsis[neuron_idx]
+        dend_weights = bt.pesos_dendrita[neuron_idx]
+
+        cache = self._inspect_cache
+        if (
+            cache is None
+            or cache["key"] != (x, y)
+            or cache["brain_tensor"] is not bt
+            or not torch.equal(cache["weights"], weights)
+            or not torch.equal(cache["dend_weights"], dend_weights)
+        ):
+            cache = {
+                "key": (x, y),
+                "brain_tensor": bt,
+                "weights": weights.clone(),
+                "dend_weights": dend_weights.clone(),
+                "result": self._build_inspect(x, y),
+            }
+            self._inspect_cache = cache
+
+        activation = bt.valores[neuron_idx].item()
+        tension = bt.tensiones[neuron_idx].item()
+        return {
+            **cache["result"],
+            "activation": round(activation, 4),
+            "tension": round(tension, 4),
+        }
+
+    def _build_inspect(self, x: int, y: int) -> dict[str, Any]:
+        """Build the static part of inspect() from tensors in one pass."""
+        bt = self.brain_tensor
+        neuron_idx = y * self.width + x
+        n_tissue = self.width * self.height
         n_input = (self.input_resolution * self.input_resolution) if self.input_enabled else 0
         input_start = self._input_start_idx
         input_end = input_start + n_input
 
-        sources = self.brain_tensor.indices_fuente[neuron_idx]
-        weights = self.brain_tensor.pesos_sinapsis[neuron_idx]
-        dend_weights = self.brain_tensor.pesos_dendrita[neuron_idx]
-        valid = self.brain_tensor.mascara_valida[neuron_idx]
-        dend_ids = self.brain_tensor.dendrita_ids[neuron_idx]
+        sources = bt.indices_fuente[neuron_idx].long()
+        weights = bt.pesos_sinapsis[neuron_idx].float()
+        valid = bt.mascara_valida[neuron_idx]
+        dend_ids = bt.dendrita_ids[neuron_idx]
 
         total_sinapsis = int(valid.sum().item())
         total_dendritas = int(dend_ids[valid].unique().numel()) if total_sinapsis > 0 else 0
 
-        tissue_pesos: dict[int, float] = {}
-        input_weights: list[float] = [0.0] * n_input
-
-        for i in range(sources.shape[0]):
-            if not valid[i]:
-                continue
-            src = sources[i].item()
-            w = weights[i].item()
-            dw = dend_weights[i].item()
-
-            if self.input_enabled and input_start <= src < input_end:
-                input_weights[src - input_start] = w
-            elif src < input_start:
-                effective = w * dw
-                tissue_pesos[src] = tissue_pesos.get(src, 0.0) + effective
-
-        for src in tissue_pesos:
-            tissue_pesos[src] = max(-1.0, min(1.0, tissue_pesos[src]))
-
-        weight_grid: list[list[float | None]] = []
-        for row in range(self.height):
-            fila: list[float | None] = []
-            for col in range(self.width):
-                if col == x and row == y:
-                    fila.append(999)
-                else:
-                    idx = row * self.width + col
-                    if idx in tissue_pesos:
-                        fila.append(tissue_pesos[idx])
-                    else:
-                        fila.append(None)
-            weight_grid.append(fila)
-
-        activation = self.brain_tensor.valores[neuron_idx].item()
-        tension = self.brain_tensor.tensiones[neuron_idx].item()
+        # Tissue: effective weights summed per source cell, clamped to [-1, 1]
+        tissue_syn = valid & (sources < min(input_start, n_tissue))
+        tissue_src = sources[tissue_syn]
+        effective = (weights * bt.pesos_dendrita[neuron_idx].float())[tissue_syn]
+        flat = torch.zeros(n_tissue, dtype=weights.dtype, device=weights.device)
+        flat.scatter_add_(0, tissue_src, effective)
+        flat.clamp_(-1.0, 1.0)
+        connected = torch.zeros(n_tissue, dtype=torch.bool, device=weights.device)
+        connected[tissue_src] = True
+
+        weight_grid: list[list[float | None]] = [
+            [w if c else None for w, c in zip(w_row, c_row)]
+            for w_row, c_row in zip(
+                flat.reshape(self.height, self.width).tolist(),
+                connected.reshape(self.height, self.width).tolist(),
+            )
+        ]
+        weight_grid[y][x] = 999
 
         result: dict[str, Any] = {
             "type": "connections",
             "x": x,
             "y": y,
-            "activation": round(activation, 4),
-            "tension": round(tension, 4),
             "total_dendritas": total_dendritas,
             "total_sinapsis": total_sinapsis,
             "weight_grid": weight_grid,
@@ -732,10 +1095,10 @@ class Experiment(Experimento):
 
         if self.input_enabled:
             res = self.input_resolution
-            input_grid: list[list[float]] = []
-            for r in range(res):
-                input_grid.append(input_weights[r * res : (r + 1) * res])
-            result["input_weight_grid"] = input_grid
+            input_syn = valid & (sources >= input_start) & (sources < input_end)
+            input_flat = torch.zeros(n_input, dtype=weights.dtype, device=weights.device)
+            input_flat[sources[input_syn] - input_start] = weights[input_syn]
+            result["input_weight_grid"] = input_flat.reshape(res, res).tolist()
             result["input_weight_width"] = res
             result["input_weight_height"] = res
         else:
@@ -746,44 +1109,34 @@ class Experiment(Experimento):
     def update_config(self, config: dict[str, Any]) -> bool:
         """Apply config changes to a running experiment.
 
+        Hard changes go through the smallest rebuild that covers them (see
+        _plan_rebuild); trained weights outside the rebuilt block are kept.
+
         Returns True if only soft updates were applied (no rebuild needed).
         """
-        if self.brain_tensor is None:
+        if self.brain_tensor is None and self._wolfram_engine is None:
             return False
-
-        hard_keys = {"grid", "wiring"}
-        hard_input_keys = {"resolution", "dendrite_input_weight"}
-
-        needs_reconnect = False
-        if "grid" in config:
-            old_grid = self._config.get("grid", {})
-            new_grid = config["grid"]
-            if new_grid.get("width") != old_grid.get("width") or new_grid.get("height") != old_grid.get("height"):
-                needs_reconnect = True
-
-        if "wiring" in config and not needs_reconnect:
-            old_wiring = self._config.get("wiring", {})
-            new_wiring = config["wiring"]
-            for k in ("mask", "dendrite_exc_weight", "dendrite_inh_weight"):
-                if new_wiring.get(k) != old_wiring.get(k):
-                    needs_reconnect = True
-                    break
-
-        if "input" in config and not needs_reconnect:
-            new_input = config.get("input") or {}
-            old_input = self._config.get("input") or {}
-            for k in hard_input_keys:
-                if new_input.get(k) != old_input.get(k):
-                    needs_reconnect = True
-                    break
-            input_was_enabled = self._config.get("input") is not None
-            input_now_enabled = config.get("input") is not None
-            if input_was_enabled != input_now_enabled:
-                needs_reconnect = True
-
-        if needs_reconnect:
-            self.setup(config)
+        if self._domain_engine is not None:
+            # Rebuilds and respecializations start from the workers' state
+            self._domain_engine.recoger()
+
+        rebuild = self._plan_rebuild(config)
+        if rebuild == "setup":
+            # A config without a seed keeps the session's, so the saved run still replays it
+            self.setup(config if config.get("seed") is not None else {**config, "seed": self.seed})
             return False
+        if rebuild:
+            wiring = config.get("wiring") or self._config.get("wiring", {})
+            self.dendrite_exc_weight = wiring.get("dendrite_exc_weight")
+            self.dendrite_inh_weight = wiring.get("dendrite_inh_weight")
+            if self.input_enabled:
+                input_cfg = config.get("input") or self._config["input"]
+                self.dendrite_input_weight = input_cfg.get("dendrite_input_weight", 0.2)
+            if rebuild == "lateral":
+                self._mask_type, self._random_weights, self._raw_mask = self._resolve_mask(wiring)
+                self._rebuild_lateral()
+            else:
+                self._rewrite_dendrite_weights()
 
         # Soft updates
         if "learning" in config:
@@ -856,26 +1209,345 @@ class Experiment(Experimento):
                 if new_text != self.input_text:
                     self.input_text = new_text
                     text_changed = True
-                    self._char_index = 0
-                    self._frame_in_char = 0
-                    self._in_gap = False
 
             if "frames_per_char" in input_cfg:
                 self.frames_per_char = max(1, input_cfg["frames_per_char"])
 
-            if (font_changed or text_changed) and not self._is_synthetic_input():
-                self._char_images = {}
-                for char in set(self.input_text):
-                    self._char_images[char] = render_char(
-                        char, self.input_resolution,
-                        font_id=self._font_id, font_size=self._font_size,
-                    )
+            source = input_cfg.get("source", "ascii")
+            dataset_cfg = {k: input_cfg[k] for k in self._DATASET_KEYS if k in input_cfg}
+            source_changed = source != self.input_source or (
+                source == "dataset" and dataset_cfg != self._dataset_cfg
+            )
+            if source_changed:
+                self.input_source = source
+                self._dataset_cfg = dataset_cfg
+
+            if source_changed or font_changed or text_changed:
+                # A new text or source restarts the sequence; a new font keeps its place
+                self._compile_input(keep_position=not (text_changed or source_changed))
+
+        if self._input_schedule is not None:
+            self._input_schedule.set_timing(self.frames_per_char, self.inter_char_noise)
+            self._input_schedule.set_noise(
+                self.background_noise, self.shift_noise and not self._input_synthetic,
+            )
+
+        if "compile" in config:
+            compile_cfg = config["compile"]
+            self._compile_options = dict(compile_cfg) if compile_cfg is not None else None
+
+        domains_changed = False
+        tiling_changed = False
+        if "tiling" in config:
+            tiling_cfg = config["tiling"]
+            tiling = dict(tiling_cfg) if tiling_cfg is not None else None
+            tiling_changed = tiling != self._tiling
+            self._tiling = tiling
+
+        if "domains" in config:
+            domains_cfg = config["domains"]
+            workers = max(1, int(domains_cfg.get("workers", 2))) if domains_cfg is not None else 0
+            domains_changed = workers != self.domain_workers
+            self.domain_workers = workers
+
+        if (self._mask_type == "wolfram" or domains_changed) and self.brain_tensor is not None:
+            # The lookup table depends on process mode and tension function;
+            # a new worker count re-partitions the tissue
+            self._compile_engine()
+        else:
+            self._specialize_step(force=rebuild == "weights" or tiling_changed)
 
         self._config = config
-        return True
+        return rebuild != "lateral"
+
+    # ── Incremental recompile ──
+
+    @staticmethod
+    def _mask_key(wiring: dict[str, Any]) -> Any:
+        return ("deamon", wiring["deamon"]) if "deamon" in wiring else ("mask", wiring.get("mask"))
+
+    def _plan_rebuild(self, config: dict[str, Any]) -> str:
+        """Smallest rebuild covering the hard changes in config.
+
+        Returns:
+            "setup"   — seed, storage, grid size, input on/off, input geometry
+                        or a Wolfram mask changed, or an engine-only Wolfram
+                        grid needs a new rule table: rebuild everything.
+            "lateral" — the lateral mask changed: rebuild the lateral synapse
+                        block, keep the input block and its learned weights.
+            "weights" — only dendrite weights changed: rewrite them in place.
+            ""        — no hard change.
+        """
+        if config.get("seed") is not None and config["seed"] != self.seed:
+            return "setup"
+        if config.get("compact") != self._config.get("compact"):
+            return "setup"
+
+        old_grid = self._config.get("grid", {})
+        new_grid = config.get("grid", old_grid)
+        if (new_grid.get("width"), new_grid.get("height")) != (old_grid.get("width"), old_grid.get("height")):
+            return "setup"
+
+        old_input = self._config.get("input")
+        new_input = config.get("input") if "input" in config else old_input
+        if (old_input is None) != (new_input is None):
+            return "setup"
+        if old_input is not None:
+            for k in ("resolution", "density", "portion"):
+                if new_input.get(k) != old_input.get(k):
+                    return "setup"
+
+        old_wiring = self._config.get("wiring", {})
+        new_wiring = config.get("wiring") or old_wiring
+        if self.brain_tensor is None and (
+            any(new_wiring.get(k) != old_wiring.get(k) for k in ("process_mode", "tension_function"))
+            or config.get("learning") or config.get("spiking")
+        ):
+            # Engine-only Wolfram grid: a new rule table or a stateful feature restarts it
+            return "setup"
+        rebuild = ""
+        if self._mask_key(new_wiring) != self._mask_key(old_wiring):
+            if self._mask_type == "wolfram" or self._resolve_mask(new_wiring)[0] == "wolfram":
+                return "setup"
+            rebuild = "lateral"
+        weight_keys_changed = any(
+            new_wiring.get(k) != old_wiring.get(k)
+            for k in ("dendrite_exc_weight", "dendrite_inh_weight")
+        ) or (
+            old_input is not None
+            and new_input.get("dendrite_input_weight") != old_input.get("dendrite_input_weight")
+        )
+        if weight_keys_changed and not rebuild:
+            rebuild = "setup" if self._mask_type == "wolfram" else "weights"
+        return rebuild
+
+    def _dendrite_weight_table(self) -> torch.Tensor:
+        """Weight per dendrite ID of a tissue neuron: lateral dendrites, then input."""
+        weights = [float(d["peso_dendrita"]) for d in self._lateral_mask() if d["offsets"]]
+        weights.append(self.dendrite_input_weight if self.input_enabled else 0.0)
+        for peso in weights:
+            if peso < -1.0 or peso > 1.0:  # same check as Dendrita
+                raise ValueError(f"Dendrite weight must be in [-1, 1], got: {peso}")
+        return torch.tensor(weights, device=self.brain_tensor.device)
+
+    def _rewrite_dendrite_weights(self) -> None:
+        """Apply dendrite weight overrides in place (same topology)."""
+        bt = self.brain_tensor
+        table = self._dendrite_weight_table()
+        ids = bt.dendrita_ids.long().clamp(max=table.shape[0] - 1)
+        bt.set_dendrite_weights(torch.where(bt.mascara_valida, table[ids], bt.pesos_dendrita))
+        if self._domain_engine is not None:
+            self._domain_engine.cargar(bt, self._learning_params())
+
+    def _rebuild_lateral(self) -> None:
+        """Recompile the lateral synapse block for a new mask, keeping the input block.
+
+        Tissue rows are laid out as [lateral synapses | input synapses]; the
+        input columns (weights included) are carried over unchanged, as are
+        neuron values and adaptation state.
+        """
+        old = self.brain_tensor
+        n = old.n_real
+        n_tissue = self.width * self.height
+        device = old.device
 
-    def reset(self) -> None:
-        self.setup(self._config)
+        lateral = ConstructorTensor.compilar_mascara_2d(
+            self.width, self.height, self._lateral_mask(), self._random_weights, self._generator,
+        )
+        n_lat_syn = lateral["pesos_sinapsis"].shape[1]
+        n_lat_dend = int(lateral["dendrita_ids"].max()) + 1 if n_lat_syn else 0
+
+        # Old input block: columns after the (uniform) lateral synapses
+        old_input = old.es_input_syn[:n_tissue]
+        old_lat_syn = int((old.mascara_valida[0] & ~old_input[0]).sum())
+        n_in_syn = int(old_input.sum(dim=1).max()) if self.input_enabled else 0
+        block = slice(old_lat_syn, old_lat_syn + n_in_syn)
+        in_valid = old.mascara_valida[:n_tissue, block].cpu()
+
+        max_syn = max(1, n_lat_syn + n_in_syn)
+        pesos_s = torch.zeros(n, max_syn)
+        indices = torch.full((n, max_syn), n, dtype=torch.long)
+        pesos_d = torch.zeros(n, max_syn)
+        valida = torch.zeros(n, max_syn, dtype=torch.bool)
+        dend_ids = torch.zeros(n, max_syn, dtype=torch.long)
+
+        lat = slice(0, n_lat_syn)
+        pesos_s[:n_tissue, lat] = lateral["pesos_sinapsis"]
+        indices[:n_tissue, lat] = lateral["indices_fuente"]
+        pesos_d[:n_tissue, lat] = lateral["pesos_dendrita"]
+        valida[:n_tissue, lat] = True
+        dend_ids[:n_tissue, lat] = lateral["dendrita_ids"]
+
+        inp = slice(n_lat_syn, n_lat_syn + n_in_syn)
+        pesos_s[:n_tissue, inp] = old.pesos_sinapsis[:n_tissue, block].cpu()
+        indices[:n_tissue, inp] = old.indices_fuente[:n_tissue, block].cpu()
+        pesos_d[:n_tissue, inp] = torch.where(in_valid, self.dendrite_input_weight, 0.0)
+        valida[:n_tissue, inp] = in_valid
+        dend_ids[:n_tissue, inp] = torch.where(in_valid, n_lat_dend, 0)
+
+        bt = ConstructorTensor.ensamblar(
+            valores=old.valores[:n].cpu(),
+            umbrales=old.umbrales[:n].cpu(),
+            mascara_entrada=old.mascara_entrada[:n].cpu(),
+            pesos_sinapsis=pesos_s,
+            indices_fuente=indices,
+            pesos_dendrita=pesos_d,
+            mascara_valida=valida,
+            dendrita_ids=dend_ids,
+            max_dendritas=max(1, n_lat_dend + (1 if n_in_syn else 0)),
+            device=device,
+            max_active_steps=old.max_active_steps,
+            refractory_steps=old.refractory_steps,
+            adaptation_enabled=old.adaptation_enabled,
+            process_mode=old.process_mode,
+            tension_fns=old.tension_fns,
+            compact=old.compact,
+            weight_dtype=old.weight_dtype,
+        )
+        bt.active_counts[:n] = old.active_counts[:n]
+        bt.refractory_remaining[:n] = old.refractory_remaining[:n]
+        bt.tensiones[:n] = old.tensiones[:n]
+        compartir(bt)
+        self.brain_tensor = bt
+        self._compile_engine()
+
+    def reset(self, seed: int | None = None) -> None:
+        """Reinitialize the network state without rebuilding its topology.
+
+        Compiled indices and dendrites are kept; initial activations and the
+        random synapse scaling are redrawn from the generator reseeded with
+        `seed` (a fresh one when None), adaptation counters are zeroed and
+        the input schedule is rewound. Wolfram masks (tiny grids,
+        deterministic start) still go through setup().
+        """
+        if self.brain_tensor is None or self._mask_type == "wolfram":
+            self.setup(self._config if seed is None else {**self._config, "seed": seed})
+            return
+
+        self.seed = seed if seed is not None else _new_seed()
+        self._generator.manual_seed(self.seed)
+        self._randomize_state()
+        self._compile_engine()
+
+        self.generation = 0
+        self._daemon_history.clear()
+        self._last_history_gen = -1
+        if self.input_enabled:
+            self._input_schedule.rewind()
+            self._project_input()
+
+    def reset_replays_setup(self) -> bool:
+        """Whether reset(seed) ends exactly where setup() with that seed would.
+
+        False when the seed also shaped the topology: input synapses sampled
+        at a density below 1 are only redrawn by setup().
+        """
+        if self.brain_tensor is None or self._mask_type == "wolfram":
+            return True  # reset() goes through setup()
+        return not (self.input_enabled and self.input_portion is None and self.input_density < 1.0)
+
+    def _compile_engine(self) -> None:
+        """Pick the step engine for the compiled network.
+
+        Wolfram masks use the bit-parallel WolframEngine unless adaptation or
+        lateral learning make the step depend on more than three input bits;
+        masks where every tissue neuron shares fixed lateral weights use the
+        FFT engine. Steps they do not cover go through the fused step,
+        respecialized here for the new network, or through the DomainEngine
+        when the "domains" section asks for worker processes.
+        """
+        self._fft_engine = None
+        self._wolfram_engine = None
+        domains = self._mask_type != "wolfram" and self.domain_workers > 0
+        if self._mask_type == "wolfram":
+            if not (self.adaptation_enabled or self._learns_lateral()):
+                self._wolfram_engine = self._compile_wolfram()
+        elif not self._random_weights and not domains:
+            self._fft_engine = FFTEngine.compilar(self.brain_tensor, self.width, self.height)
+        self._specialize_step(force=True)
+        if domains:
+            self._load_domains()
+        else:
+            self._close_domains()
+
+    def _load_domains(self) -> None:
+        """Hand the compiled network to the DomainEngine, starting its workers if needed."""
+        bt = self.brain_tensor
+        engine = self._domain_engine
+        if engine is None or not engine.admite(bt, self.width, self.height, self.domain_workers):
+            self._close_domains()
+            engine = DomainEngine(bt, self.width, self.height, self.domain_workers)
+            self._domain_engine = engine
+        engine.cargar(bt, self._learning_params())
+
+    def _close_domains(self) -> None:
+        if self._domain_engine is not None:
+            self._domain_engine.cerrar()
+            self._domain_engine = None
+
+    def _learning_params(self) -> tuple[float, float, float, float] | None:
+        if not self.learning_enabled:
+            return None
+        return (self.learning_rate, self.lr_exc, self.lr_inh, self.lr_input)
+
+    def _specialize_step(self, force: bool = False) -> None:
+        """(Re)build the fused step if its soft params changed (or force, for a new network).
+
+        The TiledEngine holds copies of the weights and soft params, so it is
+        rebuilt along with the step (and dropped while learning).
+        """
+        bt = self.brain_tensor
+        if bt is None:
+            self._fused_step = None
+            self._tiled_engine = None
+            return
+        learning = self._learning_params()
+        step = self._fused_step
+        if (
+            force or step is None or step.brain_tensor is not bt
+            or step.clave != FusedStep.clave_de(bt, learning, self._compile_options)
+        ):
+            self._fused_step = FusedStep(bt, learning, self._compile_options)
+            self._tiled_engine = None
+            if self._tiling is not None and learning is None and self._mask_type != "wolfram":
+                self._tiled_engine = TiledEngine(
+                    bt, self.width, self.height,
+                    pasos=int(self._tiling.get("steps", 4)),
+                    filas=self._tiling.get("rows"),
+                    hilos=self._tiling.get("threads"),
+                )
+            engine = self._domain_engine
+            if engine is not None and engine.brain_tensor is bt:
+                engine.configurar(learning)
+
+    def _randomize_state(self) -> None:
+        """Draw activations and synapse scaling from the generator; zero adaptation.
+
+        Synapse weights are base × uniform(lo, 1.0) as in
+        Constructor.aplicar_mascara_2d (lateral) and uniform(0.2, 1.0) for
+        input synapses, sampled for the whole network in a few tensor ops.
+        """
+        bt = self.brain_tensor
+        generator = self._generator
+        n_tissue = self._input_start_idx
+        lateral = ConstructorTensor.pesos_mascara_2d(
+            n_tissue, self._lateral_mask(), self._random_weights, generator,
+        )
+        n_lat = lateral.shape[1]
+        bt.pesos_sinapsis[:n_tissue, :n_lat] = lateral.to(bt.device)
+        if self.input_enabled:
+            # Input synapses sit after the lateral block of each tissue row
+            block = bt.pesos_sinapsis[:n_tissue, n_lat:]
+            scale = torch.rand(block.shape, generator=generator).mul_(0.8).add_(0.2)
+            block.copy_(torch.where(bt.es_input_syn[:n_tissue, n_lat:], scale.to(bt.device), block))
+
+        bt.valores.zero_()
+        bt.valores[:n_tissue] = torch.rand(n_tissue, generator=generator).to(bt.device)
+        bt.reset_state()
 
     def is_complete(self) -> bool:
         return False
+
+    def close(self) -> None:
+        """Stop the DomainEngine worker processes, if any."""
+        self._close_domains()
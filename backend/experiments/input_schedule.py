@@ -0,0 +1,225 @@
+"""InputSchedule — precompiled on-device input stream for the input region.
+
+The input sequence (characters or synthetic patterns) is compiled ONCE into
+a [n_items, res*res] tensor of base frames; image datasets are streamed
+from their memory-mapped stack instead, one prefetched block per batch.
+The schedule maps a step
+position to (item, frame within item, gap) arithmetically, and the frames
+for the next batch of steps — shift noise, white noise and inter-char gap
+noise included — are composed with batched tensor ops. Projecting a frame
+into the input region is then a single copy_.
+"""
+
+from __future__ import annotations
+
+import torch
+
+from core.image_dataset import ImageDataset
+
+_BATCH_STEPS = 64
+
+
+class InputSchedule:
+    """Base frames + step schedule + batched noise for one input stream."""
+
+    def __init__(
+        self,
+        base_frames: torch.Tensor | None,
+        resolution: int,
+        frames_per_char: int = 10,
+        inter_char_noise: bool = False,
+        background_noise: float = 0.0,
+        shift_noise: bool = False,
+        generator: torch.Generator | None = None,
+        device: str = "cpu",
+        batch_steps: int = _BATCH_STEPS,
+        dataset: ImageDataset | None = None,
+    ) -> None:
+        """Create a schedule.
+
+        Args:
+            base_frames: Float tensor [n_items, res*res] with one binary frame
+                per item, or None for a pure random-noise stream (no text).
+            resolution: Input grid size (square).
+            frames_per_char: Steps each item stays on the input.
+            inter_char_noise: If True, each item is followed by a gap of
+                frames_per_char random frames.
+            background_noise: Probability of flipping each pixel.
+            shift_noise: If True, each frame is displaced by 1 pixel in a
+                random direction (edges fill with 0).
+            generator: Torch generator used for all noise.
+            device: Device of the composed frames.
+            batch_steps: Number of steps composed per batch.
+            dataset: Image dataset streamed as the item sequence (replaces
+                base_frames).
+        """
+        self.resolution = resolution
+        self.device = base_frames.device if base_frames is not None else torch.device(device)
+        self.base_frames = base_frames
+        self.dataset = dataset
+        if dataset is not None:
+            self.n_items = len(dataset)
+        else:
+            self.n_items = base_frames.shape[0] if base_frames is not None else 0
+        self._shifted = self._compile_shifts(base_frames) if base_frames is not None else None
+        self.generator = generator
+        self.batch_steps = batch_steps
+
+        self.frames_per_char = max(1, frames_per_char)
+        self.inter_char_noise = inter_char_noise
+        self.background_noise = background_noise
+        self.shift_noise = shift_noise
+
+        self.position = 0
+        self.current_frame: torch.Tensor | None = None
+        self._batch: torch.Tensor | None = None
+        self._batch_start = 0
+
+    def _compile_shifts(self, base_frames: torch.Tensor) -> torch.Tensor:
+        """Precompute the 4 one-pixel shifts of every base frame → [n_items, 4, res*res].
+
+        Direction order matches apply_shift_noise: up, down, left, right.
+        """
+        res = self.resolution
+        base = base_frames.reshape(-1, res, res)
+        shifted = torch.zeros(base.shape[0], 4, res, res, dtype=base.dtype, device=base.device)
+        shifted[:, 0, : res - 1, :] = base[:, 1:, :]
+        shifted[:, 1, 1:, :] = base[:, : res - 1, :]
+        shifted[:, 2, :, : res - 1] = base[:, :, 1:]
+        shifted[:, 3, :, 1:] = base[:, :, : res - 1]
+        return shifted.reshape(base.shape[0], 4, res * res)
+
+    # ── Schedule ──
+
+    @property
+    def period(self) -> int:
+        """Steps per item, including its trailing gap when enabled."""
+        return self.frames_per_char * (2 if self.inter_char_noise else 1)
+
+    @property
+    def item_index(self) -> int:
+        if self.n_items == 0:
+            return 0
+        return (self.position // self.period) % self.n_items
+
+    @property
+    def in_gap(self) -> bool:
+        if self.n_items == 0:
+            return False
+        return self.position % self.period >= self.frames_per_char
+
+    @property
+    def frame_in_item(self) -> int:
+        if self.n_items == 0:
+            return 0
+        return self.position % self.period % self.frames_per_char
+
+    def advance(self) -> None:
+        """Move the schedule one step forward."""
+        self.position += 1
+
+    def rewind(self) -> None:
+        """Go back to the first step; frames already composed are discarded."""
+        self.position = 0
+        self.current_frame = None
+        self._batch = None
+
+    def set_timing(self, frames_per_char: int, inter_char_noise: bool) -> None:
+        """Change item duration / gaps, keeping the current item and frame."""
+        frames_per_char = max(1, frames_per_char)
+        if frames_per_char == self.frames_per_char and inter_char_noise == self.inter_char_noise:
+            return
+        item, frame, gap = self.item_index, self.frame_in_item, self.in_gap
+        self.frames_per_char = frames_per_char
+        self.inter_char_noise = inter_char_noise
+        frame = min(frame, frames_per_char - 1)
+        gap_offset = frames_per_char if (gap and inter_char_noise) else 0
+        self.position = item * self.period + gap_offset + frame
+        self._batch = None
+
+    def set_noise(self, background_noise: float, shift_noise: bool) -> None:
+        """Change noise settings; frames already composed are discarded."""
+        if background_noise == self.background_noise and shift_noise == self.shift_noise:
+            return
+        self.background_noise = background_noise
+        self.shift_noise = shift_noise
+        self._batch = None
+
+    # ── Frames ──
+
+    def _item_span(self, start: int, count: int) -> tuple[int, int]:
+        """(first item slot, number of slots) covered by positions [start, start + count)."""
+        first = start // self.period
+        return first, (start + count - 1) // self.period - first + 1
+
+    def _dataset_frames(self, t: torch.Tensor, start: int, count: int) -> torch.Tensor:
+        """Read the dataset block for this batch and queue the next one → [count, res*res]."""
+        first, n_slots = self._item_span(start, count)
+        block = torch.from_numpy(self.dataset.read(first, n_slots)).to(self.device)
+        self.dataset.prefetch(*self._item_span(start + count, count))
+
+        rows = t // self.period - first
+        if self.shift_noise:
+            dirs = torch.randint(0, 4, (count,), generator=self.generator, device=self.device)
+            return self._compile_shifts(block)[rows, dirs]
+        return block[rows]
+
+    def _compose(self, start: int, count: int) -> torch.Tensor:
+        """Compose the frames for schedule positions [start, start + count) → [count, res*res]."""
+        size = self.resolution * self.resolution
+        g = self.generator
+
+        if self.n_items == 0:
+            return torch.randint(0, 2, (count, size), generator=g, device=self.device).float()
+
+        t = torch.arange(start, start + count, device=self.device)
+        items = (t // self.period) % self.n_items
+
+        if self.dataset is not None:
+            frames = self._dataset_frames(t, start, count)
+        elif self.shift_noise:
+            dirs = torch.randint(0, 4, (count,), generator=g, device=self.device)
+            frames = self._shifted[items, dirs]
+        else:
+            frames = self.base_frames[items]
+
+        if self.background_noise > 0:
+            flips = torch.rand(count, size, generator=g, device=self.device) < self.background_noise
+            frames = torch.where(flips, 1.0 - frames, frames)
+
+        if self.inter_char_noise:
+            in_gap = (t % self.period) >= self.frames_per_char
+            gap_frames = torch.randint(0, 2, (count, size), generator=g, device=self.device).float()
+            frames = torch.where(in_gap.unsqueeze(1), gap_frames, frames)
+
+        return frames
+
+    def next_frame(self) -> torch.Tensor:
+        """Return the frame for the current position [res*res], composing a new batch if needed."""
+        offset = self.position - self._batch_start
+        if self._batch is None or not 0 <= offset < self._batch.shape[0]:
+            self._batch = self._compose(self.position, self.batch_steps)
+            self._batch_start = self.position
+            offset = 0
+        self.current_frame = self._batch[offset]
+        return self.current_frame
+
+    def take(self, count: int) -> torch.Tensor:
+        """Frames for the next count steps [count, res*res], advancing past them.
+
+        The same frames (and noise draws) as count rounds of next_frame() +
+        advance(), sliced from whole batches.
+        """
+        parts = []
+        remaining = count
+        while remaining > 0:
+            self.next_frame()  # composes the batch covering the current position
+            offset = self.position - self._batch_start
+            k = min(remaining, self._batch.shape[0] - offset)
+            parts.append(self._batch[offset : offset + k])
+            self.position += k
+            remaining -= k
+        if not parts:
+            return torch.empty(0, self.resolution * self.resolution, device=self.device)
+        self.current_frame = parts[-1][-1]
+        return torch.cat(parts)
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.engine import warm_engine_in_background
+from api.pool import start_experiment_pool, stop_experiment_pool
 from api.routes import router
 from api.websocket import ws_router
 from db import init_db
@@ -15,10 +19,22 @@ logging.basicConfig(level=logging.INFO)
 
 init_db()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # torch/Pillow load (and glyphs pre-render) without delaying startup
+    warm_engine_in_background()
+    # Pre-built template experiments, if NEUROFLOW_POOL_SIZE is set
+    start_experiment_pool()
+    yield
+    stop_experiment_pool()
+
+
 app = FastAPI(
     title="NeuroFlow",
     description="Connectionist neural automata framework",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS — allow frontend origins
@@ -0,0 +1,89 @@
+"""Tests for the shared glyph render cache.
+
+Validates:
+- Repeated renders return the same read-only array
+- Cache keys distinguish resolution, font and padding
+- The in-memory cache is a bounded LRU
+- The on-disk cache serves glyphs after the in-memory cache is cleared, and
+  only holds the warm-up set; the server enables it from NEUROFLOW_GLYPH_CACHE_DIR
+- Warm-up pre-renders the printable ASCII set
+"""
+
+import numpy as np
+import pytest
+
+import api.engine as engine
+import core.ascii_renderer as ascii_renderer
+from core.ascii_renderer import (
+    clear_glyph_cache,
+    configure_glyph_cache,
+    render_char,
+    warm_glyph_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_glyph_cache()
+    yield
+    configure_glyph_cache(None)
+    clear_glyph_cache()
+
+
+class TestGlyphCache:
+    """Process-wide memoization of render_char."""
+
+    def test_repeated_render_is_shared_and_read_only(self) -> None:
+        first = render_char("A", 10)
+        assert render_char("A", 10) is first
+        assert not first.flags.writeable
+        with pytest.raises(ValueError):
+            first[0, 0] = 1.0
+
+    def test_key_includes_resolution_font_and_padding(self) -> None:
+        base = render_char("A", 10)
+        assert render_char("A", 12).shape == (12, 12)
+        assert render_char("A", 10, font_id="silkscreen") is not base
+        assert render_char("A", 10, padding=2) is not base
+        # font_size is ignored by the renderer, so it shares the entry
+        assert render_char("A", 10, font_size=14) is base
+
+    def test_memory_cache_is_bounded_lru(self, monkeypatch) -> None:
+        monkeypatch.setattr(ascii_renderer, "_GLYPH_CACHE_SIZE", 3)
+        first = render_char("A", 10)
+        render_char("B", 10)
+        render_char("C", 10)
+        assert render_char("A", 10) is first  # refreshes A
+        render_char("D", 10)  # evicts B, the least recently used
+        assert list(ascii_renderer._glyph_cache) == [
+            ("C", 10, "press_start_2p", 0),
+            ("A", 10, "press_start_2p", 0),
+            ("D", 10, "press_start_2p", 0),
+        ]
+
+    def test_disk_cache_round_trip(self, tmp_path, monkeypatch) -> None:
+        configure_glyph_cache(tmp_path)
+        rendered = render_char("B", 10).copy()
+        assert len(list(tmp_path.rglob("*.npy"))) == 1
+
+        clear_glyph_cache()
+        monkeypatch.setattr(ascii_renderer, "_render_glyph", None)  # must not render
+        assert np.array_equal(render_char("B", 10), rendered)
+
+    def test_disk_cache_skips_chars_outside_warm_set(self, tmp_path) -> None:
+        configure_glyph_cache(tmp_path)
+        render_char("\u00e9", 10)
+        render_char("B", 13)
+        assert list(tmp_path.rglob("*.npy")) == []
+
+    def test_server_configures_disk_cache_from_env(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv("NEUROFLOW_TOPOLOGY_DIR", raising=False)
+        monkeypatch.setenv("NEUROFLOW_GLYPH_CACHE_DIR", str(tmp_path))
+        engine._configure_storage()
+        render_char("C", 10)
+        assert len(list(tmp_path.rglob("*.npy"))) == 1
+
+    def test_warm_up_renders_printable_ascii(self) -> None:
+        count = warm_glyph_cache(resolutions=(8,))
+        assert count == 95
+        assert len(ascii_renderer._glyph_cache) == 95
@@ -0,0 +1,93 @@
+"""Tests for batched stepping of sessions that share a topology.
+
+Validates:
+- run_batched matches run() on each experiment exactly, for every process
+  mode, with input, learning and adaptation; metrics per network
+- Only networks on the shared topology with the same specialization batch
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.batched_step import BatchedStep, clave_lote
+from experiments.experiment import Experiment
+
+_STATE = ("valores", "tensiones", "pesos_sinapsis", "active_counts", "refractory_remaining")
+
+
+def _config(seed: int, mode: str = "min_vs_max") -> dict:
+    return {
+        "seed": seed,
+        "grid": {"width": 14, "height": 12},
+        "wiring": {"mask": "deamon_3_en_50", "process_mode": mode},
+        "input": {"resolution": 5, "text": "AB"},
+        "learning": {"rate": 0.1, "lr_inh": 0.5},
+        "spiking": {"up_ticks": 3, "down_ticks": 2},
+    }
+
+
+def _experiments(configs: list[dict]) -> list[Experiment]:
+    experiments = []
+    for config in configs:
+        exp = Experiment()
+        exp.setup(config)
+        experiments.append(exp)
+    return experiments
+
+
+class TestEquivalence:
+    """Same result as separate runs."""
+
+    @pytest.mark.parametrize("mode", ["min_vs_max", "avg_vs_avg", "avg_vs_avg_normalized", "sum"])
+    def test_run_batched_matches_run(self, mode: str) -> None:
+        configs = [_config(seed, mode) for seed in (1, 2, 3)]
+        batched, separate = _experiments(configs), _experiments(configs)
+        assert len({exp.batch_key() for exp in batched}) == 1
+        Experiment.run_batched(batched, 12)
+        for exp in separate:
+            exp.run(12)
+        for a, b in zip(batched, separate):
+            assert a.generation == b.generation == 12
+            for name in _STATE:
+                assert torch.equal(getattr(a.brain_tensor, name), getattr(b.brain_tensor, name)), name
+
+    def test_metrics_per_network(self) -> None:
+        configs = [{**_config(seed), "learning": None} for seed in (4, 5)]
+        batched, separate = _experiments(configs), _experiments(configs)
+        buffers = [torch.zeros(9, 2) for _ in batched]
+        BatchedStep([exp._fused_step for exp in batched]).run(9, metricas=buffers, n_tejido=14 * 12)
+        for buffer, exp in zip(buffers, separate):
+            expected = torch.zeros(9, 2)
+            exp._fused_step.run(9, metricas=expected, n_tejido=14 * 12)
+            assert torch.equal(buffer[:, 0], expected[:, 0])
+            assert torch.allclose(buffer[:, 1], expected[:, 1], atol=1e-6)
+
+
+class TestKeys:
+    """What can share a batch."""
+
+    def test_different_specialization_or_grid(self) -> None:
+        base, lr, grid = _experiments([
+            _config(1),
+            {**_config(2), "learning": {"rate": 0.2}},
+            {**_config(3), "grid": {"width": 10, "height": 12}},
+        ])
+        assert base.batch_key() != lr.batch_key()
+        assert base.batch_key() != grid.batch_key()
+        with pytest.raises(ValueError):
+            BatchedStep([base._fused_step, lr._fused_step])
+        with pytest.raises(ValueError):
+            BatchedStep([base._fused_step, base._fused_step])
+
+    def test_detached_topology_does_not_batch(self) -> None:
+        exp, = _experiments([_config(1)])
+        wiring = {**exp._config["wiring"], "dendrite_exc_weight": 0.5}
+        exp.update_config({**exp._config, "wiring": wiring})
+        assert clave_lote(exp._fused_step) is None
+        assert exp.batch_key() is None
+
+    def test_other_engines_do_not_batch(self) -> None:
+        tiled, = _experiments([{**_config(1), "learning": None, "tiling": {"steps": 2}}])
+        assert tiled.batch_key() is None
@@ -1,6 +1,7 @@
 """Tests for BrainTensor — vectorized parallel processing.
 
-Verifies compilation, processing, set_valor, input masks, and get_grid.
+Verifies compilation, processing, set_valor, input masks, get_grid and
+compact storage.
 """
 
 from __future__ import annotations
@@ -205,3 +206,48 @@ class TestBrainTensorProcessing:
         for i in range(N):
             v = brain_tensor.valores[i].item()
             assert v == 0.0 or v == 1.0, f"Neurona {i}: valor={v} (expected 0 or 1)"
+
+
+class TestBrainTensorCompact:
+    """Compact storage: narrow dtypes, float32 accumulation."""
+
+    def test_dtypes_and_storage(self) -> None:
+        brain = _crear_brain_mexican_hat()
+        full = ConstructorTensor.compilar(brain)
+        bt = ConstructorTensor.compilar(brain, compact=True, weight_dtype=torch.float16)
+        assert bt.indices_fuente.dtype == torch.int32
+        assert bt.dendrita_ids.dtype == torch.int16
+        assert bt.pesos_sinapsis.dtype == torch.float16
+        assert bt.active_counts.dtype == torch.uint8
+        assert bt.storage_bytes() < 0.6 * full.storage_bytes()
+
+    def test_exact_weights_match_float32(self) -> None:
+        """With weights representable in float16 both paths agree exactly."""
+        brain = _crear_brain_mexican_hat()
+        for neurona in brain.neuronas:
+            for dendrita in neurona.dendritas:
+                for sinapsis in dendrita.sinapsis:
+                    sinapsis.peso = round(sinapsis.peso * 8) / 8
+        kwargs = {"adaptation_enabled": True, "max_active_steps": 2, "refractory_steps": 2}
+        full = ConstructorTensor.compilar(brain, **kwargs)
+        bt = ConstructorTensor.compilar(brain, compact=True, weight_dtype=torch.float16, **kwargs)
+        for _ in range(5):
+            full.procesar()
+            bt.procesar()
+            assert torch.equal(full.valores, bt.valores)
+            assert torch.allclose(full.tensiones, bt.tensiones)
+        assert torch.equal(full.refractory_remaining, bt.refractory_remaining.long())
+
+    def test_learn_keeps_weight_dtype(self) -> None:
+        bt = ConstructorTensor.compilar(
+            _crear_brain_mexican_hat(), compact=True, weight_dtype=torch.bfloat16,
+        )
+        bt.procesar()
+        bt.learn(lr=0.1)
+        assert bt.pesos_sinapsis.dtype == torch.bfloat16
+
+    def test_ticks_must_fit_uint8(self) -> None:
+        with pytest.raises(ValueError):
+            ConstructorTensor.compilar(
+                _crear_brain_mexican_hat(), compact=True, max_active_steps=300,
+            )
@@ -0,0 +1,97 @@
+"""Tests for config persistence.
+
+Validates:
+- Connections are reused per thread and use WAL journaling
+- Saving an unchanged config is deduplicated by content hash
+- Old databases get config_hash filled in by init_db
+- History is paginated newest page first, each page oldest first
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+import db
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "neuroflow.db"
+    monkeypatch.setattr(db, "DB_PATH", path)
+    db.init_db()
+    return path
+
+
+class TestConnections:
+    """Thread-local pooled connections."""
+
+    def test_same_thread_reuses_connection(self, db_path) -> None:
+        assert db._connect() is db._connect()
+        assert db._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_other_thread_gets_own_connection(self, db_path) -> None:
+        conns = []
+        thread = threading.Thread(target=lambda: conns.append(db._connect()))
+        thread.start()
+        thread.join()
+        assert conns[0] is not db._connect()
+
+
+class TestSaveConfig:
+    """Deduplication by content hash."""
+
+    def test_unchanged_config_is_not_saved_twice(self, db_path) -> None:
+        first = db.save_config("exp", "_default", {"grid": {"width": 10, "height": 10}})
+        assert first > 0
+        # Same content, different key order
+        assert db.save_config("exp", "_default", {"grid": {"height": 10, "width": 10}}) == -1
+        assert db.save_config("exp", "_default", {"grid": {"width": 12, "height": 10}}) > first
+
+    def test_dedup_is_per_preset(self, db_path) -> None:
+        db.save_config("exp", "a", {"x": 1})
+        assert db.save_config("exp", "b", {"x": 1}) > 0
+
+    def test_init_db_backfills_hash(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE config_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "experiment TEXT NOT NULL, config TEXT NOT NULL, "
+            "created_at TEXT NOT NULL DEFAULT (datetime('now')))"
+        )
+        conn.execute(
+            "INSERT INTO config_snapshots (experiment, config) VALUES (?, ?)",
+            ("exp", json.dumps({"x": 1})),
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(db, "DB_PATH", path)
+        db.init_db()
+        assert db.save_config("exp", "_default", {"x": 1}) == -1
+        assert db.get_latest("exp", "_default") == {"x": 1}
+
+
+class TestHistory:
+    """Cursor pagination."""
+
+    def test_pages_walk_back_in_time(self, db_path) -> None:
+        for i in range(5):
+            db.save_config("exp", "_default", {"i": i})
+
+        page, cursor = db.get_history("exp", "_default", limit=2)
+        assert [h["config"]["i"] for h in page] == [3, 4]
+        page, cursor = db.get_history("exp", "_default", before=cursor, limit=2)
+        assert [h["config"]["i"] for h in page] == [1, 2]
+        page, cursor = db.get_history("exp", "_default", before=cursor, limit=2)
+        assert [h["config"]["i"] for h in page] == [0]
+        assert cursor is None
+
+    def test_default_page_returns_everything_when_small(self, db_path) -> None:
+        for i in range(3):
+            db.save_config("exp", "_default", {"i": i})
+        page, cursor = db.get_history("exp", "_default")
+        assert [h["config"]["i"] for h in page] == [0, 1, 2]
+        assert cursor is None
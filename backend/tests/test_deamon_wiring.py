@@ -5,6 +5,7 @@ Validates:
 - noise controls per-neuron scaling only (template weights unchanged)
 - aplicar_mascara_2d uses random_noise to determine scaling range
 - _compute_preview_grid uses the same noise formula as the live network
+- Overlapping contributions are clamped after every addition, in mask order
 """
 
 import random
@@ -264,3 +265,23 @@ class TestPreviewGridNoise:
         n = brain.get_neurona("x20y20")
         exc_d = next(d for d in n.dendritas if d.peso > 0)
         assert all(abs(s.peso - 1.0) < 1e-9 for s in exc_d.sinapsis)
+
+
+class TestPreviewGridOverlap:
+    """Cells reached by several dendrites."""
+
+    @staticmethod
+    def _cell(weights: list[float]) -> float:
+        mask = [{"peso_dendrita": w, "offsets": [(1, 0)]} for w in weights]
+        grid = _compute_preview_grid(mask, grid_width=9, grid_height=9, random_weights=False)
+        return grid[4][5]
+
+    def test_running_sum_is_clamped_after_each_addition(self):
+        # 1 + 1 saturates at 1, then -1 brings it to 0 (not clamp(1) of the total)
+        assert self._cell([1.0, 1.0, -1.0]) == pytest.approx(0.0)
+        assert self._cell([-1.0, -0.5, 0.75]) == pytest.approx(-0.25)
+        assert self._cell([0.5, -1.0, -1.0, 0.25]) == pytest.approx(-0.75)
+
+    def test_same_sign_overlap(self):
+        assert self._cell([0.75, 0.75]) == pytest.approx(1.0)
+        assert self._cell([0.25, 0.5]) == pytest.approx(0.75)
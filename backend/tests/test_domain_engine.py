@@ -0,0 +1,142 @@
+"""Tests for the domain-decomposed (multi-process) engine.
+
+Validates:
+- Row bands and halos: each band reads exactly the rows its mask reaches
+- Steps on worker processes match the single-process fused step exactly,
+  with input, learning and adaptation, one step at a time or in bulk
+- Metrics, inspect and update_config see the workers' state
+- Workers are stopped when the section is removed or the experiment closes
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.domain_engine import DomainEngine, _banda, _bandas
+from experiments.experiment import Experiment
+
+_STATE = ("valores", "tensiones", "pesos_sinapsis", "active_counts", "refractory_remaining")
+
+
+def _config(**extra: object) -> dict:
+    return {
+        "seed": 9,
+        "grid": {"width": 16, "height": 12},
+        "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"},
+        "input": {"resolution": 5, "text": "AB", "density": 0.5},
+        "learning": {"rate": 0.1, "lr_inh": 0.5},
+        "spiking": {"up_ticks": 3, "down_ticks": 2},
+        **extra,
+    }
+
+
+@pytest.fixture
+def pair():
+    """(single-process, 2-worker) experiments with the same config."""
+    ref, dom = Experiment(), Experiment()
+    ref.setup(_config())
+    dom.setup(_config(domains={"workers": 2}))
+    yield ref, dom
+    dom.close()
+
+
+def _assert_same(ref: Experiment, dom: Experiment) -> None:
+    if dom._domain_engine is not None:
+        dom._domain_engine.recoger()
+    for name in _STATE:
+        assert torch.equal(getattr(ref.brain_tensor, name), getattr(dom.brain_tensor, name)), name
+
+
+class TestBands:
+    """Partition of the tissue rows."""
+
+    def test_bands_cover_the_grid(self) -> None:
+        assert _bandas(10, 3) == [(0, 3), (3, 6), (6, 10)]
+
+    def test_halo_is_the_mask_reach(self) -> None:
+        exp = Experiment()
+        exp.setup({"seed": 1, "grid": {"width": 40, "height": 40},
+                   "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"}})
+        radius = max(abs(dy) for d in exp._lateral_mask() for _, dy in d["offsets"])
+        banda = _banda(exp.brain_tensor, 15 * 40, 25 * 40)
+        rows = sorted({int(i) // 40 for i in banda["externos"] if i < 1600})
+        assert rows == [*range(15 - radius, 15), *range(25, 25 + radius)]
+        # Local indices address [own rows | externals]
+        assert int(banda["indices"].max()) < 10 * 40 + banda["externos"].numel()
+
+
+class TestEquivalence:
+    """Same result as one process."""
+
+    def test_single_steps(self, pair) -> None:
+        ref, dom = pair
+        assert isinstance(dom._domain_engine, DomainEngine)
+        assert dom._domain_engine.workers == 2
+        for _ in range(6):
+            ref.step()
+            dom.step()
+        _assert_same(ref, dom)
+
+    def test_bulk_run_and_metrics(self, pair) -> None:
+        ref, dom = pair
+        ref_metrics = ref.run(40, metrics=True)
+        dom_metrics = dom.run(40, metrics=True)
+        _assert_same(ref, dom)
+        assert torch.equal(ref_metrics[:, 0], dom_metrics[:, 0])
+        assert torch.allclose(ref_metrics[:, 1], dom_metrics[:, 1], atol=1e-5)
+        assert ref.get_stats() == dom.get_stats()
+
+    def test_paint_reaches_the_workers(self, pair) -> None:
+        ref, dom = pair
+        for exp in pair:
+            exp.set_cell(3, 4, 1.0)
+            exp.click(8, 0)
+            exp.step_n(3)
+        _assert_same(ref, dom)
+
+    def test_inspect_sees_learned_weights(self, pair) -> None:
+        ref, dom = pair
+        ref.run(15)
+        dom.run(15)
+        assert ref.inspect(5, 5)["input_weight_grid"] == dom.inspect(5, 5)["input_weight_grid"]
+
+
+class TestConfig:
+    """update_config, reset and shutdown."""
+
+    def test_soft_update_reaches_the_workers(self, pair) -> None:
+        ref, dom = pair
+        for exp in pair:
+            exp.run(5)
+            exp.update_config({**exp._config, "learning": {"rate": 0.3}, "spiking": None})
+            exp.run(5)
+        _assert_same(ref, dom)
+
+    def test_weight_rewrite_and_reset(self, pair) -> None:
+        ref, dom = pair
+        for exp in pair:
+            exp.run(5)
+            wiring = {**exp._config["wiring"], "dendrite_inh_weight": -0.5}
+            exp.update_config({**exp._config, "wiring": wiring})
+            exp.run(5)
+        _assert_same(ref, dom)
+        for exp in pair:
+            exp.reset(seed=4)
+            exp.run(5)
+        _assert_same(ref, dom)
+
+    def test_removing_the_section_stops_the_workers(self, pair) -> None:
+        _, dom = pair
+        processes = dom._domain_engine._procesos
+        dom.update_config({**dom._config, "domains": None})
+        assert dom._domain_engine is None
+        assert not any(p.is_alive() for p in processes)
+
+    def test_close(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(domains={"workers": 2}))
+        processes = exp._domain_engine._procesos
+        exp.close()
+        assert exp._domain_engine is None
+        assert not any(p.is_alive() for p in processes)
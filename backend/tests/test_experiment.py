@@ -7,11 +7,16 @@ Validates:
 - Opt-in feature semantics (sections absent = disabled)
 - Daemon metrics
 - Wolfram masks
+- Hard config updates rebuild only what changed
+- Seeded runs are reproducible
+- Compact storage runs end to end
 """
 
+import copy
 import random
 
 import pytest
+import torch
 from core.constructor import Constructor
 from core.masks import (
     MASK_PRESETS,
@@ -98,6 +103,15 @@ class TestMaskPresets:
         with pytest.raises(KeyError):
             get_mask("nonexistent_mask")
 
+    def test_get_mask_is_memoized(self) -> None:
+        assert get_mask("simple") is get_mask("simple")
+        assert MASK_SIMPLE is get_mask("simple")
+
+    def test_unknown_mask_constant_raises(self) -> None:
+        import core.masks
+        with pytest.raises(AttributeError):
+            core.masks.MASK_NONEXISTENT
+
     def test_get_mask_info_excludes_mask_data(self) -> None:
         info = get_mask_info()
         assert len(info) == 49
@@ -254,6 +268,41 @@ class TestExperimentFunctionality:
         exp.reset()
         assert exp.generation == 0
 
+    def test_reset_keeps_topology(self) -> None:
+        exp = Experiment()
+        exp.setup(_nested_config(
+            input={"resolution": 4, "text": "AB", "frames_per_char": 2},
+            learning={"rate": 0.5},
+            spiking={"up_ticks": 2, "down_ticks": 2},
+        ))
+        bt = exp.brain_tensor
+        indices = bt.indices_fuente.clone()
+        for _ in range(5):
+            exp.step()
+        exp.reset()
+
+        assert exp.brain_tensor is bt
+        assert torch.equal(bt.indices_fuente, indices)
+        assert int(bt.active_counts.sum()) == 0
+        assert int(bt.refractory_remaining.sum()) == 0
+        assert exp._input_schedule.item_index == 0
+        lateral = bt.mascara_valida & ~bt.es_input_syn
+        assert float(bt.pesos_sinapsis[lateral].min()) >= 0.2
+        assert float(bt.pesos_sinapsis[bt.es_input_syn].min()) >= 0.2
+
+    def test_reset_with_seed_is_reproducible(self) -> None:
+        exp = Experiment()
+        exp.setup(_nested_config(input={"resolution": 4, "text": "A"}))
+        exp.reset(seed=7)
+        exp.step()
+        first = (exp.brain_tensor.valores.clone(), exp.brain_tensor.pesos_sinapsis.clone())
+        exp.reset(seed=7)
+        exp.step()
+        assert torch.equal(exp.brain_tensor.valores, first[0])
+        assert torch.equal(exp.brain_tensor.pesos_sinapsis, first[1])
+        exp.reset(seed=8)
+        assert not torch.equal(exp.brain_tensor.pesos_sinapsis, first[1])
+
     def test_is_complete_siempre_false(self) -> None:
         exp = Experiment()
         exp.setup(_nested_config(width=5, height=5))
@@ -422,6 +471,26 @@ class TestDaemonMetrics:
         assert stats["noise_cells"] == 1
         assert stats["active_cells"] == 10
 
+    def test_snake_cluster_is_one_daemon(self) -> None:
+        """A long winding cluster needs many labeling rounds but stays one daemon."""
+        exp = Experiment()
+        exp.setup(_nested_config(width=20, height=20))
+        for i in range(exp.brain_tensor.n_real):
+            exp.brain_tensor.set_valor(i, 0.0)
+        cells = 0
+        for row in range(0, 20, 2):
+            for col in range(20):
+                exp.brain_tensor.set_valor(row * 20 + col, 1.0)
+                cells += 1
+            if row + 1 < 20:
+                link_col = 19 if (row // 2) % 2 == 0 else 0
+                exp.brain_tensor.set_valor((row + 1) * 20 + link_col, 1.0)
+                cells += 1
+        stats = exp.get_stats()
+        assert stats["daemon_count"] == 1
+        assert stats["avg_daemon_size"] == float(cells)
+        assert stats["active_cells"] == cells
+
     def test_exclusion_with_daemon_and_noise(self) -> None:
         exp = Experiment()
         exp.setup(_nested_config())
@@ -552,3 +621,175 @@ class TestWolframMasks:
         exp.step()
         exp.setup(_nested_config(width=10, height=10, mask="simple"))
         assert exp._mask_type == "kohonen"
+
+
+class TestIncrementalRecompile:
+    """update_config picks the smallest rebuild for hard changes."""
+
+    @staticmethod
+    def _input_config(mask: str = "simple") -> dict:
+        return _nested_config(
+            width=8, height=8, mask=mask,
+            input={"resolution": 4, "dendrite_input_weight": 0.2, "text": "A"},
+            learning={"rate": 0.1},
+        )
+
+    def test_dendrite_weight_change_is_rewritten_in_place(self) -> None:
+        exp = Experiment()
+        cfg = self._input_config()
+        exp.setup(cfg)
+        bt = exp.brain_tensor
+        exp.step()
+        pesos_before = bt.pesos_sinapsis.clone()
+
+        new_cfg = copy.deepcopy(cfg)
+        new_cfg["wiring"]["dendrite_exc_weight"] = 0.5
+        new_cfg["input"]["dendrite_input_weight"] = 0.7
+        assert exp.update_config(new_cfg) is True
+
+        assert exp.brain_tensor is bt
+        assert exp.generation == 1
+        assert torch.equal(bt.pesos_sinapsis, pesos_before)
+        assert torch.allclose(bt.pesos_dendrita[bt.es_exc_syn], torch.tensor(0.5))
+        assert torch.allclose(bt.pesos_dendrita[bt.es_input_syn], torch.tensor(0.7))
+
+        fresh = Experiment()
+        fresh.setup(new_cfg)
+        assert torch.equal(bt.pesos_dendrita, fresh.brain_tensor.pesos_dendrita)
+        assert torch.equal(bt._dend_pesos, fresh.brain_tensor._dend_pesos)
+
+    def test_mask_change_keeps_input_block(self) -> None:
+        exp = Experiment()
+        cfg = self._input_config()
+        exp.setup(cfg)
+        old = exp.brain_tensor
+        old.pesos_sinapsis[old.es_input_syn] = 0.42  # "learned" input weights
+        n_input_before = int(old.es_input_syn.sum())
+
+        new_cfg = copy.deepcopy(cfg)
+        new_cfg["wiring"]["mask"] = "deamon_e3_g2_i12_mhat_sq"
+        assert exp.update_config(new_cfg) is False
+
+        bt = exp.brain_tensor
+        assert bt is not old
+        assert int(bt.es_input_syn.sum()) == n_input_before
+        assert torch.allclose(bt.pesos_sinapsis[bt.es_input_syn], torch.tensor(0.42))
+
+        fresh = Experiment()
+        fresh.setup(new_cfg)
+        ref = fresh.brain_tensor
+        assert bt.pesos_sinapsis.shape == ref.pesos_sinapsis.shape
+        assert bt.max_dendritas == ref.max_dendritas
+        lateral = ref.mascara_valida & ~ref.es_input_syn
+        assert torch.equal(bt.mascara_valida & ~bt.es_input_syn, lateral)
+        assert torch.equal(bt.indices_fuente[lateral], ref.indices_fuente[lateral])
+        assert torch.equal(bt.pesos_sinapsis[lateral], ref.pesos_sinapsis[lateral])
+        assert torch.equal(bt.dendrita_ids, ref.dendrita_ids)
+        assert torch.equal(bt.pesos_dendrita, ref.pesos_dendrita)
+        exp.step()
+
+    def test_topology_changes_still_rebuild(self) -> None:
+        exp = Experiment()
+        cfg = _nested_config(width=8, height=8)
+        exp.setup(cfg)
+        assert exp._plan_rebuild(_nested_config(width=9, height=8)) == "setup"
+        assert exp._plan_rebuild(_nested_config(width=8, height=8, mask="rule_30")) == "setup"
+        assert exp._plan_rebuild(_nested_config(width=8, height=8, mask="mexican_hat")) == "lateral"
+        assert exp._plan_rebuild(cfg) == ""
+
+
+class TestSeededInit:
+    """All random initialization comes from the per-experiment seed."""
+
+    @staticmethod
+    def _config(width: int = 8, **extra: object) -> dict:
+        return _nested_config(
+            width=width, height=8,
+            input={"resolution": 4, "text": "AB", "density": 0.5},
+            noise={"background": 0.1},
+            **extra,
+        )
+
+    def test_same_seed_same_run(self) -> None:
+        runs = []
+        for _ in range(2):
+            exp = Experiment()
+            exp.setup(self._config(seed=123))
+            exp.step_n(3)
+            bt = exp.brain_tensor
+            runs.append((bt.indices_fuente, bt.pesos_sinapsis, bt.valores))
+        for a, b in zip(*runs):
+            assert torch.equal(a, b)
+
+        other = Experiment()
+        other.setup(self._config(seed=124))
+        assert not torch.equal(other.brain_tensor.pesos_sinapsis, runs[0][1])
+
+    def test_reset_with_setup_seed_replays_setup(self) -> None:
+        exp = Experiment()
+        exp.setup(self._config(seed=5))
+        initial = (exp.brain_tensor.pesos_sinapsis.clone(), exp.brain_tensor.valores.clone())
+        exp.step_n(4)
+        exp.reset(seed=5)
+        assert torch.equal(exp.brain_tensor.pesos_sinapsis, initial[0])
+        assert torch.equal(exp.brain_tensor.valores, initial[1])
+
+    def test_seed_is_reported(self) -> None:
+        exp = Experiment()
+        exp.setup(self._config())
+        assert exp.get_stats()["seed"] == exp.seed
+        exp.reset(seed=9)
+        assert exp.get_stats()["seed"] == 9
+
+    def test_rebuild_without_seed_keeps_session_seed(self) -> None:
+        exp = Experiment()
+        exp.setup(self._config(seed=5))
+        exp.update_config(self._config(width=10))  # grid change: full rebuild
+        assert exp.seed == 5
+        fresh = Experiment()
+        fresh.setup(self._config(width=10, seed=5))
+        assert torch.equal(exp.brain_tensor.pesos_sinapsis, fresh.brain_tensor.pesos_sinapsis)
+        assert torch.equal(exp.brain_tensor.valores, fresh.brain_tensor.valores)
+
+    def test_density_samples_distinct_inputs(self) -> None:
+        exp = Experiment()
+        exp.setup(self._config(seed=1))
+        bt = exp.brain_tensor
+        for row in range(64):
+            sources = bt.indices_fuente[row][bt.es_input_syn[row]]
+            assert sources.numel() == 8
+            assert sources.unique().numel() == 8
+
+
+class TestCompactStorage:
+    """The opt-in compact section."""
+
+    def test_compact_experiment_runs(self) -> None:
+        cfg = _nested_config(
+            width=8, height=8, seed=3,
+            input={"resolution": 4, "text": "A"},
+            learning={"rate": 0.1},
+            spiking={"up_ticks": 2, "down_ticks": 2},
+            compact={"weights": "bfloat16"},
+        )
+        exp = Experiment()
+        exp.setup(cfg)
+        assert exp.brain_tensor.pesos_sinapsis.dtype == torch.bfloat16
+        exp.step_n(3)
+        assert exp.inspect(2, 2)["total_sinapsis"] > 0
+
+        new_cfg = copy.deepcopy(cfg)
+        new_cfg["wiring"]["dendrite_exc_weight"] = 0.5
+        assert exp.update_config(new_cfg) is True
+        assert exp.brain_tensor.pesos_dendrita.dtype == torch.bfloat16
+        exp.reset(seed=4)
+        exp.step()
+
+    def test_unknown_weight_dtype_raises(self) -> None:
+        with pytest.raises(ValueError):
+            Experiment().setup(_nested_config(compact={"weights": "int8"}))
+
+    def test_toggling_compact_rebuilds(self) -> None:
+        exp = Experiment()
+        exp.setup(_nested_config())
+        assert exp._plan_rebuild(_nested_config(compact={})) == "setup"
@@ -0,0 +1,147 @@
+"""Tests for the FFT engine of fixed-weight masks.
+
+Validates:
+- It is selected only for masks with shared fixed lateral weights
+- Complete square rings go to box sums, other dendrites to the FFT
+- Steps match BrainTensor.procesar (values exactly, tensions within float tolerance)
+- Non-binary state falls back to procesar
+- Lateral learning switches it off; reset switches it back on
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.fft_engine import FFTEngine, _anillos_cuadrados
+from experiments.experiment import Experiment
+
+_FIXED_DEAMON = {
+    "shape": "square",
+    "fixed": True,
+    "excitatory": {"offset": 2, "weights": [1.0, 0.7, 0.3]},
+    "gap": {"offset": 1, "size": 2},
+    "inhibitory": {"offset": 6, "weights": [0.9, 0.5, 0.2], "sectors": 8},
+}
+
+# Only square rings (sectors 1) and dyadic weights: float32 gather sums are exact
+_BOX_DEAMON = {
+    "shape": "square",
+    "fixed": True,
+    "excitatory": {"offset": 3, "weights": [1.0, 0.75, 0.5]},
+    "gap": {"offset": 1, "size": 2},
+    "inhibitory": {"offset": 12, "weights": [0.75, 0.5], "sectors": 1},
+}
+
+
+def _config(wiring: dict, **extra: object) -> dict:
+    return {"seed": 11, "grid": {"width": 24, "height": 20}, "wiring": wiring, **extra}
+
+
+def _run(config: dict, steps: int, fft: bool) -> list[tuple[torch.Tensor, torch.Tensor]]:
+    exp = Experiment()
+    exp.setup(config)
+    if not fft:
+        exp._fft_engine = None
+    states = []
+    for _ in range(steps):
+        exp.step()
+        states.append((exp.brain_tensor.valores.clone(), exp.brain_tensor.tensiones.clone()))
+    return states
+
+
+class TestSelection:
+    """Which experiments get the engine."""
+
+    def test_fixed_preset_uses_fft(self) -> None:
+        exp = Experiment()
+        exp.setup(_config({"mask": "deamon_e3_g2_i12_mhat_sq", "process_mode": "min_vs_max"}))
+        assert isinstance(exp._fft_engine, FFTEngine)
+
+    def test_random_weights_do_not(self) -> None:
+        exp = Experiment()
+        exp.setup(_config({"mask": "simple", "process_mode": "min_vs_max"}))
+        assert exp._fft_engine is None
+
+    def test_wolfram_does_not(self) -> None:
+        exp = Experiment()
+        exp.setup(_config({"mask": "rule_30", "process_mode": "min_vs_max"}))
+        assert exp._fft_engine is None
+
+
+class TestBoxSums:
+    """Square-ring dendrites are read from a summed-area table."""
+
+    def test_rings_recognized(self) -> None:
+        dx = [x for x in range(-2, 3) for y in range(-2, 3) if (x, y) != (0, 0)]
+        dy = [y for x in range(-2, 3) for y in range(-2, 3) if (x, y) != (0, 0)]
+        b = [1.0 if max(abs(x), abs(y)) == 1 else 0.5 for x, y in zip(dx, dy)]
+        assert _anillos_cuadrados(dx, dy, b, 5) == [(1, 1.0), (2, 0.5)]
+
+    def test_partial_or_mixed_rings_rejected(self) -> None:
+        dx, dy = [1, 1, 0, -1, -1, -1, 0], [0, 1, 1, 1, 0, -1, -1]
+        assert _anillos_cuadrados(dx, dy, [1.0] * 7, 5) is None
+        dx, dy = dx + [1], dy + [-1]
+        assert _anillos_cuadrados(dx, dy, [1.0] * 7 + [0.5], 5) is None
+        assert _anillos_cuadrados(dx, dy, [1.0] * 8, 0) is None
+
+    def test_preset_routing(self) -> None:
+        exp = Experiment()
+        exp.setup(_config({"mask": "deamon_e3_g2_i12_mhat_sq", "process_mode": "min_vs_max"}))
+        engine = exp._fft_engine
+        assert engine._sat_ids.tolist() == [0]
+        assert engine._fft_ids.tolist() == list(range(1, engine.n_dendritas))
+
+    @pytest.mark.parametrize("process_mode", ["min_vs_max", "avg_vs_avg_normalized"])
+    def test_matches_procesar(self, process_mode: str) -> None:
+        config = {
+            "seed": 11,
+            "grid": {"width": 32, "height": 30},
+            "wiring": {"deamon": _BOX_DEAMON, "process_mode": process_mode},
+            "input": {"resolution": 6, "text": "AB", "density": 0.5},
+        }
+        exp = Experiment()
+        exp.setup(config)
+        assert exp._fft_engine._espectros is None
+        for (v_fft, t_fft), (v_ref, t_ref) in zip(_run(config, 15, True), _run(config, 15, False)):
+            assert torch.equal(v_fft, v_ref)
+            assert torch.allclose(t_fft, t_ref, atol=1e-6)
+
+
+class TestEquivalence:
+    """Same dynamics as the gather path."""
+
+    @pytest.mark.parametrize("process_mode", ["min_vs_max", "sum", "avg_vs_avg", "avg_vs_avg_normalized"])
+    def test_matches_procesar(self, process_mode: str) -> None:
+        config = _config(
+            {"deamon": _FIXED_DEAMON, "process_mode": process_mode},
+            input={"resolution": 6, "text": "AB", "density": 0.5},
+            spiking={"up_ticks": 3, "down_ticks": 2},
+        )
+        for (v_fft, t_fft), (v_ref, t_ref) in zip(_run(config, 15, True), _run(config, 15, False)):
+            assert torch.equal(v_fft, v_ref)
+            assert torch.allclose(t_fft, t_ref, atol=1e-6)
+
+    def test_non_binary_state_falls_back(self) -> None:
+        exp = Experiment()
+        exp.setup(_config({"mask": "deamon_e3_g2_i12_mhat_sq", "process_mode": "min_vs_max"}))
+        # Initial activations are uniform in [0, 1): the first step must gather
+        assert exp._fft_engine.procesar() is False
+        exp.brain_tensor.procesar()
+        assert exp._fft_engine.procesar() is True
+
+
+class TestLearning:
+    """Learning lateral weights breaks the shared kernel."""
+
+    def test_learning_disables_and_reset_restores(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(
+            {"mask": "deamon_e3_g2_i12_mhat_sq", "process_mode": "min_vs_max"},
+            learning={"rate": 0.1},
+        ))
+        assert exp._fft_engine is not None
+        exp.step()
+        assert exp._fft_engine is None
+        exp.reset(seed=1)
+        assert exp._fft_engine is not None
@@ -0,0 +1,158 @@
+"""Tests for the specialized (fused) step.
+
+Validates:
+- It matches procesar() + learn() exactly for every process mode, with
+  tension polynomial, adaptation, learning and compact storage
+- The torch.compile path gives the same result and falls back to eager on failure
+- update_config respecializes only when a soft param it depends on changes
+- run(n) with input and learning matches n single steps; metrics per step
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.fused_step import METRICA_ACTIVAS, METRICA_TENSION
+from experiments.experiment import Experiment
+
+_STATE = ("valores", "tensiones", "active_counts", "refractory_remaining", "pesos_sinapsis")
+
+
+def _config(process_mode: str = "min_vs_max", **extra: object) -> dict:
+    return {
+        "seed": 5,
+        "grid": {"width": 16, "height": 12},
+        "wiring": {"mask": "deamon_3_en_50", "process_mode": process_mode},
+        "input": {"resolution": 5, "text": "AB", "density": 0.5},
+        **extra,
+    }
+
+
+_ALL_ON = {
+    "spiking": {"up_ticks": 3, "down_ticks": 2},
+    "learning": {"rate": 0.1, "lr_inh": 0.5},
+}
+
+
+def _assert_matches_reference(config: dict, steps: int = 10) -> None:
+    fused, ref = Experiment(), Experiment()
+    fused.setup(config)
+    ref.setup(config)
+    for _ in range(steps):
+        fused._fused_step()
+        ref.brain_tensor.procesar()
+        if ref.learning_enabled:
+            ref.brain_tensor.learn(
+                lr=ref.learning_rate, lr_exc=ref.lr_exc, lr_inh=ref.lr_inh, lr_input=ref.lr_input,
+            )
+        for name in _STATE:
+            assert torch.equal(getattr(fused.brain_tensor, name), getattr(ref.brain_tensor, name)), name
+
+
+class TestEquivalence:
+    """Bit-identical to the reference step."""
+
+    @pytest.mark.parametrize("process_mode", ["min_vs_max", "sum", "avg_vs_avg", "avg_vs_avg_normalized"])
+    def test_all_features(self, process_mode: str) -> None:
+        config = _config(process_mode, **_ALL_ON)
+        config["wiring"]["tension_function"] = {"x": 0.5, "x_pow_3": 0.5}
+        _assert_matches_reference(config)
+
+    @pytest.mark.parametrize("process_mode", ["min_vs_max", "avg_vs_avg"])
+    def test_plain(self, process_mode: str) -> None:
+        _assert_matches_reference(_config(process_mode))
+
+    def test_compact(self) -> None:
+        _assert_matches_reference(_config(compact={"weights": "float16"}, **_ALL_ON))
+
+
+class TestCompile:
+    """torch.compile is opt-in and never required."""
+
+    def test_compiled_matches(self) -> None:
+        _assert_matches_reference(_config(compile={"backend": "eager"}, **_ALL_ON), steps=3)
+
+    def test_failure_falls_back_to_eager(self) -> None:
+        def broken(gm: object, example_inputs: object) -> object:
+            raise RuntimeError("no compiler")
+
+        exp = Experiment()
+        exp.setup(_config(compile={"backend": broken}))
+        assert exp._fused_step.compilado
+        exp.step()
+        assert not exp._fused_step.compilado
+
+
+class TestInvalidation:
+    """update_config respecializes on the params the step is built for."""
+
+    def test_unchanged_config_keeps_step(self) -> None:
+        exp = Experiment()
+        config = _config()
+        exp.setup(config)
+        step = exp._fused_step
+        exp.update_config(config)
+        assert exp._fused_step is step
+
+    @pytest.mark.parametrize("change", [
+        {"wiring": {"mask": "deamon_3_en_50", "process_mode": "sum"}},
+        {"wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max", "tension_function": {"x_pow_2": 1.0}}},
+        {"spiking": {"up_ticks": 4}},
+        {"learning": {"rate": 0.2}},
+    ])
+    def test_soft_change_respecializes(self, change: dict) -> None:
+        exp = Experiment()
+        config = _config()
+        exp.setup(config)
+        step = exp._fused_step
+        exp.update_config({**config, **change})
+        assert exp._fused_step is not step
+        assert exp._fused_step.clave != step.clave
+        assert exp._fused_step.aprende == exp.learning_enabled
+
+
+class TestRun:
+    """Bulk steps stay on the engine and match single steps."""
+
+    @staticmethod
+    def _noisy_config() -> dict:
+        config = _config(**_ALL_ON)
+        config["input"] = {**config["input"], "frames_per_char": 3}
+        config["noise"] = {"background": 0.05, "shift": True, "inter_char": True}
+        return config
+
+    def test_matches_single_steps(self) -> None:
+        single, bulk = Experiment(), Experiment()
+        single.setup(self._noisy_config())
+        bulk.setup(self._noisy_config())
+        for _ in range(20):
+            single.step()
+        bulk.run(7)
+        bulk.run(13)
+        assert bulk.generation == single.generation == 20
+        assert bulk._input_schedule.position == single._input_schedule.position
+        assert bulk.get_input_frame() == single.get_input_frame()
+        for name in _STATE:
+            assert torch.equal(getattr(bulk.brain_tensor, name), getattr(single.brain_tensor, name)), name
+
+    def test_metrics(self) -> None:
+        single, bulk = Experiment(), Experiment()
+        single.setup(self._noisy_config())
+        bulk.setup(self._noisy_config())
+        metrics = bulk.run(5, metrics=True)
+        n_tissue = single.width * single.height
+        assert metrics.shape == (5, 2)
+        for k in range(5):
+            single.step()
+            bt = single.brain_tensor
+            assert metrics[k, METRICA_ACTIVAS] == (bt.valores[:n_tissue] > 0.5).sum()
+            assert metrics[k, METRICA_TENSION] == bt.tensiones[:n_tissue].mean()
+
+    def test_step_n_returns_last_frame(self) -> None:
+        exp = Experiment()
+        exp.setup(_config())
+        result = exp.step_n(4)
+        assert result["generation"] == 4
+        assert result["grid"] == exp.get_frame()
+
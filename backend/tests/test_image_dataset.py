@@ -0,0 +1,114 @@
+"""Tests for ImageDataset — memory-mapped image stacks as an input stream.
+
+Validates:
+- Images are resized and thresholded once, then served from the cache
+- Raw uint8 files are read with an explicit image_shape
+- Paths outside the datasets directory are rejected
+- Reads wrap around the end of the stack; prefetched reads match direct reads
+- Experiment streams dataset frames into the input region
+"""
+
+import numpy as np
+import pytest
+
+import core.image_dataset as image_dataset
+from core.image_dataset import ImageDataset
+from experiments.experiment import Experiment
+
+
+@pytest.fixture
+def datasets_dir(tmp_path, monkeypatch):
+    root = tmp_path / "datasets"
+    root.mkdir()
+    monkeypatch.setattr(image_dataset, "DATASETS_DIR", root)
+    monkeypatch.setattr(image_dataset, "CACHE_DIR", tmp_path / "cache")
+    return root
+
+
+def _stack(n: int = 5, size: int = 8) -> np.ndarray:
+    """n images where image i has its first i+1 rows bright."""
+    stack = np.zeros((n, size, size), dtype=np.uint8)
+    for i in range(n):
+        stack[i, : i + 1, :] = 255
+    return stack
+
+
+class TestPreprocessing:
+    """Resize + threshold into a cached 0/1 stack."""
+
+    def test_same_resolution_is_thresholded(self, datasets_dir) -> None:
+        np.save(datasets_dir / "rows.npy", _stack())
+        ds = ImageDataset("rows.npy", 8)
+        assert len(ds) == 5
+        frames = ds.read(2, 1).reshape(8, 8)
+        assert frames[:3].sum() == 24
+        assert frames[3:].sum() == 0
+
+    def test_downscale_uses_box_filter(self, datasets_dir) -> None:
+        np.save(datasets_dir / "rows.npy", _stack(size=8))
+        ds = ImageDataset("rows.npy", 4, threshold=0.4)
+        # Image 0: only row 0 bright → every 2x2 block in row 0 is 50% → active
+        frame = ds.read(0, 1).reshape(4, 4)
+        assert frame[0].tolist() == [1, 1, 1, 1]
+        assert frame[1:].sum() == 0
+
+    def test_cache_is_reused(self, datasets_dir, tmp_path) -> None:
+        np.save(datasets_dir / "rows.npy", _stack())
+        ImageDataset("rows.npy", 8)
+        cached = list((tmp_path / "cache").iterdir())
+        assert len(cached) == 1
+        mtime = cached[0].stat().st_mtime_ns
+        ImageDataset("rows.npy", 8)
+        assert cached[0].stat().st_mtime_ns == mtime
+
+    def test_raw_file_with_image_shape(self, datasets_dir) -> None:
+        _stack(n=3).tofile(datasets_dir / "rows.raw")
+        ds = ImageDataset("rows.raw", 8, image_shape=(8, 8))
+        assert len(ds) == 3
+        with pytest.raises(ValueError):
+            ImageDataset("rows.raw", 8)
+
+    def test_path_outside_datasets_dir_rejected(self, datasets_dir) -> None:
+        with pytest.raises(ValueError):
+            ImageDataset("../secret.npy", 8)
+        with pytest.raises(FileNotFoundError):
+            ImageDataset("missing.npy", 8)
+
+
+class TestReads:
+    """Block reads over the preprocessed stack."""
+
+    def test_read_wraps_around(self, datasets_dir) -> None:
+        np.save(datasets_dir / "rows.npy", _stack())
+        ds = ImageDataset("rows.npy", 8)
+        block = ds.read(4, 3)
+        assert block.dtype == np.float32
+        assert [int(f.sum()) // 8 for f in block] == [5, 1, 2]
+
+    def test_prefetched_read_matches_direct_read(self, datasets_dir) -> None:
+        np.save(datasets_dir / "rows.npy", _stack())
+        ds = ImageDataset("rows.npy", 8)
+        ds.prefetch(3, 4)
+        assert np.array_equal(ds.read(3, 4), ds._read(3, 4))
+
+
+class TestExperimentStreaming:
+    """input.source == "dataset" drives the input region."""
+
+    def test_frames_follow_dataset(self, datasets_dir) -> None:
+        np.save(datasets_dir / "rows.npy", _stack())
+        exp = Experiment()
+        exp.setup({
+            "grid": {"width": 10, "height": 10},
+            "wiring": {"mask": "simple", "process_mode": "min_vs_max"},
+            "input": {"source": "dataset", "path": "rows.npy", "resolution": 8, "frames_per_char": 2},
+        })
+        chars, rows = [], []
+        for _ in range(12):
+            chars.append(exp.get_stats()["current_char"])
+            exp.step()
+            rows.append(int(np.sum(exp.get_input_frame())) // 8)
+        assert chars[:4] == ["#0", "#0", "#1", "#1"]
+        assert rows[:4] == [1, 1, 2, 2]
+        # Wraps back to the first image after the last one
+        assert (chars[10], rows[10]) == ("#0", 1)
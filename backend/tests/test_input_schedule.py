@@ -0,0 +1,128 @@
+"""Tests for InputSchedule — precompiled on-device input frames.
+
+Validates:
+- Item / frame / gap bookkeeping follows frames_per_char and inter_char_noise
+- Noise-free frames are exactly the base frames
+- Shift noise matches apply_shift_noise
+- Retiming keeps the current item
+- take(n) gives the same frames as n single steps
+- Experiment projects the scheduled frame into the input region
+"""
+
+import numpy as np
+import torch
+
+from core.ascii_renderer import apply_shift_noise
+from experiments.experiment import Experiment
+from experiments.input_schedule import InputSchedule
+
+
+def _base_frames(n_items: int = 3, res: int = 4) -> torch.Tensor:
+    gen = torch.Generator().manual_seed(0)
+    return torch.randint(0, 2, (n_items, res * res), generator=gen).float()
+
+
+class TestSchedule:
+    """Schedule position → (item, frame, gap)."""
+
+    def test_items_advance_every_frames_per_char(self) -> None:
+        sched = InputSchedule(_base_frames(), 4, frames_per_char=2)
+        seen = []
+        for _ in range(7):
+            seen.append((sched.item_index, sched.frame_in_item, sched.in_gap))
+            sched.advance()
+        assert seen == [
+            (0, 0, False), (0, 1, False),
+            (1, 0, False), (1, 1, False),
+            (2, 0, False), (2, 1, False),
+            (0, 0, False),
+        ]
+
+    def test_inter_char_gap_follows_each_item(self) -> None:
+        sched = InputSchedule(_base_frames(), 4, frames_per_char=2, inter_char_noise=True)
+        seen = []
+        for _ in range(5):
+            seen.append((sched.item_index, sched.frame_in_item, sched.in_gap))
+            sched.advance()
+        assert seen == [
+            (0, 0, False), (0, 1, False),
+            (0, 0, True), (0, 1, True),
+            (1, 0, False),
+        ]
+
+    def test_set_timing_keeps_current_item(self) -> None:
+        sched = InputSchedule(_base_frames(), 4, frames_per_char=5)
+        for _ in range(7):
+            sched.advance()
+        assert (sched.item_index, sched.frame_in_item) == (1, 2)
+        sched.set_timing(frames_per_char=2, inter_char_noise=False)
+        assert (sched.item_index, sched.frame_in_item) == (1, 1)
+
+
+class TestFrames:
+    """Composed frames."""
+
+    def test_noise_free_frames_equal_base(self) -> None:
+        base = _base_frames()
+        sched = InputSchedule(base, 4, frames_per_char=1)
+        for i in range(6):
+            assert torch.equal(sched.next_frame(), base[i % 3])
+            sched.advance()
+
+    def test_shifted_frames_match_apply_shift_noise(self) -> None:
+        base = _base_frames(n_items=1)
+        sched = InputSchedule(base, 4, shift_noise=True)
+        frame = base[0].reshape(4, 4).numpy()
+        candidates = set()
+        for seed in range(50):
+            shifted = apply_shift_noise(frame, np.random.default_rng(seed))
+            candidates.add(tuple(shifted.flatten().tolist()))
+        for _ in range(20):
+            assert tuple(sched.next_frame().tolist()) in candidates
+            sched.advance()
+
+    def test_same_position_returns_same_frame(self) -> None:
+        sched = InputSchedule(_base_frames(), 4, background_noise=0.3)
+        first = sched.next_frame().clone()
+        assert torch.equal(sched.next_frame(), first)
+
+    def test_no_text_gives_random_binary_frames(self) -> None:
+        sched = InputSchedule(None, 4)
+        frame = sched.next_frame()
+        assert frame.shape == (16,)
+        assert set(frame.tolist()) <= {0.0, 1.0}
+
+    def test_take_matches_single_steps(self) -> None:
+        def schedule() -> InputSchedule:
+            return InputSchedule(
+                _base_frames(), 4, frames_per_char=3, inter_char_noise=True,
+                background_noise=0.1, shift_noise=True,
+                generator=torch.Generator().manual_seed(7), batch_steps=5,
+            )
+
+        single, bulk = schedule(), schedule()
+        expected = []
+        for _ in range(13):
+            expected.append(single.next_frame())
+            single.advance()
+        frames = torch.cat([bulk.take(4), bulk.take(9)])
+        assert torch.equal(frames, torch.stack(expected))
+        assert bulk.position == single.position
+        assert torch.equal(bulk.current_frame, single.current_frame)
+
+
+class TestExperimentProjection:
+    """Experiment copies the scheduled frame into valores."""
+
+    def test_projected_frame_matches_input_frame(self) -> None:
+        exp = Experiment()
+        exp.setup({
+            "grid": {"width": 10, "height": 10},
+            "wiring": {"mask": "simple", "process_mode": "min_vs_max"},
+            "input": {"text": "HALF_TOP,HALF_BOT", "resolution": 10, "frames_per_char": 1},
+        })
+        exp.step()
+        start = exp._input_start_idx
+        projected = exp.brain_tensor.valores[start:start + 100].reshape(10, 10).tolist()
+        assert projected == exp.get_input_frame()
+        assert exp.get_stats()["current_char"] == "HALF_BOT"
@@ -10,6 +10,7 @@ Validates:
 - total_dendritas and total_sinapsis correct
 - Effective weights clamped to [-1, 1]
 - Source neuron in multiple dendrites: weights summed
+- Weight grids cached until learning changes the neuron's weights
 """
 
 import random
@@ -178,3 +179,47 @@ class TestInspect:
         grid = result["weight_grid"]
 
         assert grid[0][0] == pytest.approx(0.3, abs=1e-9)
+
+
+class TestInspectCache:
+    """inspect() reuses weight grids until the neuron's weights change."""
+
+    def _learning_config(self) -> dict:
+        cfg = _nested_config()
+        cfg["input"] = {"text": "AB", "resolution": 6}
+        cfg["learning"] = {"rate": 0.5}
+        return cfg
+
+    def test_repeated_inspect_reuses_grids(self) -> None:
+        exp = Experiment()
+        exp.setup(_nested_config())
+
+        first = exp.inspect(5, 5)
+        exp.step()
+        second = exp.inspect(5, 5)
+
+        assert second["weight_grid"] is first["weight_grid"]
+        assert second["activation"] == round(exp.brain_tensor.valores[55].item(), 4)
+
+    def test_learning_invalidates_cache(self) -> None:
+        random.seed(7)
+        exp = Experiment()
+        exp.setup(self._learning_config())
+        exp.brain_tensor.tensiones[55] = 1.0
+
+        before = exp.inspect(5, 5)
+        exp.brain_tensor.learn(lr=0.5)
+        after = exp.inspect(5, 5)
+
+        assert after["input_weight_grid"] is not before["input_weight_grid"]
+        assert after["input_weight_grid"] != before["input_weight_grid"]
+
+    def test_other_neuron_not_served_from_cache(self) -> None:
+        exp = Experiment()
+        exp.setup(_nested_config(width=30, height=30))
+
+        exp.inspect(5, 5)
+        other = exp.inspect(20, 20)
+
+        assert other["weight_grid"][20][20] == 999
+        assert other["weight_grid"][5][5] is None
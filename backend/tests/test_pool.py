@@ -0,0 +1,194 @@
+"""Tests for the pool of pre-built template experiments.
+
+Validates:
+- Each template gets `size` set-up, never-stepped instances
+- A template config takes one whatever its seed, reset to that seed, and
+  ends where a fresh setup would; taking triggers a refill
+- Templates whose topology depends on the seed are not pooled
+- The memory budget (engine tensors included) and template changes bound
+  what stays idle
+- A websocket `start` with a seeded template config uses the pool
+"""
+
+import asyncio
+import copy
+import time
+from typing import Any
+
+import pytest
+import torch
+
+import api.pool as pool
+import api.routes as routes
+from api.pool import ExperimentPool, _config_key, _experiment_bytes
+from api.websocket import ExperimentSession
+from experiments.experiment import Experiment
+
+
+def _template(template_id: str, width: int, **extra: object) -> dict:
+    return {
+        "id": template_id,
+        "name": template_id,
+        "description": "",
+        "config": {
+            "grid": {"width": width, "height": 10},
+            "wiring": {"mask": "simple", "process_mode": "min_vs_max"},
+            **extra,
+        },
+    }
+
+
+def _fresh(config: dict) -> Experiment:
+    exp = Experiment()
+    exp.setup(config)
+    return exp
+
+
+def _assert_same_run(a: Experiment, b: Experiment) -> None:
+    for exp in (a, b):
+        exp.step_n(4)
+    for name in ("valores", "pesos_sinapsis", "indices_fuente"):
+        assert torch.equal(getattr(a.brain_tensor, name), getattr(b.brain_tensor, name)), name
+
+
+@pytest.fixture
+def templates(monkeypatch) -> list[dict]:
+    templates = [_template("small", 10), _template("wide", 16)]
+    monkeypatch.setattr(routes, "TEMPLATES", templates)
+    return templates
+
+
+class _WebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        self.sent.append(data)
+
+
+class TestPool:
+    """Fill, take, refill."""
+
+    def test_fill_and_take(self, templates) -> None:
+        p = ExperimentPool(2)
+        p.fill()
+        assert p.stats()["idle"] == 4
+        config = copy.deepcopy(templates[1]["config"])
+        exp = p.take(config)
+        assert exp is not None
+        assert exp.generation == 0
+        assert exp.width == 16
+        assert exp._config == config
+        # Key order and seed do not matter, the rest does
+        reordered = {k: config[k] for k in reversed(config)}
+        assert _config_key(reordered) == _config_key({**config, "seed": 4})
+        assert p.take({**config, "grid": {"width": 16, "height": 11}}) is None
+        stats = p.stats()
+        assert (stats["idle"], stats["hits"], stats["misses"]) == (3, 1, 1)
+        p.fill()
+        assert p.stats()["idle"] == 4
+        p.close()
+        assert p.stats()["idle"] == 0
+
+    def test_background_refill(self, templates) -> None:
+        p = ExperimentPool(1)
+        p.start()
+        deadline = time.monotonic() + 60
+        while p.stats()["idle"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert p.take(templates[0]["config"]) is not None
+        while p.stats()["idle"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert p.stats()["idle"] == 2
+        p.close()
+
+    def test_memory_budget(self, templates) -> None:
+        p = ExperimentPool(3)
+        p.fill()
+        per_instance = max(nbytes for queue in p._idle.values() for _, nbytes in queue)
+        p.close()
+        limited = ExperimentPool(3, max_bytes=2 * per_instance)
+        limited.fill()
+        assert limited.stats()["idle"] == 2
+        assert limited.stats()["bytes"] <= 2 * per_instance
+        limited.close()
+
+    def test_changed_templates_are_discarded(self, templates, monkeypatch) -> None:
+        p = ExperimentPool(1)
+        p.fill()
+        old = p._idle[_config_key(templates[0]["config"])][0][0]
+        monkeypatch.setattr(routes, "TEMPLATES", [_template("small", 12)])
+        p.fill()
+        assert p.stats()["idle"] == 1
+        assert p.take(templates[0]["config"]) is None
+        assert old.width == 10
+        p.close()
+
+    def test_bytes_exclude_shared_topology(self, templates) -> None:
+        p = ExperimentPool(1)
+        p.fill()
+        exp = p.take(templates[0]["config"])
+        bt = exp.brain_tensor
+        assert 0 < _experiment_bytes(exp) < sum(
+            t.untyped_storage().nbytes() for t in vars(bt).values() if hasattr(t, "untyped_storage")
+        )
+        p.close()
+
+    def test_bytes_include_engine_tensors(self) -> None:
+        config = _template("t", 10)["config"]
+        plain, tiled = _fresh(config), _fresh({**config, "tiling": {"steps": 2}})
+        remapped = sum(t.bt.indices_fuente.untyped_storage().nbytes() for t in tiled._tiled_engine.tiles)
+        assert _experiment_bytes(tiled) >= _experiment_bytes(plain) + remapped
+
+    def test_seeded_take_replays_setup(self, monkeypatch) -> None:
+        template = _template(
+            "input", 10,
+            input={"resolution": 4, "text": "AB"}, noise={"background": 0.1}, learning={"rate": 0.1},
+        )
+        monkeypatch.setattr(routes, "TEMPLATES", [template])
+        p = ExperimentPool(1)
+        p.fill()
+        seeded = {**template["config"], "seed": 12345}
+        exp = p.take(seeded)
+        assert exp is not None
+        assert exp.seed == 12345
+        _assert_same_run(exp, _fresh(seeded))
+        p.close()
+
+    def test_seed_shaped_topology_is_not_pooled(self, monkeypatch) -> None:
+        template = _template("sampled", 10, input={"resolution": 4, "text": "AB", "density": 0.5})
+        monkeypatch.setattr(routes, "TEMPLATES", [template])
+        p = ExperimentPool(1)
+        p.fill()
+        assert p.stats()["idle"] == 0
+        assert p.take({**template["config"], "seed": 1}) is None
+        p.close()
+
+
+class TestStart:
+    """The websocket takes pooled experiments."""
+
+    def test_start_uses_the_pool(self, templates, monkeypatch) -> None:
+        p = ExperimentPool(1)
+        p.fill()
+        monkeypatch.setattr(pool, "_pool", p)
+
+        async def run(config: dict) -> ExperimentSession:
+            session = ExperimentSession(_WebSocket())  # type: ignore[arg-type]
+            await session.handle_message({"action": "start", "config": config})
+            await asyncio.sleep(0.05)
+            session.cleanup()
+            return session
+
+        pooled = p._idle[_config_key(templates[0]["config"])][0][0]
+        # The frontend adds a random seed to every start
+        seeded = {**copy.deepcopy(templates[0]["config"]), "seed": 987}
+        session = asyncio.run(run(seeded))
+        assert session.experiment is pooled
+        assert session.experiment.seed == 987
+        _assert_same_run(session.experiment, _fresh(seeded))
+        edited = {**templates[0]["config"], "grid": {"width": 8, "height": 8}}
+        session = asyncio.run(run(edited))
+        assert session.experiment.width == 8
+        assert p.stats()["hits"] == 1
+        p.close()
@@ -0,0 +1,93 @@
+"""Tests for cached REST responses.
+
+Validates:
+- /api/health reports the engine state
+- /api/metadata is computed once and honours If-None-Match
+- Wiring preview keys ignore dict key order
+- /api/preview-wiring serves repeated wirings from the LRU
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import api.routes as routes
+from api.engine import engine_state, load_engine
+from core.masks import preview_deamon_wiring
+from experiments.experiment import Experiment
+
+
+class _FakeRequest:
+    """Minimal Request stand-in with headers and a JSON body."""
+
+    def __init__(self, body: Any = None, headers: dict[str, str] | None = None) -> None:
+        self._body = body
+        self.headers = headers or {}
+
+    async def json(self) -> Any:
+        return self._body
+
+
+def _wiring(exc_offset: int = 1) -> dict:
+    return {
+        "shape": "square",
+        "excitatory": {"offset": exc_offset, "weights": [1.0, 0.5]},
+        "gap": {"offset": 1, "size": 1},
+        "inhibitory": {"offset": 5, "weights": [0.8], "sectors": 8},
+    }
+
+
+class TestHealth:
+    """Health answers without the compute stack and reports its state."""
+
+    def test_health_reports_warm_engine(self) -> None:
+        assert load_engine() is Experiment
+        assert engine_state() == "warm"
+        health = asyncio.run(routes.health())
+        assert health == {"status": "ok", "version": "0.2.0", "engine": "warm"}
+
+
+class TestMetadata:
+    """Memoized metadata with an ETag."""
+
+    def test_metadata_payload_is_memoized(self) -> None:
+        assert routes._metadata_payload() is routes._metadata_payload()
+
+    def test_etag_revalidation(self) -> None:
+        first = asyncio.run(routes.get_metadata(_FakeRequest()))  # type: ignore[arg-type]
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert len(json.loads(first.body)["masks"]) == 49
+
+        again = asyncio.run(
+            routes.get_metadata(_FakeRequest(headers={"if-none-match": etag}))  # type: ignore[arg-type]
+        )
+        assert again.status_code == 304
+        assert again.body == b""
+
+
+class TestPreviewCache:
+    """LRU of inline wiring previews."""
+
+    def test_key_ignores_key_order(self) -> None:
+        wiring = _wiring()
+        reordered = dict(reversed(list(wiring.items())))
+        assert routes._wiring_key(wiring) == routes._wiring_key(reordered)
+        assert routes._wiring_key(wiring) != routes._wiring_key(_wiring(exc_offset=2))
+
+    def test_repeated_preview_is_served_from_cache(self) -> None:
+        routes._preview_cache.clear()
+        request = _FakeRequest(_wiring())
+        first = asyncio.run(routes.preview_wiring(request))  # type: ignore[arg-type]
+        second = asyncio.run(routes.preview_wiring(request))  # type: ignore[arg-type]
+        assert second.body == first.body
+        assert len(routes._preview_cache) == 1
+        assert json.loads(first.body)["mask_stats"] == preview_deamon_wiring(_wiring())["mask_stats"]
+
+    def test_cache_is_bounded(self, monkeypatch) -> None:
+        routes._preview_cache.clear()
+        monkeypatch.setattr(routes, "_PREVIEW_CACHE_SIZE", 2)
+        for offset in (1, 2, 3):
+            routes._preview_payload(_wiring(exc_offset=offset))
+        assert len(routes._preview_cache) == 2
+        assert routes._wiring_key(_wiring(exc_offset=1)) not in routes._preview_cache
@@ -0,0 +1,80 @@
+"""Tests for the cross-session tick scheduler.
+
+Validates:
+- Ticks of sessions with the same batch key within a quantum run as one batch,
+  with the same result as stepping each session alone
+- Other ticks run alone in the same flush; cancelled ticks are dropped
+- No tick waits much longer than one quantum
+"""
+
+import asyncio
+import time
+
+import torch
+
+from api.scheduler import BatchScheduler
+from experiments.experiment import Experiment
+
+
+def _experiment(seed: int, width: int = 12) -> Experiment:
+    exp = Experiment()
+    exp.setup({
+        "seed": seed,
+        "grid": {"width": width, "height": 10},
+        "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"},
+        "learning": {"rate": 0.1},
+    })
+    return exp
+
+
+class TestScheduler:
+    """Grouping and fairness."""
+
+    def test_same_template_ticks_are_batched(self) -> None:
+        scheduler = BatchScheduler(0.01)
+        sessions = [_experiment(seed) for seed in (1, 2, 3)]
+        other = _experiment(4, width=10)
+
+        async def run() -> list[tuple[dict, float]]:
+            return await asyncio.gather(
+                *(scheduler.step_n(exp, 3) for exp in sessions), scheduler.step_n(other, 3),
+            )
+
+        results = asyncio.run(run())
+        assert scheduler.flushes == 1
+        assert scheduler.batched_ticks == 3
+        assert all(elapsed > 0 for _, elapsed in results)
+        assert [exp.generation for exp in (*sessions, other)] == [3, 3, 3, 3]
+        for seed, exp in zip((1, 2, 3), sessions):
+            alone = _experiment(seed)
+            alone.step_n(3)
+            assert torch.equal(alone.brain_tensor.valores, exp.brain_tensor.valores)
+            assert torch.equal(alone.brain_tensor.pesos_sinapsis, exp.brain_tensor.pesos_sinapsis)
+
+    def test_cancelled_ticks_are_dropped(self) -> None:
+        scheduler = BatchScheduler(0.01)
+        kept, dropped = _experiment(1), _experiment(2)
+
+        async def run() -> None:
+            task = asyncio.create_task(scheduler.step_n(dropped, 2))
+            await asyncio.sleep(0)
+            task.cancel()
+            await scheduler.step_n(kept, 2)
+
+        asyncio.run(run())
+        assert (kept.generation, dropped.generation) == (2, 0)
+        assert scheduler.batched_ticks == 0
+
+    def test_tick_waits_at_most_one_quantum(self) -> None:
+        quantum = 0.05
+        scheduler = BatchScheduler(quantum)
+        exp = _experiment(1)
+
+        async def run() -> float:
+            await scheduler.step_n(exp, 1)  # warm up
+            t0 = time.perf_counter()
+            _, elapsed = await scheduler.step_n(exp, 1)
+            return time.perf_counter() - t0 - elapsed
+
+        waited = asyncio.run(run())
+        assert waited < 2 * quantum
@@ -0,0 +1,122 @@
+"""Tests for temporal tiling of bulk steps.
+
+Validates:
+- Ghost zones reach k-1 mask radii around each tile, and are never taller
+  than the tile; non-wrapping tiles view the global weights
+- run(n) matches the fused step exactly for any k and tile height,
+  with input and adaptation; metrics per step
+- It is only used without learning, and follows update_config
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.tiled_engine import TiledEngine
+from experiments.experiment import Experiment
+
+_STATE = ("valores", "tensiones", "active_counts", "refractory_remaining")
+
+
+def _config(**extra: object) -> dict:
+    return {
+        "seed": 13,
+        "grid": {"width": 20, "height": 40},
+        "wiring": {"mask": "narrow_hat", "process_mode": "min_vs_max"},  # radius 3
+        "input": {"resolution": 5, "text": "AB", "density": 0.5},
+        "spiking": {"up_ticks": 3, "down_ticks": 2},
+        **extra,
+    }
+
+
+def _assert_same(a: Experiment, b: Experiment) -> None:
+    for name in _STATE:
+        assert torch.equal(getattr(a.brain_tensor, name), getattr(b.brain_tensor, name)), name
+
+
+class TestTiles:
+    """Tile geometry."""
+
+    def test_ghost_zone_depth(self) -> None:
+        exp = Experiment()
+        exp.setup({"seed": 1, "grid": {"width": 40, "height": 120},
+                   "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"}})
+        radius = max(abs(dy) for d in exp._lateral_mask() for _, dy in d["offsets"])
+        engine = TiledEngine(exp.brain_tensor, 40, 120, pasos=2, filas=30)
+        assert len(engine.tiles) == 4
+        tile = engine.tiles[2]  # rows 60..89
+        rows = sorted({int(i) // 40 for i in tile.celdas[:tile.n_calculadas]})
+        assert rows == list(range(60 - radius, 90 + radius))
+
+    @pytest.mark.parametrize("steps, height", [(2, 120), (4, 60)])
+    def test_large_radius_mask_stays_bounded(self, steps: int, height: int) -> None:
+        exp = Experiment()
+        exp.setup({"seed": 1, "grid": {"width": 30, "height": height},
+                   "wiring": {"mask": "deamon_3_en_50", "process_mode": "min_vs_max"}})
+        bt = exp.brain_tensor
+        engine = TiledEngine(bt, 30, height, pasos=steps, filas=1)  # radius 15
+        assert engine.filas >= min(height, 2 * (steps - 1) * 15)
+        assert engine.celdas_calculadas() / engine.n_tissue <= 2
+        assert any(t.bt.pesos_sinapsis.data_ptr() == bt.pesos_sinapsis.data_ptr()
+                   or t.bt.pesos_sinapsis._base is bt.pesos_sinapsis for t in engine.tiles)
+
+    def test_single_step_has_no_ghost_zone(self) -> None:
+        exp = Experiment()
+        exp.setup(_config())
+        engine = TiledEngine(exp.brain_tensor, 20, 40, pasos=1, filas=6)
+        assert len(engine.tiles) == 6
+        assert engine.celdas_calculadas() == 20 * 40
+
+
+class TestEquivalence:
+    """Same result as the fused step."""
+
+    @pytest.mark.parametrize(("steps", "rows", "tiles"), [(1, 4, 10), (3, 5, 3), (4, 1, 2), (6, 18, 1)])
+    def test_run_matches_fused(self, steps: int, rows: int, tiles: int) -> None:
+        ref, tiled = Experiment(), Experiment()
+        ref.setup(_config())
+        tiled.setup(_config(tiling={"steps": steps, "rows": rows, "threads": 3}))
+        assert isinstance(tiled._tiled_engine, TiledEngine)
+        assert len(tiled._tiled_engine.tiles) == tiles
+        ref_metrics = ref.run(23, metrics=True)
+        tiled_metrics = tiled.run(23, metrics=True)
+        _assert_same(ref, tiled)
+        assert torch.equal(ref_metrics[:, 0], tiled_metrics[:, 0])
+        assert torch.allclose(ref_metrics[:, 1], tiled_metrics[:, 1], atol=1e-5)
+
+    def test_paint_between_runs(self) -> None:
+        ref, tiled = Experiment(), Experiment()
+        ref.setup(_config())
+        tiled.setup(_config(tiling={"steps": 4, "rows": 3}))
+        for exp in (ref, tiled):
+            exp.run(5)
+            exp.set_cell(2, 2, 1.0)
+            exp.step_n(7)
+        _assert_same(ref, tiled)
+
+
+class TestSelection:
+    """When the engine is used."""
+
+    def test_not_with_learning(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(tiling={"steps": 4}, learning={"rate": 0.1}))
+        assert exp._tiled_engine is None
+        exp.update_config({**exp._config, "learning": None})
+        assert exp._tiled_engine is not None
+
+    def test_update_config(self) -> None:
+        ref, tiled = Experiment(), Experiment()
+        ref.setup(_config())
+        tiled.setup(_config(tiling={"steps": 4, "rows": 3}))
+        old = tiled._tiled_engine
+        for exp in (ref, tiled):
+            exp.run(6)
+            exp.update_config({**exp._config, "spiking": {"up_ticks": 2, "down_ticks": 4}})
+        assert tiled._tiled_engine is not old
+        for exp in (ref, tiled):
+            exp.run(9)
+        _assert_same(ref, tiled)
+        tiled.update_config({**tiled._config, "tiling": None})
+        assert tiled._tiled_engine is None
@@ -0,0 +1,196 @@
+"""Tests for the process-wide shared topology registry.
+
+Validates:
+- Experiments with the same connectivity share its tensors, not their state
+- Topology-derived step constants (learning rates per synapse, dendrite
+  counts) are shared per learning rates
+- Shared tensors are copy-on-write: a dendrite weight change detaches one network
+- Different connectivity gets its own entry; entries go away with their networks
+- With a directory, topologies are published once, mapped by every process,
+  and removed when no live process holds a lease (never while being published)
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+import core.topology_registry as topology_registry
+from core.topology_registry import (
+    CAMPOS_TOPOLOGIA,
+    configurar_directorio,
+    es_compartido,
+    estadisticas_topologias,
+)
+from experiments.experiment import Experiment
+
+_BACKEND = Path(__file__).resolve().parent.parent
+_TEMPLATE = _BACKEND / "configs" / "ascii_som.json"
+
+
+def _config(seed: int) -> dict:
+    # The template's wiring and input on a smaller grid
+    return {**json.loads(_TEMPLATE.read_text())["config"], "seed": seed, "grid": {"width": 24, "height": 24}}
+
+
+def _experiment(config: dict) -> Experiment:
+    exp = Experiment()
+    exp.setup(config)
+    return exp
+
+
+class TestSharing:
+    """Same template, several sessions."""
+
+    def test_topology_is_shared_state_is_not(self) -> None:
+        a, b = _experiment(_config(1)), _experiment(_config(2))
+        assert a.brain_tensor.topologia == b.brain_tensor.topologia
+        for name in CAMPOS_TOPOLOGIA:
+            assert getattr(a.brain_tensor, name) is getattr(b.brain_tensor, name), name
+        for name in ("valores", "pesos_sinapsis", "tensiones", "active_counts"):
+            assert getattr(a.brain_tensor, name) is not getattr(b.brain_tensor, name), name
+
+    def test_sessions_step_independently(self) -> None:
+        a, b = _experiment(_config(1)), _experiment(_config(1))
+        a.step_n(10)
+        b.step_n(3)
+        b.click(4, 4)
+        a.step_n(5)
+        b.step_n(7)
+        # Interleaved with a, b ends where a session alone would
+        alone = _experiment(_config(1))
+        alone.step_n(3)
+        alone.click(4, 4)
+        alone.step_n(7)
+        assert torch.equal(b.brain_tensor.valores, alone.brain_tensor.valores)
+        assert torch.equal(b.brain_tensor.pesos_sinapsis, alone.brain_tensor.pesos_sinapsis)
+
+    def test_step_constants_are_shared(self) -> None:
+        a, b = _experiment(_config(1)), _experiment(_config(2))
+        other_lr = _experiment({**_config(3), "learning": {**_config(3)["learning"], "rate": 0.5}})
+        step_a, step_b = a._fused_step, b._fused_step
+        assert step_a._coef_lr is not None
+        assert step_a._coef_lr is step_b._coef_lr
+        assert step_a._conteos is step_b._conteos
+        assert other_lr._fused_step._coef_lr is not step_a._coef_lr
+        assert other_lr._fused_step._conteos is step_a._conteos
+
+    def test_dendrite_weight_change_is_copy_on_write(self) -> None:
+        a, b = _experiment(_config(1)), _experiment(_config(1))
+        shared = b.brain_tensor.pesos_dendrita.clone()
+        wiring = {**a._config["wiring"], "dendrite_exc_weight": 0.5}
+        a.update_config({**a._config, "wiring": wiring})
+        assert not es_compartido(a.brain_tensor, "pesos_dendrita")
+        assert es_compartido(a.brain_tensor, "indices_fuente")
+        assert es_compartido(b.brain_tensor, "pesos_dendrita")
+        assert torch.equal(b.brain_tensor.pesos_dendrita, shared)
+
+
+class TestLifetime:
+    """Reference counting."""
+
+    def test_entries_follow_their_networks(self) -> None:
+        gc.collect()
+        before = estadisticas_topologias()
+        a, b = _experiment(_config(1)), _experiment(_config(1))
+        other = _experiment({**_config(1), "grid": {"width": 20, "height": 20}})
+        during = estadisticas_topologias()
+        assert during["topologies"] == before["topologies"] + 2
+        assert during["references"] == before["references"] + 3
+        del a, b, other
+        gc.collect()
+        assert estadisticas_topologias() == before
+
+
+@pytest.fixture
+def directory(tmp_path: Path):
+    gc.collect()  # no earlier networks left to keep entries registered in memory
+    configurar_directorio(tmp_path)
+    yield tmp_path
+    configurar_directorio(None)
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+class TestDirectory:
+    """Topologies shared between processes through files."""
+
+    def test_published_and_mapped(self, directory: Path) -> None:
+        configurar_directorio(None)
+        alone = _experiment(_config(1))
+        compiled = {name: getattr(alone.brain_tensor, name).clone() for name in CAMPOS_TOPOLOGIA}
+        del alone
+        gc.collect()
+        configurar_directorio(directory)
+
+        a, b = _experiment(_config(1)), _experiment(_config(2))
+        key = a.brain_tensor.topologia
+        assert b.brain_tensor.topologia == key
+        assert (directory / key / "meta.json").is_file()
+        assert [p.name for p in (directory / key / "leases").iterdir()] == [str(os.getpid())]
+        assert estadisticas_topologias()["mapped"] == 1
+        for name in CAMPOS_TOPOLOGIA:
+            assert es_compartido(a.brain_tensor, name), name
+            assert torch.equal(getattr(a.brain_tensor, name), compiled[name]), name
+        a.step_n(5)
+
+    def test_second_process_attaches(self, directory: Path) -> None:
+        a = _experiment(_config(1))
+        key = a.brain_tensor.topologia
+        written = {p.name: p.stat().st_mtime_ns for p in (directory / key).glob("*.bin")}
+        script = (
+            "import json, sys\n"
+            "from core.topology_registry import configurar_directorio, estadisticas_topologias\n"
+            "from experiments.experiment import Experiment\n"
+            f"configurar_directorio({str(directory)!r})\n"
+            "exp = Experiment()\n"
+            f"exp.setup(json.loads({json.dumps(json.dumps(_config(5)))}))\n"
+            "print(exp.brain_tensor.topologia, estadisticas_topologias()['mapped'])\n"
+        )
+        out = subprocess.run([sys.executable, "-c", script], cwd=_BACKEND, capture_output=True, text=True, check=True)
+        assert out.stdout.split() == [key, "1"]
+        assert {p.name: p.stat().st_mtime_ns for p in (directory / key).glob("*.bin")} == written
+        # The child exited: its lease goes with the next sweep, ours stays
+        configurar_directorio(directory)
+        assert [p.name for p in (directory / key / "leases").iterdir()] == [str(os.getpid())]
+
+    def test_sweep_right_after_publishing_keeps_it(self, directory: Path, monkeypatch) -> None:
+        rename = os.rename
+
+        def rename_then_sweep(src, dst) -> None:
+            rename(src, dst)
+            topology_registry._barrer(directory)  # a worker restarting in between
+
+        monkeypatch.setattr(topology_registry.os, "rename", rename_then_sweep)
+        a = _experiment(_config(1))
+        key = a.brain_tensor.topologia
+        assert (directory / key / "meta.json").is_file()
+        assert estadisticas_topologias()["mapped"] == 1
+
+    def test_leftovers_of_dead_workers_are_swept(self, directory: Path) -> None:
+        dead = str(_dead_pid())
+        (directory / "orphan" / "leases").mkdir(parents=True)
+        (directory / "orphan" / "leases" / dead).touch()
+        (directory / f".half.{dead}.1.tmp").mkdir()
+        configurar_directorio(directory)
+        assert list(directory.iterdir()) == []
+
+    def test_removed_with_the_last_network(self, directory: Path) -> None:
+        a = _experiment(_config(1))
+        key = a.brain_tensor.topologia
+        assert (directory / key).is_dir()
+        a.close()
+        del a
+        gc.collect()
+        assert not (directory / key).exists()
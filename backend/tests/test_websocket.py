@@ -0,0 +1,92 @@
+"""Tests for ExperimentSession frame delivery.
+
+Validates:
+- A slow client does not slow down stepping
+- Only the newest frame is delivered (latest-frame-wins)
+- Skipped frames are counted per session and reported to the client
+"""
+
+import asyncio
+from typing import Any
+
+from api.websocket import ExperimentSession
+
+
+def _nested_config(width: int = 10, height: int = 10) -> dict:
+    return {
+        "grid": {"width": width, "height": height},
+        "wiring": {"mask": "simple", "process_mode": "min_vs_max"},
+    }
+
+
+class _SlowWebSocket:
+    """Minimal WebSocket stand-in whose send_json takes `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sent: list[dict[str, Any]] = []
+
+    async def send_json(self, data: dict[str, Any]) -> None:
+        await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+
+def _frames(ws: _SlowWebSocket) -> list[dict[str, Any]]:
+    return [m for m in ws.sent if m["type"] == "frame"]
+
+
+class TestFrameDelivery:
+    """Simulation is decoupled from delivery to the client."""
+
+    def test_start_delivers_initial_frame(self) -> None:
+        async def run() -> _SlowWebSocket:
+            ws = _SlowWebSocket()
+            session = ExperimentSession(ws)  # type: ignore[arg-type]
+            await session.handle_message({"action": "start", "config": _nested_config()})
+            await asyncio.sleep(0.05)
+            session.cleanup()
+            return ws
+
+        ws = asyncio.run(run())
+        frames = _frames(ws)
+        assert len(frames) == 1
+        assert frames[0]["generation"] == 0
+        assert frames[0]["delivery"] == {"frames_sent": 1, "frames_skipped": 0}
+
+    def test_slow_client_does_not_block_stepping(self) -> None:
+        async def run() -> tuple[ExperimentSession, _SlowWebSocket]:
+            ws = _SlowWebSocket(delay=0.1)
+            session = ExperimentSession(ws)  # type: ignore[arg-type]
+            await session.handle_message({"action": "start", "config": _nested_config()})
+            await session.handle_message({"action": "play", "fps": 200})
+            await asyncio.sleep(0.5)
+            await session.handle_message({"action": "pause"})
+            await asyncio.sleep(0.3)
+            session.cleanup()
+            return session, ws
+
+        session, ws = asyncio.run(run())
+        frames = _frames(ws)
+        # Stepping ran far ahead of what a 100 ms/frame client can receive
+        assert session.experiment.generation > 2 * len(frames)
+        assert session.frames_skipped > 0
+        assert session.frames_sent == len(frames)
+        # The last delivered frame is the newest state
+        assert frames[-1]["generation"] == session.experiment.generation
+        assert frames[-1]["delivery"]["frames_skipped"] == session.frames_skipped
+
+    def test_step_frames_not_skipped_with_fast_client(self) -> None:
+        async def run() -> tuple[ExperimentSession, _SlowWebSocket]:
+            ws = _SlowWebSocket()
+            session = ExperimentSession(ws)  # type: ignore[arg-type]
+            await session.handle_message({"action": "start", "config": _nested_config()})
+            for _ in range(3):
+                await asyncio.sleep(0.01)
+                await session.handle_message({"action": "step"})
+            await asyncio.sleep(0.05)
+            session.cleanup()
+            return session, ws
+
+        session, ws = asyncio.run(run())
+        assert [f["generation"] for f in _frames(ws)] == [0, 1, 2, 3]
+        assert session.frames_skipped == 0
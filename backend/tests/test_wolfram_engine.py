@@ -0,0 +1,124 @@
+"""Tests for the bit-parallel Wolfram engine.
+
+Validates:
+- Packed rows step like an elementary CA (toroidal wrap, any width)
+- Steps match BrainTensor.procesar for every process mode (values and tensions)
+- Large grids run on the engine alone: frames, stats, click, paint, step_n
+- Adaptation or learning fall back to the network
+"""
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from core.masks import get_mask
+from core.wolfram_engine import WolframEngine
+from experiments.experiment import Experiment
+
+
+def _config(width: int, height: int, mask: str = "rule_110", **extra: object) -> dict:
+    return {
+        "seed": 3,
+        "grid": {"width": width, "height": height},
+        "wiring": {"mask": mask, "process_mode": extra.pop("process_mode", "min_vs_max")},
+        **extra,
+    }
+
+
+def _ca_step(row: list[int], rule: int) -> list[int]:
+    w = len(row)
+    return [(rule >> (4 * row[(x - 1) % w] + 2 * row[x] + row[(x + 1) % w])) & 1 for x in range(w)]
+
+
+class TestEngine:
+    """The packed rows alone."""
+
+    @pytest.mark.parametrize("width", [5, 64, 100, 130])
+    @pytest.mark.parametrize("rule", [30, 110])
+    def test_matches_elementary_ca(self, width: int, rule: int) -> None:
+        engine = WolframEngine.compilar(get_mask(f"rule_{rule}"), "min_vs_max", [], 0.99, width, 2)
+        bottom = [(x * 7919) % 3 == 0 for x in range(width)]
+        for x, on in enumerate(bottom):
+            engine.set_valor(width + x, float(on))
+        engine.avanzar()
+        top = engine.valores()[:width].int().tolist()
+        assert top == _ca_step([int(b) for b in bottom], rule)
+
+    def test_rejects_other_offsets(self) -> None:
+        assert WolframEngine.compilar(get_mask("simple"), "min_vs_max", [], 0.99, 8, 8) is None
+
+
+class TestEquivalence:
+    """Same dynamics as the gather path."""
+
+    @pytest.mark.parametrize("process_mode", ["min_vs_max", "sum", "avg_vs_avg", "avg_vs_avg_normalized"])
+    @pytest.mark.parametrize("mask", ["rule_30", "rule_110"])
+    def test_matches_procesar(self, mask: str, process_mode: str) -> None:
+        config = _config(70, 12, mask, process_mode=process_mode)
+        fast, ref = Experiment(), Experiment()
+        fast.setup(config)
+        ref.setup(config)
+        assert fast._wolfram_engine is not None
+        ref._wolfram_engine = None
+        start = (torch.rand(70 * 12, generator=torch.Generator().manual_seed(0)) > 0.5).float()
+        fast.brain_tensor.valores[:] = start
+        ref.brain_tensor.valores[:] = start
+        for _ in range(15):
+            fast.step()
+            ref.step()
+            assert torch.equal(fast.brain_tensor.valores, ref.brain_tensor.valores)
+            assert torch.allclose(fast.brain_tensor.tensiones, ref.brain_tensor.tensiones)
+
+    def test_non_binary_paint_falls_back(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(9, 5))
+        exp.set_cell(4, 2, 0.5)
+        exp.step()
+        assert torch.equal(exp.brain_tensor.valores, exp.brain_tensor.valores.round())
+
+
+class TestEngineOnly:
+    """Grids above the network limit have no compiled network."""
+
+    def test_frames_and_steps(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(200, 100))
+        assert exp.brain_tensor is None
+        frame = exp.get_frame()
+        assert len(frame) == 100 and len(frame[0]) == 200
+        assert frame[99][100] == 1.0
+        result = exp.step_n(3)
+        assert result["generation"] == 3
+        assert exp.get_frame()[96][97:104] == [1.0, 1.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+        assert exp.get_stats()["active_cells"] == 1 + 2 + 3 + 3
+
+    def test_matches_network_run(self) -> None:
+        big, small = Experiment(), Experiment()
+        big.setup(_config(200, 100, "rule_30"))
+        small.setup(_config(200, 100, "rule_30", spiking={"up_ticks": 1000, "down_ticks": 1}))
+        assert small.brain_tensor is not None and small._wolfram_engine is None
+        for _ in range(5):
+            big.step()
+            small.step()
+        assert big.get_frame() == small.get_frame()
+        assert big.get_tension_frame() == small.get_tension_frame()
+
+    def test_click_and_paint(self) -> None:
+        exp = Experiment()
+        exp.setup(_config(200, 100))
+        exp.click(3, 4)
+        exp.set_cell(5, 4, 1.0)
+        assert exp.get_frame()[4][3:6] == [1.0, 0.0, 1.0]
+        exp.click(3, 4)
+        assert exp.get_frame()[4][3] == 0.0
+
+    def test_stateful_update_restarts_with_network(self) -> None:
+        exp = Experiment()
+        config = _config(200, 100)
+        exp.setup(config)
+        exp.step()
+        assert exp.update_config({**config, "spiking": {"up_ticks": 3}}) is False
+        assert exp.brain_tensor is not None
+        assert exp._wolfram_engine is None
+        assert exp.generation == 0
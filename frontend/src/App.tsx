@@ -20,6 +20,30 @@ const DEFAULT_CONFIG: ExperimentConfig = {
   },
 };
 
+interface HistoryPage {
+  configs: ExperimentConfig[];
+  /** Cursor for the next (older) page, null on the oldest one. */
+  nextBefore: number | null;
+}
+
+/** One page of executed configs of a template, oldest first (the newest page when before is null). */
+async function fetchHistoryPage(templateId: string, before: number | null): Promise<HistoryPage> {
+  const url = `${API_URL}/api/templates/${templateId}/config/history?preset=_default`;
+  const r = await fetch(before === null ? url : `${url}&before=${before}`);
+  const data: { history: { config: ExperimentConfig }[]; next_before: number | null } = await r.json();
+  return { configs: data.history.map((h) => h.config), nextBefore: data.next_before };
+}
+
+/** Fresh 31-bit seed (survives the JSON round trip to the backend). */
+function randomSeed(): number {
+  return Math.floor(Math.random() * 2 ** 31);
+}
+
+/** Pin a seed on configs without one, so the saved run can be replayed exactly. */
+function withSeed(cfg: ExperimentConfig): ExperimentConfig {
+  return cfg.seed !== undefined ? cfg : { ...cfg, seed: randomSeed() };
+}
+
 const SIDEBAR_DEFAULT = 380;
 const SIDEBAR_MIN = 280;
 const SIDEBAR_MAX = 700;
@@ -36,20 +60,22 @@ function App() {
   // ── Execution history ──
   const [runHistory, setRunHistory] = useState<ExperimentConfig[]>([]);
   const [runIndex, setRunIndex] = useState(-1);
+  // Older runs are fetched a page at a time when navigation reaches the oldest loaded one
+  const [historyCursor, setHistoryCursor] = useState<number | null>(null);
+  const loadingOlderRef = useRef(false);
 
-  const canGoPrev = runIndex > 0;
+  const canGoPrev = runIndex > 0 || (runIndex === 0 && historyCursor !== null);
   const canGoNext = runIndex >= 0 && runIndex < runHistory.length - 1;
 
   const selectedTemplateRef = useRef(selectedTemplate);
   selectedTemplateRef.current = selectedTemplate;
 
   const loadHistory = useCallback((templateId: string) => {
-    fetch(`${API_URL}/api/templates/${templateId}/config/history?preset=_default`)
-      .then((r) => r.json())
-      .then((data: { history: { config: ExperimentConfig }[] }) => {
+    fetchHistoryPage(templateId, null)
+      .then(({ configs, nextBefore }) => {
         if (selectedTemplateRef.current !== templateId) return;
-        const configs = data.history.map((h) => h.config);
         setRunHistory(configs);
+        setHistoryCursor(nextBefore);
         if (configs.length > 0) {
           setRunIndex(configs.length - 1);
           setConfig(configs[configs.length - 1]);
@@ -80,13 +106,31 @@ function App() {
   );
 
   const goPrev = useCallback(() => {
+    if (runIndex === 0 && historyCursor !== null) {
+      if (loadingOlderRef.current) return;
+      loadingOlderRef.current = true;
+      const templateId = selectedTemplateRef.current;
+      fetchHistoryPage(templateId, historyCursor)
+        .then(({ configs, nextBefore }) => {
+          if (selectedTemplateRef.current !== templateId || configs.length === 0) return;
+          setRunHistory((prev) => [...configs, ...prev]);
+          setHistoryCursor(nextBefore);
+          setRunIndex(configs.length - 1);
+          setConfig(configs[configs.length - 1]);
+        })
+        .catch(() => {})
+        .finally(() => {
+          loadingOlderRef.current = false;
+        });
+      return;
+    }
     setRunIndex((i) => {
       if (i <= 0) return i;
       const next = i - 1;
       setConfig(runHistory[next]);
       return next;
     });
-  }, [runHistory]);
+  }, [runHistory, runIndex, historyCursor]);
 
   const goNext = useCallback(() => {
     setRunIndex((i) => {
@@ -165,21 +209,12 @@ function App() {
           setConfig(tplData[0].config);
 
           // Load history for first template
-          fetch(`${API_URL}/api/templates/${firstId}/config/history?preset=_default`)
-            .then((r) => r.json())
-            .then((histData: { history: { config: ExperimentConfig }[] }) => {
-              const configs = histData.history.map((h) => h.config);
-              setRunHistory(configs);
-              if (configs.length > 0) {
-                setRunIndex(configs.length - 1);
-                setConfig(configs[configs.length - 1]);
-              }
-            })
-            .catch(() => {});
+          selectedTemplateRef.current = firstId;
+          loadHistory(firstId);
         }
       })
       .catch(() => {});
-  }, []);
+  }, [loadHistory]);
 
   const hasGrid = grid.length > 0;
 
@@ -222,16 +257,30 @@ function App() {
     [templates, loadHistory],
   );
 
+  // The seed is kept in the config, so re-running it replays the same network
+  // (and is not saved again); only "New Seed" draws another one
   const handleStart = useCallback(() => {
-    start(config);
-    saveExecution(selectedTemplate, config);
+    const cfg = withSeed(config);
+    if (cfg !== config) setConfig(cfg);
+    start(cfg);
+    saveExecution(selectedTemplate, cfg);
   }, [start, config, saveExecution, selectedTemplate]);
 
   const handleRefresh = useCallback(() => {
-    reconnect(config);
-    saveExecution(selectedTemplate, config);
+    const cfg = withSeed(config);
+    if (cfg !== config) setConfig(cfg);
+    reconnect(cfg);
+    saveExecution(selectedTemplate, cfg);
   }, [reconnect, config, saveExecution, selectedTemplate]);
 
+  const handleReseed = useCallback(() => {
+    const cfg = { ...config, seed: randomSeed() };
+    setConfig(cfg);
+    if (experimentActive && hasGrid) reconnect(cfg);
+    else start(cfg);
+    saveExecution(selectedTemplate, cfg);
+  }, [config, experimentActive, hasGrid, reconnect, start, saveExecution, selectedTemplate]);
+
   const applyBrush = useCallback(
     (x: number, y: number) => {
       if (inspectMode) return;
@@ -316,6 +365,7 @@ function App() {
         onConfigChange={setConfig}
         onStart={handleStart}
         onRefresh={handleRefresh}
+        onReseed={handleReseed}
         connected={connected}
         experimentActive={experimentActive && hasGrid}
         width={sidebarWidth}
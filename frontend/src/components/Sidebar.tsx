@@ -153,6 +153,7 @@ interface SidebarProps {
   onConfigChange: (config: ExperimentConfig) => void;
   onStart: () => void;
   onRefresh?: () => void;
+  onReseed?: () => void;
   connected: boolean;
   experimentActive?: boolean;
   width?: number;
@@ -175,6 +176,7 @@ export function Sidebar({
   onConfigChange,
   onStart,
   onRefresh,
+  onReseed,
   connected,
   experimentActive,
   width = 380,
@@ -287,6 +289,25 @@ export function Sidebar({
         {isInitializing && <span className="neuro-spinner-sm" />}
         {isInitializing ? "Initializing..." : !connected ? "Connecting..." : experimentActive ? "Refresh Experiment" : "Start Experiment"}
       </button>
+      {onReseed && (
+        <button
+          onClick={onReseed}
+          disabled={!connected || isInitializing}
+          title={config.seed !== undefined ? `Seed ${config.seed}: draw a new one and restart` : "Start with a new seed"}
+          style={{
+            padding: "6px",
+            background: "transparent",
+            color: !connected || isInitializing ? "#444" : "#888",
+            border: "1px solid #2a2a3e",
+            borderRadius: "6px",
+            fontSize: "0.75rem",
+            cursor: !connected || isInitializing ? "not-allowed" : "pointer",
+            transition: "all 0.15s",
+          }}
+        >
+          New Seed
+        </button>
+      )}
 
       {/* Template selector */}
       <div>
@@ -45,6 +45,7 @@ export interface ProcessModeInfo {
 
 export interface ExperimentConfig {
   description?: string;
+  seed?: number;
   grid: { width: number; height: number };
   wiring: {
     mask?: string;
@@ -61,6 +62,9 @@ export interface ExperimentConfig {
     dendrite_input_weight?: number;
     font?: string;
     font_size?: number;
+    path?: string;
+    threshold?: number;
+    image_shape?: [number, number];
   };
   noise?: {
     background?: number;
@@ -74,6 +78,9 @@ export interface ExperimentConfig {
     up_ticks?: number;
     down_ticks?: number;
   };
+  compact?: {
+    weights?: "float32" | "float16" | "bfloat16";
+  };
 }
 
 export interface ConfigTemplate {
@@ -96,12 +103,18 @@ export interface PerfMetrics {
   steps_per_second: number;
 }
 
+export interface DeliveryMetrics {
+  frames_sent: number;
+  frames_skipped: number;
+}
+
 export interface FrameMessage {
   type: "frame";
   generation: number;
   grid: number[][];
   stats: ExperimentStats;
   perf?: PerfMetrics;
+  delivery?: DeliveryMetrics;
   tension_grid?: number[][];
   input_frame?: number[][];
   inspect?: ConnectionsMessage;
@@ -142,6 +155,7 @@ export interface ExperimentStats {
   noise_cells?: number;
   stability?: number;
   exclusion?: number;
+  seed?: number;
   current_char?: string;
   char_index?: number;
   frame_in_char?: number;